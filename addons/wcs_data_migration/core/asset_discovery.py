@@ -11,14 +11,148 @@ Epic: EPIC-003 - Data Migration & Conversion Tools
 """
 
 import logging
+import os
 import re
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from data_structures import AssetRelationship, AssetMapping
+from .path_utils import list_directory_files
 
 logger = logging.getLogger(__name__)
 
+# Texture file extensions, in lookup priority order
+_TEXTURE_EXTENSIONS = ('.dds', '.pcx', '.tga', '.png', '.jpg')
+
+# Material map suffixes, in lookup priority order per material type
+_MATERIAL_SUFFIXES = {
+    'diffuse': ('', '_diffuse', '_d', '_col', '_color'),
+    'normal': ('_normal', '_n', '_nrm', '_bump'),
+    'specular': ('_specular', '_spec', '_s', '_shine'),
+    'glow': ('_glow', '_g', '_emissive', '_emit')
+}
+
+# (material_type, suffix + extension) candidates in priority order
+_MATERIAL_CANDIDATES = tuple(
+    (material_type, f"{suffix}{ext}")
+    for material_type, suffixes in _MATERIAL_SUFFIXES.items()
+    for suffix in suffixes
+    for ext in _TEXTURE_EXTENSIONS
+)
+
+# Texture relationship type by stem suffix ('_' or '-' separated), checked in order
+_TEXTURE_TYPE_RULES = (
+    ('normal', re.compile(r'[_-]normal')),
+    ('specular', re.compile(r'[_-](?:spec|shine)')),
+    ('emission', re.compile(r'[_-](?:glow|emit)')),
+    ('bump', re.compile(r'[_-]bump')),
+)
+
+# Mission voice files, e.g. 01_blair_03.wav
+_MISSION_VOICE_RE = re.compile(r'\d{2}_\w+_\d{2}\.wav')
+
+# Enhanced faction patterns from campaign analysis
+_FACTION_PATTERNS = {
+    'terran': {
+        'fighters': ('tcf_',),
+        'bombers': ('tcb_',),
+        'ships': ('tcs_',),
+        'missiles': ('tcm_',),
+        'installations': ('tci_',),
+        'general': ('tc_', 'confed_')
+    },
+    'kilrathi': {
+        'fighters': ('kif_',),
+        'bombers': ('kib_',),
+        'ships': ('kis_',),
+        'missiles': ('kim_',),
+        'installations': ('kii_',),
+        'general': ('ki_', 'kb_', 'kil_')
+    },
+    'pirate': {
+        'fighters': ('prf_',),
+        'ships': ('prs_',),
+        'general': ('pr_',)
+    },
+    'border_worlds': {
+        'fighters': ('bwf_',),
+        'ships': ('bws_',),
+        'general': ('bw_',)
+    }
+}
+
+# (faction, category) keyed by faction prefix; every prefix ends at its only '_'
+_FACTION_PREFIX_LOOKUP = {
+    prefix: (faction, category)
+    for faction, categories in _FACTION_PATTERNS.items()
+    for category, prefixes in categories.items()
+    for prefix in prefixes
+}
+
+# Enhanced audio categorization patterns from sounds.tbl analysis
+_AUDIO_CATEGORIES = {
+    'pilot_voice': (
+        '_greywolf_', '_kettle_', '_sandman_', '_phalanx_', '_little_john_',
+        '_bandit_', '_angel_', '_hawk_', '_blade_', '_viper_'
+    ),
+    'control_tower': (
+        '_control_', '_command_', 'hermes_control_', 'bradshaw_control_',
+        'tower_', 'flight_control_'
+    ),
+    'engine_sounds': (
+        'engine_', 'aburn_', 'throttle_', 'afterburner_', 'thrust_',
+        'idle_', 'startup_', 'shutdown_'
+    ),
+    'weapon_sounds': (
+        'missile_', 'laser_', 'ion_', 'cannon_', 'gun_', 'fire_',
+        'launch_', 'impact_', 'hit_', 'beam_'
+    ),
+    'shield_sounds': (
+        'shield_', 'hull_', 'armor_', 'damage_', 'impact_on_'
+    ),
+    'ui_sounds': (
+        'button_', 'menu_', 'alert_', 'warning_', 'beep_', 'click_',
+        'confirm_', 'cancel_', 'select_'
+    ),
+    'ambient_sounds': (
+        'ambient_', 'background_', 'env_', 'atmosphere_'
+    ),
+    'explosion_sounds': (
+        'explosion_', 'blast_', 'boom_', 'explode_', 'detonate_'
+    )
+}
+
+# Audio category matchers, checked in _AUDIO_CATEGORIES order
+_AUDIO_CATEGORY_RULES = tuple(
+    (category, re.compile('|'.join(map(re.escape, patterns))))
+    for category, patterns in _AUDIO_CATEGORIES.items()
+)
+
+# Name-based subcategory fallback, checked in order (misc otherwise)
+_SUBCATEGORY_NAME_RULES = (
+    ('fighters', re.compile(r'fighter|f-|interceptor')),
+    ('bombers', re.compile(r'bomber|b-|torpedo')),
+    ('missiles', re.compile(r'missile|rocket|torpedo')),
+    ('capital_ships', re.compile(r'destroyer|cruiser|carrier|corvette')),
+)
+
+# Music file name indicators
+_MUSIC_RE = re.compile(r'music|theme|ambient|background|score|soundtrack')
+
+
+def _faction_prefix_entry(entity_lower: str) -> Optional[Tuple[str, str]]:
+    """Return (faction, category) for the name's faction prefix, if any."""
+    underscore = entity_lower.find('_')
+    if underscore < 0:
+        return None
+    return _FACTION_PREFIX_LOOKUP.get(entity_lower[:underscore + 1])
+
+def _source_relative_dir(directory: Path, source_dir: Path) -> str:
+    """Directory relative to the source root, '' for the root itself (for os.path.join)"""
+    rel_dir = str(directory.relative_to(source_dir))
+    return '' if rel_dir == '.' else rel_dir
+
 @dataclass
 class DiscoveryPattern:
     """Represents a pattern for discovering related assets"""
@@ -55,73 +189,14 @@ class AssetDiscoveryEngine:
             'missions': self.source_dir / "hermes_core",  # Mission files are in core
         }
         
-        # Enhanced faction patterns from campaign analysis
-        self.faction_patterns = {
-            'terran': {
-                'fighters': ['tcf_'],
-                'bombers': ['tcb_'],
-                'ships': ['tcs_'],
-                'missiles': ['tcm_'],
-                'installations': ['tci_'],
-                'general': ['tc_', 'confed_']
-            },
-            'kilrathi': {
-                'fighters': ['kif_'],
-                'bombers': ['kib_'],
-                'ships': ['kis_'],
-                'missiles': ['kim_'],
-                'installations': ['kii_'],
-                'general': ['ki_', 'kb_', 'kil_']
-            },
-            'pirate': {
-                'fighters': ['prf_'],
-                'ships': ['prs_'],
-                'general': ['pr_']
-            },
-            'border_worlds': {
-                'fighters': ['bwf_'],
-                'ships': ['bws_'],
-                'general': ['bw_']
-            }
-        }
-        
-        # Enhanced audio categorization patterns from sounds.tbl analysis
-        self.audio_categories = {
-            'pilot_voice': [
-                '_greywolf_', '_kettle_', '_sandman_', '_phalanx_', '_little_john_',
-                '_bandit_', '_angel_', '_hawk_', '_blade_', '_viper_'
-            ],
-            'control_tower': [
-                '_control_', '_command_', 'hermes_control_', 'bradshaw_control_',
-                'tower_', 'flight_control_'
-            ],
-            'engine_sounds': [
-                'engine_', 'aburn_', 'throttle_', 'afterburner_', 'thrust_',
-                'idle_', 'startup_', 'shutdown_'
-            ],
-            'weapon_sounds': [
-                'missile_', 'laser_', 'ion_', 'cannon_', 'gun_', 'fire_',
-                'launch_', 'impact_', 'hit_', 'beam_'
-            ],
-            'shield_sounds': [
-                'shield_', 'hull_', 'armor_', 'damage_', 'impact_on_'
-            ],
-            'ui_sounds': [
-                'button_', 'menu_', 'alert_', 'warning_', 'beep_', 'click_',
-                'confirm_', 'cancel_', 'select_'
-            ],
-            'ambient_sounds': [
-                'ambient_', 'background_', 'env_', 'atmosphere_'
-            ],
-            'explosion_sounds': [
-                'explosion_', 'blast_', 'boom_', 'explode_', 'detonate_'
-            ]
-        }
+        # Faction prefixes and audio filename patterns (shared module constants)
+        self.faction_patterns = _FACTION_PATTERNS
+        self.audio_categories = _AUDIO_CATEGORIES
         
         # Asset file extensions by type
         self.asset_extensions = {
             'model': ['.pof'],
-            'texture': ['.dds', '.pcx', '.tga', '.png', '.jpg'],
+            'texture': list(_TEXTURE_EXTENSIONS),
             'audio': ['.wav', '.ogg'],
             'animation': ['.eff'],
             'mission': ['.fs2'],
@@ -139,6 +214,14 @@ class AssetDiscoveryEngine:
         
         # Cache for mission audio analysis  
         self._mission_audio_cache: Dict[str, List[str]] = {}
+        
+        # Per-directory index of .dds frame files keyed by sequence prefix
+        self._eff_frame_index: Dict[Path, Dict[str, List[str]]] = {}
+    
+    @cached_property
+    def _maps_index(self) -> FrozenSet[str]:
+        """File names in the textures directory, listed once per engine"""
+        return list_directory_files(self.asset_directories['textures'])
     
     def discover_entity_assets(self, entity_name: str, entity_type: str, 
                              primary_model_path: Optional[str] = None) -> List[AssetRelationship]:
@@ -153,7 +236,7 @@ class AssetDiscoveryEngine:
         Returns:
             List of discovered asset relationships
         """
-        logger.debug(f"Discovering assets for {entity_type} '{entity_name}'")
+        logger.debug("Discovering assets for %s '%s'", entity_type, entity_name)
         
         # Check cache first
         cache_key = f"{entity_type}:{entity_name}"
@@ -179,7 +262,7 @@ class AssetDiscoveryEngine:
         # Cache results
         self._discovery_cache[cache_key] = relationships
         
-        logger.debug(f"Discovered {len(relationships)} assets for '{entity_name}'")
+        logger.debug("Discovered %s assets for '%s'", len(relationships), entity_name)
         return relationships
     
     def _discover_ship_assets(self, ship_name: str, model_path: Optional[str] = None) -> List[AssetRelationship]:
@@ -375,16 +458,10 @@ class AssetDiscoveryEngine:
         """Determine texture type from filename patterns"""
         stem_lower = texture_stem.lower()
         
-        if any(suffix in stem_lower for suffix in ['_normal', '-normal']):
-            return 'normal'
-        elif any(suffix in stem_lower for suffix in ['_spec', '-spec', '_shine', '-shine']):
-            return 'specular'
-        elif any(suffix in stem_lower for suffix in ['_glow', '-glow', '_emit', '-emit']):
-            return 'emission'
-        elif any(suffix in stem_lower for suffix in ['_bump', '-bump']):
-            return 'bump'
-        else:
-            return 'diffuse'
+        for texture_type, suffix_re in _TEXTURE_TYPE_RULES:
+            if suffix_re.search(stem_lower):
+                return texture_type
+        return 'diffuse'
     
     def _create_effect_relationships(self, eff_file: Path, entity_name: str) -> List[AssetRelationship]:
         """Create relationships for .eff files and their frame sequences"""
@@ -402,19 +479,17 @@ class AssetDiscoveryEngine:
             required=True
         ))
         
-        # Find associated numbered .dds frame files
+        # Find associated numbered .dds frame files (already sorted numerically)
         parent_dir = eff_file.parent
-        frame_files = list(parent_dir.glob(f"{file_stem}_*.dds"))
+        frame_names = self._scan_eff_frames(parent_dir).get(file_stem)
         
-        if frame_files:
-            # Sort frame files numerically
-            frame_files.sort(key=lambda x: self._extract_frame_number(x.stem))
+        if frame_names:
+            parent_rel_dir = _source_relative_dir(parent_dir, self.source_dir)
             
             # Add each frame file as a related asset
-            for frame_file in frame_files:
-                frame_rel_path = frame_file.relative_to(self.source_dir)
+            for frame_name in frame_names:
                 relationships.append(AssetRelationship(
-                    source_path=str(frame_rel_path),
+                    source_path=os.path.join(parent_rel_dir, frame_name),
                     target_path="",  # Will be set by path resolver
                     asset_type='effect_frame',
                     parent_entity=entity_name,
@@ -424,6 +499,37 @@ class AssetDiscoveryEngine:
         
         return relationships
     
+    def _scan_eff_frames(self, parent_dir: Path) -> Dict[str, List[str]]:
+        """
+        Index the .dds frame files of a directory by sequence prefix.
+        
+        The directory is listed once; every .eff file in it then looks up
+        its frames instead of globbing the directory again.
+        
+        Args:
+            parent_dir: Directory containing .eff files and their frames
+            
+        Returns:
+            Mapping of frame prefix (stem up to the last '_') to frame file
+            names, sorted by frame number
+        """
+        index = self._eff_frame_index.get(parent_dir)
+        if index is None:
+            index = {}
+            for file_name in list_directory_files(parent_dir):
+                if not file_name.endswith('.dds'):
+                    continue
+                stem = file_name[:-4]
+                prefix, sep, _ = stem.rpartition('_')
+                if sep:
+                    index.setdefault(prefix, []).append(file_name)
+            
+            for frame_names in index.values():
+                frame_names.sort(key=lambda name: self._extract_frame_number(name[:-4]))
+            self._eff_frame_index[parent_dir] = index
+        
+        return index
+    
     def _extract_frame_number(self, filename: str) -> int:
         """Extract frame number from animation frame filename"""
         match = re.search(r'_(\d+)$', filename)
@@ -439,15 +545,11 @@ class AssetDiscoveryEngine:
         Returns:
             Faction name (terran, kilrathi, pirate, border_worlds, unknown)
         """
-        entity_lower = entity_name.lower()
-        
-        # Check each faction's patterns
-        for faction, categories in self.faction_patterns.items():
-            for category, prefixes in categories.items():
-                for prefix in prefixes:
-                    if entity_lower.startswith(prefix):
-                        logger.debug(f"Entity '{entity_name}' classified as {faction} ({category})")
-                        return faction
+        entry = _faction_prefix_entry(entity_name.lower())
+        if entry is not None:
+            faction, category = entry
+            logger.debug("Entity '%s' classified as %s (%s)", entity_name, faction, category)
+            return faction
         
         return 'unknown'
     
@@ -466,26 +568,15 @@ class AssetDiscoveryEngine:
             return 'misc'
             
         entity_lower = entity_name.lower()
-        faction_patterns = self.faction_patterns.get(faction, {})
-        
-        for category, prefixes in faction_patterns.items():
-            if category == 'general':
-                continue
-            for prefix in prefixes:
-                if entity_lower.startswith(prefix):
-                    return category
+        entry = _faction_prefix_entry(entity_lower)
+        if entry is not None and entry[0] == faction and entry[1] != 'general':
+            return entry[1]
         
         # Fallback to general classification based on naming patterns
-        if any(pattern in entity_lower for pattern in ['fighter', 'f-', 'interceptor']):
-            return 'fighters'
-        elif any(pattern in entity_lower for pattern in ['bomber', 'b-', 'torpedo']):
-            return 'bombers'
-        elif any(pattern in entity_lower for pattern in ['missile', 'rocket', 'torpedo']):
-            return 'missiles'
-        elif any(pattern in entity_lower for pattern in ['destroyer', 'cruiser', 'carrier', 'corvette']):
-            return 'capital_ships'
-        else:
-            return 'misc'
+        for subcategory, matcher in _SUBCATEGORY_NAME_RULES:
+            if matcher.search(entity_lower):
+                return subcategory
+        return 'misc'
     
     def _classify_audio_type(self, sound_file: Path, base_type: str) -> str:
         """
@@ -501,20 +592,17 @@ class AssetDiscoveryEngine:
         filename = sound_file.name.lower()
         
         # Check each audio category
-        for category, patterns in self.audio_categories.items():
-            for pattern in patterns:
-                if pattern in filename:
-                    logger.debug(f"Audio '{filename}' classified as {category}")
-                    return category
+        for category, matcher in _AUDIO_CATEGORY_RULES:
+            if matcher.search(filename):
+                logger.debug("Audio '%s' classified as %s", filename, category)
+                return category
         
         # Mission-specific voice pattern detection
-        mission_voice_pattern = re.compile(r'\d{2}_\w+_\d{2}\.wav')
-        if mission_voice_pattern.match(filename):
+        if _MISSION_VOICE_RE.match(filename):
             return 'pilot_voice'
         
         # Music file patterns  
-        music_patterns = ['music', 'theme', 'ambient', 'background', 'score', 'soundtrack']
-        if any(pattern in filename for pattern in music_patterns):
+        if _MUSIC_RE.search(filename):
             return 'music'
         
         # Default to base type
@@ -537,36 +625,25 @@ class AssetDiscoveryEngine:
         if not textures_dir.exists():
             return {'complete': False, 'missing': ['textures directory not found']}
         
-        material_types = {
-            'diffuse': ['', '_diffuse', '_d', '_col', '_color'],
-            'normal': ['_normal', '_n', '_nrm', '_bump'],
-            'specular': ['_specular', '_spec', '_s', '_shine'],
-            'glow': ['_glow', '_g', '_emissive', '_emit']
-        }
-        
         found_materials = {}
-        missing_materials = []
-        
-        for material_type, suffixes in material_types.items():
-            found = False
-            for suffix in suffixes:
-                for ext in self.asset_extensions['texture']:
-                    material_file = textures_dir / f"{base_texture}{suffix}{ext}"
-                    if material_file.exists():
-                        found_materials[material_type] = str(material_file.relative_to(self.source_dir))
-                        found = True
-                        break
-                if found:
-                    break
-            
-            if not found:
-                missing_materials.append(material_type)
+        textures_rel_dir = _source_relative_dir(textures_dir, self.source_dir)
+        
+        # One set intersection against the directory listing, then pick the
+        # highest-priority hit for each material type
+        hits = self._maps_index.intersection(f"{base_texture}{tail}" for _, tail in _MATERIAL_CANDIDATES)
+        if hits:
+            for material_type, tail in _MATERIAL_CANDIDATES:
+                material_name = f"{base_texture}{tail}"
+                if material_type not in found_materials and material_name in hits:
+                    found_materials[material_type] = os.path.join(textures_rel_dir, material_name)
+        
+        missing_materials = [material_type for material_type in _MATERIAL_SUFFIXES if material_type not in found_materials]
         
         completeness_report = {
             'complete': len(missing_materials) == 0,
             'found_materials': found_materials,
             'missing_materials': missing_materials,
-            'completeness_score': len(found_materials) / len(material_types)
+            'completeness_score': len(found_materials) / len(_MATERIAL_SUFFIXES)
         }
         
         self._material_cache[base_texture] = completeness_report
@@ -613,7 +690,7 @@ class AssetDiscoveryEngine:
             ))
         
         if sequence_frames:
-            logger.debug(f"Found {len(sequence_frames)} effect frames for '{effect_name}'")
+            logger.debug("Found %s effect frames for '%s'", len(sequence_frames), effect_name)
         
         return relationships
     
@@ -658,8 +735,8 @@ class AssetDiscoveryEngine:
         return {
             'faction_distribution': faction_stats,
             'shared_assets': shared_assets,
-            'total_factions': len([f for f, stats in faction_stats.items() 
-                                 if sum(stats.values()) > 0])
+            'total_factions': sum(1 for stats in faction_stats.values()
+                                  if sum(stats.values()) > 0)
         }
     
     def _mission_contains_entity(self, mission_file: Path, entity_name: str) -> bool:
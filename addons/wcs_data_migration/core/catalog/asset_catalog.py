@@ -12,15 +12,30 @@ Story: DM-003 - Asset Organization and Cataloging
 """
 
 import json
+import os
 import sqlite3
 import logging
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Any, Union
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 import re
 
+from ..path_utils import iter_directory_files, list_directory_files
+
+# Read buffer size for file hashing; one buffer per file instead of one per 4K chunk
+_HASH_BUFFER_SIZE = 1 << 16
+
+# orjson is optional; it encodes and parses JSON much faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -247,9 +262,13 @@ class AssetCatalog:
         """Calculate SHA-256 hash of file"""
         try:
             hash_sha256 = hashlib.sha256()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
+            buffer = memoryview(bytearray(_HASH_BUFFER_SIZE))
+            with open(file_path, "rb", buffering=0) as f:
+                while True:
+                    read_size = f.readinto(buffer)
+                    if not read_size:
+                        break
+                    hash_sha256.update(buffer[:read_size])
             return hash_sha256.hexdigest()
         except Exception as e:
             logger.warning(f"Failed to calculate hash for {file_path}: {e}")
@@ -316,14 +335,17 @@ class AssetCatalog:
                         return category_info[next_part].split('/')
                 return part_lower.title(), ""
         
-        # Default categorization based on asset type
-        if 'texture' in str(file_path).lower() or file_path.suffix in ['.png', '.jpg', '.jpeg']:
+        # Default categorization based on asset type; Path.suffix is re-derived
+        # on every access, so compute it and the lowered path once
+        path_lower = str(file_path).lower()
+        suffix = file_path.suffix
+        if 'texture' in path_lower or suffix in ['.png', '.jpg', '.jpeg']:
             return "Textures", "General"
-        elif 'audio' in str(file_path).lower() or file_path.suffix in ['.wav', '.ogg']:
+        elif 'audio' in path_lower or suffix in ['.wav', '.ogg']:
             return "Audio", "General"
-        elif 'model' in str(file_path).lower() or file_path.suffix in ['.gltf', '.glb']:
+        elif 'model' in path_lower or suffix in ['.gltf', '.glb']:
             return "Models", "General"
-        elif 'mission' in str(file_path).lower() or file_path.suffix == '.fs2':
+        elif 'mission' in path_lower or suffix == '.fs2':
             return "Missions", "General"
         
         return "General", ""
@@ -372,24 +394,33 @@ class AssetCatalog:
     def _extract_animation_metadata(self, file_path: Path, metadata: AssetMetadata) -> None:
         """Extract animation metadata from JSON files"""
         try:
-            with open(file_path, 'r') as f:
-                anim_data = json.load(f)
-                if 'frames' in anim_data:
-                    metadata.properties['frame_count'] = anim_data['frames']
-                if 'frame_delay' in anim_data:
-                    metadata.duration = anim_data['frame_delay'] * anim_data.get('frames', 1)
-                if 'frame_width' in anim_data and 'frame_height' in anim_data:
-                    metadata.dimensions = (anim_data['frame_width'], anim_data['frame_height'])
+            if ORJSON_AVAILABLE:
+                anim_data = orjson.loads(file_path.read_bytes())
+            else:
+                with open(file_path, 'r') as f:
+                    anim_data = json.load(f)
+            
+            if 'frames' in anim_data:
+                metadata.properties['frame_count'] = anim_data['frames']
+            if 'frame_delay' in anim_data:
+                metadata.duration = anim_data['frame_delay'] * anim_data.get('frames', 1)
+            if 'frame_width' in anim_data and 'frame_height' in anim_data:
+                metadata.dimensions = (anim_data['frame_width'], anim_data['frame_height'])
         except Exception as e:
             logger.warning(f"Failed to extract animation metadata: {e}")
     
-    def scan_directory(self, directory: Path, recursive: bool = True) -> int:
+    def scan_directory(self, directory: Path, recursive: bool = True,
+                       max_workers: Optional[int] = None) -> int:
         """
         Scan directory and catalog all assets.
         
+        Files are hashed and inspected on a thread pool, since each file's
+        metadata extraction is independent and mostly I/O.
+        
         Args:
             directory: Directory to scan
             recursive: Whether to scan subdirectories
+            max_workers: Extraction threads (ThreadPoolExecutor default if None)
             
         Returns:
             Number of assets cataloged
@@ -398,24 +429,21 @@ class AssetCatalog:
         assets_found = 0
         
         try:
-            if recursive:
-                file_pattern = "**/*"
-            else:
-                file_pattern = "*"
-                
-            for file_path in directory.glob(file_pattern):
-                if file_path.is_file() and not file_path.name.startswith('.'):
-                    try:
-                        metadata = self._extract_metadata(file_path)
-                        self.assets[metadata.asset_id] = metadata
-                        assets_found += 1
-                        
-                        if assets_found % 100 == 0:
-                            logger.info(f"Cataloged {assets_found} assets...")
-                            
-                    except Exception as e:
-                        logger.error(f"Failed to catalog {file_path}: {e}")
+            file_paths = [
+                Path(entry.path) for entry in iter_directory_files(directory, recursive)
+                if not entry.name.startswith('.')
+            ]
+            
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for metadata in executor.map(self._catalog_file, file_paths):
+                    if metadata is None:
                         continue
+                    
+                    self.assets[metadata.asset_id] = metadata
+                    assets_found += 1
+                    
+                    if assets_found % 100 == 0:
+                        logger.info(f"Cataloged {assets_found} assets...")
                         
             logger.info(f"Cataloged {assets_found} assets from {directory}")
             return assets_found
@@ -424,6 +452,14 @@ class AssetCatalog:
             logger.error(f"Failed to scan directory {directory}: {e}")
             return assets_found
     
+    def _catalog_file(self, file_path: Path) -> Optional[AssetMetadata]:
+        """Extract metadata for one scanned file, or None if it cannot be cataloged"""
+        try:
+            return self._extract_metadata(file_path)
+        except Exception as e:
+            logger.error(f"Failed to catalog {file_path}: {e}")
+            return None
+    
     def add_relationship(self, source_id: str, target_id: str, relationship_type: str, 
                         strength: float = 1.0, metadata: Optional[Dict[str, Any]] = None) -> None:
         """Add asset relationship"""
@@ -490,9 +526,22 @@ class AssetCatalog:
         
         logger.info(f"Validating {len(self.assets)} assets...")
         
+        # Assets share a handful of directories, so list each one once and
+        # check membership instead of stat'ing every asset file
+        directory_listings: Dict[str, Set[str]] = {}
+        
         for asset_id, asset in self.assets.items():
             # Check file existence
-            if not Path(asset.file_path).exists():
+            directory, file_name = os.path.split(asset.file_path)
+            listing = directory_listings.get(directory)
+            if listing is None:
+                listing = {
+                    os.path.normcase(name)
+                    for name in list_directory_files(directory or os.curdir)
+                }
+                directory_listings[directory] = listing
+            
+            if os.path.normcase(file_name) not in listing:
                 self.validation_issues.append(ValidationIssue(
                     asset_id=asset_id,
                     issue_type="missing_file",
@@ -580,7 +629,7 @@ class AssetCatalog:
         total_assets = len(self.assets)
         if total_assets > 0:
             manifest['quality_metrics']['validation_pass_rate'] = (
-                total_assets - len([issue for issue in self.validation_issues if issue.severity == 'error'])
+                total_assets - sum(1 for issue in self.validation_issues if issue.severity == 'error')
             ) / total_assets
         
         return manifest
@@ -588,16 +637,9 @@ class AssetCatalog:
     def save_catalog(self) -> None:
         """Save catalog to JSON and database"""
         try:
-            # Save to JSON
-            catalog_data = {
-                'assets': {asset_id: asdict(asset) for asset_id, asset in self.assets.items()},
-                'relationships': [asdict(rel) for rel in self.relationships],
-                'validation_issues': [asdict(issue) for issue in self.validation_issues],
-                'manifest': self.generate_manifest()
-            }
-            
-            with open(self.catalog_path, 'w') as f:
-                json.dump(catalog_data, f, indent=2)
+            # Save to JSON: encode fully in memory, then write and swap the
+            # file in, so an interrupted save never leaves a truncated catalog
+            self._write_catalog_file(self._build_catalog_json())
             
             logger.info(f"Saved catalog to {self.catalog_path}")
             
@@ -608,6 +650,34 @@ class AssetCatalog:
             logger.error(f"Failed to save catalog: {e}")
             raise
     
+    def _build_catalog_json(self) -> bytes:
+        """Encode the catalog as indented JSON"""
+        if ORJSON_AVAILABLE:
+            # orjson serializes the dataclasses natively
+            catalog_data = {
+                'assets': self.assets,
+                'relationships': self.relationships,
+                'validation_issues': self.validation_issues,
+                'manifest': self.generate_manifest()
+            }
+            return orjson.dumps(catalog_data, option=orjson.OPT_INDENT_2)
+        
+        # vars() shares the field containers instead of deep-copying
+        # them the way asdict() does; json.dumps only reads them
+        catalog_data = {
+            'assets': {asset_id: vars(asset) for asset_id, asset in self.assets.items()},
+            'relationships': [vars(rel) for rel in self.relationships],
+            'validation_issues': [vars(issue) for issue in self.validation_issues],
+            'manifest': self.generate_manifest()
+        }
+        return json.dumps(catalog_data, indent=2).encode('utf-8')
+    
+    def _write_catalog_file(self, data: bytes) -> None:
+        """Write encoded catalog bytes to a temp file and atomically replace the catalog"""
+        temp_path = self.catalog_path.with_name(self.catalog_path.name + '.tmp')
+        temp_path.write_bytes(data)
+        os.replace(temp_path, self.catalog_path)
+    
     def _save_to_database(self) -> None:
         """Save catalog data to SQLite database"""
         try:
@@ -620,47 +690,55 @@ class AssetCatalog:
                 cursor.execute("DELETE FROM relationships")
                 cursor.execute("DELETE FROM assets")
                 
-                # Insert assets
-                for asset in self.assets.values():
-                    cursor.execute('''
-                        INSERT INTO assets (
-                            asset_id, name, file_path, asset_type, category, subcategory,
-                            file_size, file_hash, creation_date, modification_date,
-                            wcs_source_file, wcs_format, metadata_json
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
+                # Insert assets; each table is written with one executemany
+                # batch instead of an execute round trip per row
+                cursor.executemany('''
+                    INSERT INTO assets (
+                        asset_id, name, file_path, asset_type, category, subcategory,
+                        file_size, file_hash, creation_date, modification_date,
+                        wcs_source_file, wcs_format, metadata_json
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', [
+                    (
                         asset.asset_id, asset.name, asset.file_path, asset.asset_type,
                         asset.category, asset.subcategory, asset.file_size, asset.file_hash,
                         asset.creation_date, asset.modification_date, asset.wcs_source_file,
                         asset.wcs_format, json.dumps(asset.properties)
-                    ))
-                    
-                    # Insert tags
-                    for tag in asset.tags:
-                        cursor.execute("INSERT INTO asset_tags (asset_id, tag) VALUES (?, ?)", 
-                                     (asset.asset_id, tag))
+                    )
+                    for asset in self.assets.values()
+                ])
+                
+                # Insert tags
+                cursor.executemany(
+                    "INSERT INTO asset_tags (asset_id, tag) VALUES (?, ?)",
+                    [(asset.asset_id, tag) for asset in self.assets.values() for tag in asset.tags]
+                )
                 
                 # Insert relationships
-                for rel in self.relationships:
-                    cursor.execute('''
-                        INSERT INTO relationships (
-                            source_asset, target_asset, relationship_type, strength, metadata_json
-                        ) VALUES (?, ?, ?, ?, ?)
-                    ''', (
+                cursor.executemany('''
+                    INSERT INTO relationships (
+                        source_asset, target_asset, relationship_type, strength, metadata_json
+                    ) VALUES (?, ?, ?, ?, ?)
+                ''', [
+                    (
                         rel.source_asset, rel.target_asset, rel.relationship_type,
                         rel.strength, json.dumps(rel.metadata)
-                    ))
+                    )
+                    for rel in self.relationships
+                ])
                 
                 # Insert validation issues
-                for issue in self.validation_issues:
-                    cursor.execute('''
-                        INSERT INTO validation_issues (
-                            asset_id, issue_type, severity, message, recommendation
-                        ) VALUES (?, ?, ?, ?, ?)
-                    ''', (
+                cursor.executemany('''
+                    INSERT INTO validation_issues (
+                        asset_id, issue_type, severity, message, recommendation
+                    ) VALUES (?, ?, ?, ?, ?)
+                ''', [
+                    (
                         issue.asset_id, issue.issue_type, issue.severity,
                         issue.message, issue.recommendation
-                    ))
+                    )
+                    for issue in self.validation_issues
+                ])
                 
                 conn.commit()
                 logger.info(f"Saved catalog to database: {self.db_path}")
@@ -676,8 +754,11 @@ class AssetCatalog:
                 logger.warning(f"Catalog file not found: {self.catalog_path}")
                 return False
                 
-            with open(self.catalog_path, 'r') as f:
-                catalog_data = json.load(f)
+            if ORJSON_AVAILABLE:
+                catalog_data = orjson.loads(self.catalog_path.read_bytes())
+            else:
+                with open(self.catalog_path, 'r') as f:
+                    catalog_data = json.load(f)
             
             # Load assets
             self.assets = {}
@@ -7,16 +7,25 @@ Coordinates between different converters following SOLID principles.
 """
 
 import logging
+import os
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 
 from .job_manager import JobManager, ConversionJob
 from .progress_tracker import ProgressTracker
-from ..catalog.asset_catalog import AssetCatalog
+from ..path_utils import iter_directory_files
 
 logger = logging.getLogger(__name__)
 
+# Extensions collected from the whole source tree (.vp is top-level only)
+_SCANNED_EXTENSIONS = ('.pof', '.fs2', '.fc2', '.tbl', '.cfg')
+
+# WCS install subdirectories that never hold convertible assets (pilots,
+# caches, screenshots, multiplayer data, VCS metadata); not descended into
+_SKIPPED_SOURCE_DIRS = frozenset({'players', 'cache', 'screenshots', 'multidata', '.git'})
+
 class ConversionOrchestrator:
     """
     Main conversion orchestrator following Single Responsibility Principle.
@@ -27,17 +36,25 @@ class ConversionOrchestrator:
     - Provide unified interface for conversion operations
     """
     
-    def __init__(self, wcs_source_dir: Path, godot_target_dir: Path):
+    def __init__(self, wcs_source_dir: Path, godot_target_dir: Path, max_workers: int = 4,
+                 skip_dirs: Optional[List[str]] = None):
         self.wcs_source_dir = Path(wcs_source_dir)
         self.godot_target_dir = Path(godot_target_dir)
+        # Source subdirectory names the asset scan does not descend into
+        self.skip_dirs = _SKIPPED_SOURCE_DIRS.union(name.lower() for name in skip_dirs or ())
         
         # Initialize components (Dependency Injection)
-        self.job_manager = JobManager()
+        self.job_manager = JobManager(max_workers=max_workers)
         self.progress_tracker = ProgressTracker()
-        self.asset_catalog = AssetCatalog(godot_target_dir / "asset_catalog.db")
         
         self.logger = logging.getLogger(self.__class__.__name__)
     
+    @cached_property
+    def asset_catalog(self):
+        """Asset catalog, created on first use (dry runs never open its database)"""
+        from ..catalog.asset_catalog import AssetCatalog
+        return AssetCatalog(self.godot_target_dir / "asset_catalog.db")
+    
     def convert_all_assets(self, dry_run: bool = False) -> bool:
         """
         Convert all WCS assets to Godot format.
@@ -59,7 +76,7 @@ class ConversionOrchestrator:
                 return self._show_conversion_plan(jobs)
             
             # Phase 2: Execute conversion
-            self.progress_tracker.start_conversion(len(jobs))
+            self.progress_tracker.start_conversion(len(jobs), jobs)
             success = self._execute_conversion_phases(jobs)
             
             # Phase 3: Validate and catalog
@@ -77,16 +94,32 @@ class ConversionOrchestrator:
         """Scan WCS directory for convertible assets"""
         self.logger.info("Scanning WCS assets...")
         
+        # Walk the source tree once and bucket files by extension instead of
+        # running a separate glob per asset type
+        vp_archives: List[Path] = []
+        files_by_extension: Dict[str, List[Path]] = {ext: [] for ext in _SCANNED_EXTENSIONS}
+        source_root = str(self.wcs_source_dir)
+        for entry in iter_directory_files(self.wcs_source_dir, skip_dirs=self.skip_dirs):
+            name = entry.name
+            dot = name.rfind('.')
+            if dot < 0:
+                continue
+            extension = name[dot:].lower()
+            if extension in files_by_extension:
+                files_by_extension[extension].append(Path(entry.path))
+            elif extension == '.vp' and os.path.dirname(entry.path) == source_root:
+                # VP archives only live in the top-level directory
+                vp_archives.append(Path(entry.path))
+        
         assets = {
-            'vp_archives': list(self.wcs_source_dir.glob("*.vp")),
-            'pof_models': list(self.wcs_source_dir.rglob("*.pof")),
-            'mission_files': list(self.wcs_source_dir.rglob("*.fs2")) + 
-                           list(self.wcs_source_dir.rglob("*.fc2")),
-            'table_files': list(self.wcs_source_dir.rglob("*.tbl")),
-            'config_files': list(self.wcs_source_dir.rglob("*.cfg"))
+            'vp_archives': vp_archives,
+            'pof_models': files_by_extension['.pof'],
+            'mission_files': files_by_extension['.fs2'] + files_by_extension['.fc2'],
+            'table_files': files_by_extension['.tbl'],
+            'config_files': files_by_extension['.cfg']
         }
         
-        total_assets = sum(len(files) for files in assets.values())
+        total_assets = len(vp_archives) + sum(len(files) for files in files_by_extension.values())
         self.logger.info(f"Found {total_assets} assets to convert")
         
         return assets
@@ -111,14 +111,17 @@ class JobManager:
             # Group jobs by priority phase
             phases = self._group_jobs_by_priority(jobs)
             
-            # Execute each phase sequentially, jobs within phase in parallel
-            for phase_priority, phase_jobs in phases.items():
-                self.logger.info(f"Executing phase {phase_priority} ({len(phase_jobs)} jobs)")
-                
-                success = self._execute_phase(phase_jobs, progress_tracker)
-                if not success:
-                    self.logger.error(f"Phase {phase_priority} failed")
-                    return False
+            # Execute each phase sequentially, jobs within phase in parallel.
+            # One pool serves every phase so workers are not torn down and
+            # respawned at each phase boundary.
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for phase_priority, phase_jobs in phases.items():
+                    self.logger.info(f"Executing phase {phase_priority} ({len(phase_jobs)} jobs)")
+                    
+                    success = self._execute_phase(phase_jobs, progress_tracker, executor)
+                    if not success:
+                        self.logger.error(f"Phase {phase_priority} failed")
+                        return False
             
             return True
             
@@ -126,37 +129,38 @@ class JobManager:
             self.logger.error(f"Job execution failed: {e}")
             return False
     
-    def _execute_phase(self, jobs: List[ConversionJob], progress_tracker) -> bool:
-        """Execute a single phase of jobs in parallel"""
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all jobs in this phase
-            futures = []
-            for job in jobs:
-                if self._are_dependencies_satisfied(job):
-                    future = executor.submit(self._execute_single_job, job, progress_tracker)
-                    futures.append(future)
-                else:
-                    job.status = JobStatus.SKIPPED
-                    job.error_message = "Dependencies not satisfied"
-            
-            # Wait for all jobs to complete
-            success = True
-            for future in futures:
-                try:
-                    job_success = future.result()
-                    if not job_success:
-                        success = False
-                except Exception as e:
-                    self.logger.error(f"Job execution error: {e}")
+    def _execute_phase(self, jobs: List[ConversionJob], progress_tracker,
+                       executor: ThreadPoolExecutor) -> bool:
+        """Execute a single phase of jobs in parallel on the shared executor"""
+        # Submit all jobs in this phase
+        futures = []
+        for job in jobs:
+            if self._are_dependencies_satisfied(job):
+                future = executor.submit(self._execute_single_job, job, progress_tracker)
+                futures.append(future)
+            else:
+                job.status = JobStatus.SKIPPED
+                job.error_message = "Dependencies not satisfied"
+        
+        # Wait for all jobs to complete
+        success = True
+        for future in futures:
+            try:
+                job_success = future.result()
+                if not job_success:
                     success = False
-            
-            return success
+            except Exception as e:
+                self.logger.error(f"Job execution error: {e}")
+                success = False
+        
+        return success
     
     def _execute_single_job(self, job: ConversionJob, progress_tracker) -> bool:
         """Execute a single conversion job"""
+        source_name = job.source_path.name
         try:
             job.status = JobStatus.RUNNING
-            self.logger.info(f"Starting {job.conversion_type}: {job.source_path.name}")
+            self.logger.info("Starting %s: %s", job.conversion_type, source_name)
             
             # TODO: Implement actual conversion logic based on job type
             success = self._perform_conversion(job)
@@ -164,10 +168,10 @@ class JobManager:
             if success:
                 job.status = JobStatus.COMPLETED
                 job.progress = 100.0
-                self.logger.info(f"Completed {job.conversion_type}: {job.source_path.name}")
+                self.logger.info("Completed %s: %s", job.conversion_type, source_name)
             else:
                 job.status = JobStatus.FAILED
-                self.logger.error(f"Failed {job.conversion_type}: {job.source_path.name}")
+                self.logger.error("Failed %s: %s", job.conversion_type, source_name)
             
             progress_tracker.update_job_progress(job)
             return success
@@ -175,7 +179,7 @@ class JobManager:
         except Exception as e:
             job.status = JobStatus.FAILED
             job.error_message = str(e)
-            self.logger.error(f"Job {job.source_path.name} failed: {e}")
+            self.logger.error("Job %s failed: %s", source_name, e)
             return False
     
     def _perform_conversion(self, job: ConversionJob) -> bool:
@@ -188,11 +192,9 @@ class JobManager:
     
     def _group_jobs_by_priority(self, jobs: List[ConversionJob]) -> Dict[int, List[ConversionJob]]:
         """Group jobs by priority for phase execution"""
-        phases = {}
+        phases: Dict[int, List[ConversionJob]] = {}
         for job in jobs:
-            if job.priority not in phases:
-                phases[job.priority] = []
-            phases[job.priority].append(job)
+            phases.setdefault(job.priority, []).append(job)
         return phases
     
     def _are_dependencies_satisfied(self, job: ConversionJob) -> bool:
@@ -36,10 +36,13 @@ class ProgressStats:
     
     @property
     def estimated_time_remaining(self) -> Optional[float]:
+        return self.estimate_remaining(self.elapsed_time)
+    
+    def estimate_remaining(self, elapsed: float) -> Optional[float]:
+        """Estimate remaining time from an already measured elapsed time"""
         if self.overall_progress <= 0 or self.start_time is None:
             return None
         
-        elapsed = self.elapsed_time
         total_estimated = elapsed / (self.overall_progress / 100.0)
         return total_estimated - elapsed
 
@@ -50,35 +53,60 @@ class ProgressTracker:
     Single Responsibility: Progress tracking and reporting only
     """
     
-    def __init__(self):
+    def __init__(self, notify_interval: float = 0.1):
         self.stats = ProgressStats()
         self.job_progress: Dict[str, float] = {}
         self.callbacks: List[Callable[[ProgressStats], None]] = []
         self._lock = Lock()
         self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # Running sum of job_progress values, updated by delta per job
+        self._progress_total = 0.0
+        
+        # Per-job updates notify callbacks at most once per notify_interval
+        # seconds; start, completion and the last job always notify
+        self.notify_interval = notify_interval
+        self._last_notify = 0.0
     
-    def start_conversion(self, total_jobs: int) -> None:
-        """Start tracking conversion progress"""
+    def start_conversion(self, total_jobs: int, jobs: Optional[List[ConversionJob]] = None) -> None:
+        """Start tracking conversion progress (jobs, if given, are registered at 0%)"""
         with self._lock:
             self.stats = ProgressStats(
                 total_jobs=total_jobs,
                 start_time=time.time()
             )
-            self.job_progress.clear()
+            # Size job_progress once up front so worker updates only
+            # overwrite existing entries
+            if jobs is not None:
+                self.job_progress = dict.fromkeys((str(job.source_path) for job in jobs), 0.0)
+            else:
+                self.job_progress.clear()
+            self._progress_total = 0.0
+            snapshot = self._snapshot_stats()
         
         self.logger.info(f"Started tracking {total_jobs} conversion jobs")
-        self._notify_callbacks()
+        self._notify_callbacks(snapshot)
     
     def update_job_progress(self, job: ConversionJob) -> None:
         """Update progress for a specific job"""
         with self._lock:
             job_key = str(job.source_path)
+            previous = self.job_progress.get(job_key)
             self.job_progress[job_key] = job.progress
             
             # Update overall statistics
-            self._recalculate_stats()
+            self._apply_progress_change(previous, job.progress)
+            
+            now = time.monotonic()
+            all_done = self.stats.completed_jobs >= self.stats.total_jobs
+            if not all_done and now - self._last_notify < self.notify_interval:
+                return
+            self._last_notify = now
+            
+            # Snapshot under the lock already held instead of re-acquiring it
+            snapshot = self._snapshot_stats()
         
-        self._notify_callbacks()
+        self._notify_callbacks(snapshot)
     
     def complete_conversion(self, success: bool) -> None:
         """Mark conversion as complete"""
@@ -90,8 +118,10 @@ class ProgressTracker:
                 self.logger.info(f"Conversion completed successfully in {self.stats.elapsed_time:.2f}s")
             else:
                 self.logger.error(f"Conversion failed after {self.stats.elapsed_time:.2f}s")
+            
+            snapshot = self._snapshot_stats()
         
-        self._notify_callbacks()
+        self._notify_callbacks(snapshot)
     
     def add_progress_callback(self, callback: Callable[[ProgressStats], None]) -> None:
         """Add a callback for progress updates"""
@@ -105,47 +135,62 @@ class ProgressTracker:
     def get_progress(self) -> ProgressStats:
         """Get current progress statistics"""
         with self._lock:
-            return ProgressStats(
-                total_jobs=self.stats.total_jobs,
-                completed_jobs=self.stats.completed_jobs,
-                failed_jobs=self.stats.failed_jobs,
-                running_jobs=self.stats.running_jobs,
-                overall_progress=self.stats.overall_progress,
-                start_time=self.stats.start_time,
-                end_time=self.stats.end_time
-            )
+            return self._snapshot_stats()
     
     def get_detailed_progress(self) -> Dict[str, Any]:
         """Get detailed progress information"""
         with self._lock:
+            # Read the clock once for both time figures
+            elapsed = self.stats.elapsed_time
             return {
-                'stats': self.get_progress(),
+                'stats': self._snapshot_stats(),
                 'job_progress': dict(self.job_progress),
                 'time_info': {
-                    'elapsed': self.stats.elapsed_time,
-                    'estimated_remaining': self.stats.estimated_time_remaining
+                    'elapsed': elapsed,
+                    'estimated_remaining': self.stats.estimate_remaining(elapsed)
                 }
             }
     
-    def _recalculate_stats(self) -> None:
-        """Recalculate overall statistics (called with lock held)"""
-        total_progress = sum(self.job_progress.values())
+    def _snapshot_stats(self) -> ProgressStats:
+        """Copy the current statistics (called with lock held)"""
+        return ProgressStats(
+            total_jobs=self.stats.total_jobs,
+            completed_jobs=self.stats.completed_jobs,
+            failed_jobs=self.stats.failed_jobs,
+            running_jobs=self.stats.running_jobs,
+            overall_progress=self.stats.overall_progress,
+            start_time=self.stats.start_time,
+            end_time=self.stats.end_time
+        )
+    
+    def _apply_progress_change(self, previous: Optional[float], current: float) -> None:
+        """Fold one job's progress change into the statistics (called with lock held)"""
+        stats = self.stats
         
-        if self.stats.total_jobs > 0:
-            self.stats.overall_progress = total_progress / self.stats.total_jobs
-        else:
-            self.stats.overall_progress = 0.0
+        # Only the changed job is re-counted, instead of re-scanning every
+        # job's progress on each update
+        if previous is not None:
+            self._progress_total -= previous
+            if previous >= 100.0:
+                stats.completed_jobs -= 1
+            elif previous > 0:
+                stats.running_jobs -= 1
         
-        # Count job statuses (this would need job status info passed in)
-        self.stats.completed_jobs = sum(1 for progress in self.job_progress.values() if progress >= 100.0)
-        self.stats.running_jobs = sum(1 for progress in self.job_progress.values() if 0 < progress < 100.0)
+        self._progress_total += current
+        if current >= 100.0:
+            stats.completed_jobs += 1
+        elif current > 0:
+            stats.running_jobs += 1
+        
+        if stats.total_jobs > 0:
+            stats.overall_progress = self._progress_total / stats.total_jobs
+        else:
+            stats.overall_progress = 0.0
         
         # Failed jobs would need to be tracked separately with job status updates
     
-    def _notify_callbacks(self) -> None:
-        """Notify all registered callbacks of progress update"""
-        current_stats = self.get_progress()
-        
+    def _notify_callbacks(self, current_stats: ProgressStats) -> None:
+        """Notify all registered callbacks of a progress snapshot taken under the lock"""
         for callback in self.callbacks:
             try:
                 callback(current_stats)
@@ -155,13 +200,15 @@ class ProgressTracker:
     def log_progress_summary(self) -> None:
         """Log a summary of current progress"""
         stats = self.get_progress()
+        elapsed = stats.elapsed_time
+        remaining = stats.estimate_remaining(elapsed)
         
         self.logger.info("Progress Summary:")
         self.logger.info(f"  Overall: {stats.overall_progress:.1f}%")
         self.logger.info(f"  Completed: {stats.completed_jobs}/{stats.total_jobs}")
         self.logger.info(f"  Failed: {stats.failed_jobs}")
         self.logger.info(f"  Running: {stats.running_jobs}")
-        self.logger.info(f"  Elapsed: {stats.elapsed_time:.1f}s")
+        self.logger.info(f"  Elapsed: {elapsed:.1f}s")
         
-        if stats.estimated_time_remaining:
-            self.logger.info(f"  Estimated remaining: {stats.estimated_time_remaining:.1f}s")
\ No newline at end of file
+        if remaining:
+            self.logger.info(f"  Estimated remaining: {remaining:.1f}s")
\ No newline at end of file
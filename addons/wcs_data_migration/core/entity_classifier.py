@@ -13,9 +13,11 @@ Epic: EPIC-003 - Data Migration & Conversion Tools
 
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Set, Optional, Tuple
 from enum import Enum
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +84,266 @@ class TableType(Enum):
     WEAPON_EXPL = "weapon_expl"
     UNKNOWN = "unknown"
 
+# Known weapon names (missiles, projectiles) that might appear in ships.tbl
+_KNOWN_WEAPONS = frozenset({
+    'dart', 'pilum', 'javelin', 'spiculum', 'porcupine', 'lance', 
+    'warhammer', 'torpedo', 'missile', 'paw', 'fang', 'stalker', 
+    'claw', 'scratch', 'spear', 'predator'
+})
+
+# Known ship name patterns
+_SHIP_NAME_PATTERNS = frozenset({
+    # Terran ships
+    'hornet', 'rapier', 'excalibur', 'thunderbolt', 'sabre', 'broadsword',
+    'epee', 'gladius', 'stiletto', 'centurion', 'orion', 'demon',
+    # Kilrathi ships  
+    'dralthi', 'salthi', 'sartha', 'gothri', 'jalthi', 'gratha',
+    'fralthi', 'ralari', 'kamrani', 'snakeir', 'bloodfang',
+    # Capital ships
+    'carrier', 'destroyer', 'cruiser', 'corvette', 'frigate',
+    'dreadnought', 'transport', 'tanker', 'bengal', 'tiger'
+})
+
+# Enhanced faction prefixes from comprehensive campaign analysis
+_FACTION_PREFIXES = MappingProxyType({
+    'tcf_': 'terran',       # Terran Confederation Fighters
+    'tcb_': 'terran',       # Terran Confederation Bombers  
+    'tcs_': 'terran',       # Terran Confederation Ships
+    'tcm_': 'terran',       # Terran Confederation Missiles
+    'tci_': 'terran',       # Terran Confederation Installations
+    'tc_': 'terran',        # General Terran
+    'confed_': 'terran',    # Confederation
+    'kif_': 'kilrathi',     # Kilrathi Imperial Fighters
+    'kib_': 'kilrathi',     # Kilrathi Imperial Bombers
+    'kis_': 'kilrathi',     # Kilrathi Imperial Ships
+    'kim_': 'kilrathi',     # Kilrathi Imperial Missiles
+    'kii_': 'kilrathi',     # Kilrathi Imperial Installations
+    'ki_': 'kilrathi',      # General Kilrathi Imperial
+    'kb_': 'kilrathi',      # Kilrathi Base
+    'kil_': 'kilrathi',     # Kilrathi
+    'prf_': 'pirate',       # Pirate Republic Fighters
+    'prs_': 'pirate',       # Pirate Republic Ships
+    'pr_': 'pirate',        # General Pirate
+    'bwf_': 'border_worlds', # Border Worlds Fighters
+    'bws_': 'border_worlds', # Border Worlds Ships
+    'bw_': 'border_worlds',  # General Border Worlds
+    'misc_': 'misc'         # Miscellaneous
+})
+
+# Effect/explosion indicators
+_EFFECT_INDICATORS = frozenset({
+    'explosion', 'blast', 'flash', 'spark', 'trail', 'exhaust',
+    'muzzle', 'impact', 'debris', 'shockwave', 'fireball'
+})
+
+# Weapon-like suffixes/indicators for names found in ships.tbl
+_WEAPON_INDICATORS = ('missile', 'torpedo', 'rocket', 'dart', 'child')
+
+def _keyword_pattern(keywords) -> 're.Pattern[str]':
+    """Compile keywords into one alternation (a single scan per name)"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in sorted(keywords)))
+
+# Substring matchers for the vocabularies above
+_KNOWN_WEAPONS_RE = _keyword_pattern(_KNOWN_WEAPONS)
+_SHIP_NAME_RE = _keyword_pattern(_SHIP_NAME_PATTERNS)
+_EFFECT_INDICATORS_RE = _keyword_pattern(_EFFECT_INDICATORS)
+_WEAPON_INDICATORS_RE = _keyword_pattern(_WEAPON_INDICATORS)
+
+# Name patterns for get_entity_faction / get_ship_class, checked in order
+_FACTION_NAME_RULES = (
+    ('terran', _keyword_pattern(('tc', 'terran', 'confed', 'arrow', 'hellcat', 'excalibur'))),
+    ('kilrathi', _keyword_pattern(('kib', 'kim', 'kilrathi', 'dralthi', 'salthi', 'gratha'))),
+)
+_SHIP_CLASS_RULES = (
+    ('capital_ships', _keyword_pattern(('carrier', 'cruiser', 'destroyer', 'dreadnought', 'corvette',
+                                        'bengal', 'tiger', 'fralthi', 'ralari'))),
+    ('transports', _keyword_pattern(('transport', 'freighter', 'tanker', 'supply'))),
+    ('installations', _keyword_pattern(('base', 'station', 'platform', 'starbase', 'drydock'))),
+)
+
+# Name-based subcategory fallback, checked in order (misc otherwise)
+_SUBCATEGORY_NAME_RULES = (
+    ('fighters', _keyword_pattern(('fighter', 'f-', 'interceptor'))),
+    ('bombers', _keyword_pattern(('bomber', 'b-', 'torpedo'))),
+    ('missiles', _keyword_pattern(('missile', 'rocket', 'torpedo'))),
+    ('capital_ships', _keyword_pattern(('destroyer', 'cruiser', 'carrier', 'corvette', 'frigate'))),
+    ('installations', _keyword_pattern(('installation', 'station', 'base', 'platform'))),
+)
+
+# POF special cases by name indicator, checked in order
+_POF_SPECIAL_RULES = (
+    (EntityType.DEBRIS, _keyword_pattern(('debris', 'rock'))),
+    (EntityType.INSTALLATION, _keyword_pattern(('base', 'station', 'platform'))),
+    (EntityType.EFFECT, _keyword_pattern(('shockwave', 'warp', 'subspace', 'jump'))),
+)
+
+# Faction prefixes ordered longest first so specific prefixes win
+_FACTION_PREFIXES_LONGEST_FIRST = tuple(sorted(_FACTION_PREFIXES.items(), key=lambda x: len(x[0]), reverse=True))
+
+# Primary classification based on table file type
+_TABLE_ENTITY_TYPES = MappingProxyType({
+    TableType.SHIPS: EntityType.SHIP,
+    TableType.WEAPONS: EntityType.WEAPON,
+    TableType.WEAPON_EXPL: EntityType.WEAPON,
+    TableType.ARMOR: EntityType.ARMOR,
+    TableType.FIREBALL: EntityType.EFFECT,
+    TableType.ASTEROID: EntityType.ASTEROID,
+    TableType.SPECIES: EntityType.SPECIES,
+    TableType.SPECIES_DEFS: EntityType.SPECIES,
+    TableType.IFF_DEFS: EntityType.IFF,
+    TableType.MUSIC: EntityType.MUSIC,
+    TableType.SOUNDS: EntityType.SOUND,
+    TableType.LIGHTNING: EntityType.EFFECT,
+    TableType.NEBULA: EntityType.EFFECT,
+    TableType.ICONS: EntityType.UI_ELEMENT,
+    TableType.HUD_GAUGES: EntityType.UI_ELEMENT,
+    TableType.MENU: EntityType.UI_ELEMENT,
+})
+
+# Faction prefix -> entity subcategory
+_PREFIX_SUBCATEGORIES = MappingProxyType({
+    'tcf_': 'fighters',
+    'tcb_': 'bombers', 
+    'tcs_': 'ships',
+    'tcm_': 'missiles',
+    'tci_': 'installations',
+    'kif_': 'fighters',
+    'kib_': 'bombers',
+    'kis_': 'ships', 
+    'kim_': 'missiles',
+    'kii_': 'installations',
+    'prf_': 'fighters',
+    'prs_': 'ships',
+    'bwf_': 'fighters',
+    'bws_': 'ships'
+})
+
+# Image extensions: UI elements under interface directories, effects elsewhere
+_IMAGE_EXTENSIONS = frozenset({'.dds', '.pcx'})
+
+# File extension -> entity type for extensions that need no further analysis
+_EXTENSION_ENTITY_TYPES = MappingProxyType({
+    '.eff': EntityType.EFFECT,
+    '.wav': EntityType.SOUND,
+    '.ogg': EntityType.SOUND,
+    '.fs2': EntityType.MISSION,
+    '.fc2': EntityType.CAMPAIGN,
+    '.tbl': EntityType.UNKNOWN,  # Requires content analysis
+    '.tbm': EntityType.TABLE_MOD,
+    '.vf': EntityType.UI_ELEMENT,
+    '.frc': EntityType.EFFECT,
+    '.hcf': EntityType.UI_ELEMENT
+})
+
+# Table file name -> table type
+_TABLE_FILENAMES = MappingProxyType({
+    'ships.tbl': TableType.SHIPS,
+    'weapons.tbl': TableType.WEAPONS,
+    'weapon_expl.tbl': TableType.WEAPON_EXPL,
+    'armor.tbl': TableType.ARMOR,
+    'species.tbl': TableType.SPECIES,
+    'species_defs.tbl': TableType.SPECIES_DEFS,
+    'iff_defs.tbl': TableType.IFF_DEFS,
+    'fireball.tbl': TableType.FIREBALL,
+    'asteroid.tbl': TableType.ASTEROID,
+    'music.tbl': TableType.MUSIC,
+    'sounds.tbl': TableType.SOUNDS,
+    'lightning.tbl': TableType.LIGHTNING,
+    'nebula.tbl': TableType.NEBULA,
+    'stars.tbl': TableType.STARS,
+    'ai.tbl': TableType.AI,
+    'ai_profiles.tbl': TableType.AI_PROFILES,
+    'autopilot.tbl': TableType.AUTOPILOT,
+    'credits.tbl': TableType.CREDITS,
+    'cutscenes.tbl': TableType.CUTSCENES,
+    'fonts.tbl': TableType.FONTS,
+    'help.tbl': TableType.HELP,
+    'hud_gauges.tbl': TableType.HUD_GAUGES,
+    'icons.tbl': TableType.ICONS,
+    'launchhelp.tbl': TableType.LAUNCH_HELP,
+    'mainhall.tbl': TableType.MAIN_HALL,
+    'medals.tbl': TableType.MEDALS,
+    'menu.tbl': TableType.MENU,
+    'messages.tbl': TableType.MESSAGES,
+    'mflash.tbl': TableType.MFLASH,
+    'pixels.tbl': TableType.PIXELS,
+    'rank.tbl': TableType.RANK,
+    'scripting.tbl': TableType.SCRIPTING,
+    'ssm.tbl': TableType.SSM,
+    'strings.tbl': TableType.STRINGS,
+    'tips.tbl': TableType.TIPS,
+    'traitor.tbl': TableType.TRAITOR,
+    'tstrings.tbl': TableType.TSTRINGS,
+})
+
+@lru_cache(maxsize=4096)
+def _pof_entity_type(stem: str, parent_dir: str) -> EntityType:
+    """Classify a POF model from its lowercased stem and parent directory name"""
+    # New heuristics from user feedback
+    if stem.startswith('ast'):
+        return EntityType.ASTEROID
+    if stem.startswith('sky_'):
+        return EntityType.ENVIRONMENT
+    
+    # Check for weapon model patterns
+    if _KNOWN_WEAPONS_RE.search(stem):
+        return EntityType.WEAPON
+    
+    # Check for ship model patterns
+    if _SHIP_NAME_RE.search(stem):
+        return EntityType.SHIP
+    
+    # Check prefixes
+    for prefix in _FACTION_PREFIXES:
+        if stem.startswith(prefix):
+            # Analyze the rest of the name
+            name_part = stem[len(prefix):]
+            if _KNOWN_WEAPONS_RE.search(name_part):
+                return EntityType.WEAPON
+            else:
+                return EntityType.SHIP
+    
+    # Special cases
+    for entity_type, matcher in _POF_SPECIAL_RULES:
+        if matcher.search(stem):
+            return entity_type
+    
+    # Fallback for other pof files in hermes_models
+    if parent_dir == 'hermes_models':
+        return EntityType.MISC
+    
+    return EntityType.UNKNOWN
+
+@lru_cache(maxsize=2048)
+def _entity_faction(entity_name: str) -> str:
+    """Determine entity faction from name patterns"""
+    entity_lower = entity_name.lower()
+    
+    # Check prefixes
+    for prefix, faction in _FACTION_PREFIXES.items():
+        if entity_lower.startswith(prefix):
+            return faction
+    
+    # Check naming patterns
+    for faction, matcher in _FACTION_NAME_RULES:
+        if matcher.search(entity_lower):
+            return faction
+    
+    return 'unknown'
+
+@lru_cache(maxsize=2048)
+def _ship_class(ship_name: str) -> str:
+    """Determine ship class from name patterns"""
+    name_lower = ship_name.lower()
+    
+    # Capital ship, transport and installation indicators
+    for ship_class, matcher in _SHIP_CLASS_RULES:
+        if matcher.search(name_lower):
+            return ship_class
+    
+    # Default to fighters
+    return 'fighters'
+
 class EntityClassifier:
     """
     Enhanced entity classifier that properly categorizes WCS entities
@@ -98,57 +360,11 @@ class EntityClassifier:
         # Normalize path for WSL compatibility
         self.source_dir = Path(str(source_dir).replace('\\', '/'))
         
-        # Known weapon names (missiles, projectiles) that might appear in ships.tbl
-        self.known_weapons = {
-            'dart', 'pilum', 'javelin', 'spiculum', 'porcupine', 'lance', 
-            'warhammer', 'torpedo', 'missile', 'paw', 'fang', 'stalker', 
-            'claw', 'scratch', 'spear', 'predator'
-        }
-        
-        # Known ship name patterns
-        self.ship_name_patterns = {
-            # Terran ships
-            'hornet', 'rapier', 'excalibur', 'thunderbolt', 'sabre', 'broadsword',
-            'epee', 'gladius', 'stiletto', 'centurion', 'orion', 'demon',
-            # Kilrathi ships  
-            'dralthi', 'salthi', 'sartha', 'gothri', 'jalthi', 'gratha',
-            'fralthi', 'ralari', 'kamrani', 'snakeir', 'bloodfang',
-            # Capital ships
-            'carrier', 'destroyer', 'cruiser', 'corvette', 'frigate',
-            'dreadnought', 'transport', 'tanker', 'bengal', 'tiger'
-        }
-        
-        # Enhanced faction prefixes from comprehensive campaign analysis
-        self.faction_prefixes = {
-            'tcf_': 'terran',       # Terran Confederation Fighters
-            'tcb_': 'terran',       # Terran Confederation Bombers  
-            'tcs_': 'terran',       # Terran Confederation Ships
-            'tcm_': 'terran',       # Terran Confederation Missiles
-            'tci_': 'terran',       # Terran Confederation Installations
-            'tc_': 'terran',        # General Terran
-            'confed_': 'terran',    # Confederation
-            'kif_': 'kilrathi',     # Kilrathi Imperial Fighters
-            'kib_': 'kilrathi',     # Kilrathi Imperial Bombers
-            'kis_': 'kilrathi',     # Kilrathi Imperial Ships
-            'kim_': 'kilrathi',     # Kilrathi Imperial Missiles
-            'kii_': 'kilrathi',     # Kilrathi Imperial Installations
-            'ki_': 'kilrathi',      # General Kilrathi Imperial
-            'kb_': 'kilrathi',      # Kilrathi Base
-            'kil_': 'kilrathi',     # Kilrathi
-            'prf_': 'pirate',       # Pirate Republic Fighters
-            'prs_': 'pirate',       # Pirate Republic Ships
-            'pr_': 'pirate',        # General Pirate
-            'bwf_': 'border_worlds', # Border Worlds Fighters
-            'bws_': 'border_worlds', # Border Worlds Ships
-            'bw_': 'border_worlds',  # General Border Worlds
-            'misc_': 'misc'         # Miscellaneous
-        }
-        
-        # Effect/explosion indicators
-        self.effect_indicators = {
-            'explosion', 'blast', 'flash', 'spark', 'trail', 'exhaust',
-            'muzzle', 'impact', 'debris', 'shockwave', 'fireball'
-        }
+        # Classification vocabularies (shared, read-only module constants)
+        self.known_weapons = _KNOWN_WEAPONS
+        self.ship_name_patterns = _SHIP_NAME_PATTERNS
+        self.faction_prefixes = _FACTION_PREFIXES
+        self.effect_indicators = _EFFECT_INDICATORS
         
         # Table parsing cache
         self._table_cache: Dict[str, Set[str]] = {}
@@ -181,26 +397,7 @@ class EntityClassifier:
     
     def _classify_by_table_type(self, table_type: TableType) -> EntityType:
         """Primary classification based on table file type"""
-        table_mapping = {
-            TableType.SHIPS: EntityType.SHIP,
-            TableType.WEAPONS: EntityType.WEAPON,
-            TableType.WEAPON_EXPL: EntityType.WEAPON,
-            TableType.ARMOR: EntityType.ARMOR,
-            TableType.FIREBALL: EntityType.EFFECT,
-            TableType.ASTEROID: EntityType.ASTEROID,
-            TableType.SPECIES: EntityType.SPECIES,
-            TableType.SPECIES_DEFS: EntityType.SPECIES,
-            TableType.IFF_DEFS: EntityType.IFF,
-            TableType.MUSIC: EntityType.MUSIC,
-            TableType.SOUNDS: EntityType.SOUND,
-            TableType.LIGHTNING: EntityType.EFFECT,
-            TableType.NEBULA: EntityType.EFFECT,
-            TableType.ICONS: EntityType.UI_ELEMENT,
-            TableType.HUD_GAUGES: EntityType.UI_ELEMENT,
-            TableType.MENU: EntityType.UI_ELEMENT,
-        }
-        
-        return table_mapping.get(table_type, EntityType.UNKNOWN)
+        return _TABLE_ENTITY_TYPES.get(table_type, EntityType.UNKNOWN)
     
     def _validate_ship_classification(self, entity_name: str, entity_lower: str) -> EntityType:
         """
@@ -208,21 +405,19 @@ class EntityClassifier:
         This is the critical fix for the current mapping issues.
         """
         # Check if entity name matches known weapon patterns
-        for weapon_name in self.known_weapons:
-            if weapon_name in entity_lower:
-                logger.debug(f"Entity '{entity_name}' reclassified as weapon (found in ships.tbl)")
-                return EntityType.WEAPON
+        if _KNOWN_WEAPONS_RE.search(entity_lower):
+            logger.debug(f"Entity '{entity_name}' reclassified as weapon (found in ships.tbl)")
+            return EntityType.WEAPON
         
         # Check for weapon-like suffixes/indicators
-        weapon_indicators = ['missile', 'torpedo', 'rocket', 'dart', 'child']
-        if any(indicator in entity_lower for indicator in weapon_indicators):
+        if _WEAPON_INDICATORS_RE.search(entity_lower):
             logger.debug(f"Entity '{entity_name}' reclassified as weapon (weapon indicator)")
             return EntityType.WEAPON
         
         # Check for model file patterns that indicate weapons
         if '#' in entity_name:  # Weapon variants often have # suffix
-            base_name = entity_name.split('#')[0].lower()
-            if any(weapon in base_name for weapon in self.known_weapons):
+            base_name = entity_lower.split('#')[0]
+            if _KNOWN_WEAPONS_RE.search(base_name):
                 logger.debug(f"Entity '{entity_name}' reclassified as weapon (variant)")
                 return EntityType.WEAPON
         
@@ -230,9 +425,8 @@ class EntityClassifier:
         for prefix, faction in self.faction_prefixes.items():
             if entity_lower.startswith(prefix):
                 # If it has a ship prefix and matches ship patterns, it's likely a ship
-                for ship_pattern in self.ship_name_patterns:
-                    if ship_pattern in entity_lower:
-                        return EntityType.SHIP
+                if _SHIP_NAME_RE.search(entity_lower):
+                    return EntityType.SHIP
         
         # Default to ship if found in ships.tbl and no weapon indicators
         return EntityType.SHIP
@@ -242,15 +436,15 @@ class EntityClassifier:
         """Fallback classification using naming patterns and context"""
         
         # Check for ship patterns
-        if any(pattern in entity_lower for pattern in self.ship_name_patterns):
+        if _SHIP_NAME_RE.search(entity_lower):
             return EntityType.SHIP
         
         # Check for weapon patterns
-        if any(weapon in entity_lower for weapon in self.known_weapons):
+        if _KNOWN_WEAPONS_RE.search(entity_lower):
             return EntityType.WEAPON
         
         # Check for effect patterns
-        if any(effect in entity_lower for effect in self.effect_indicators):
+        if _EFFECT_INDICATORS_RE.search(entity_lower):
             return EntityType.EFFECT
         
         # Check file context if provided
@@ -279,12 +473,12 @@ class EntityClassifier:
         Returns:
             Faction name (terran, kilrathi, pirate, border_worlds, misc, unknown)
         """
-        entity_lower = entity_name.lower()
-        
+        return self._detect_faction(entity_name, entity_name.lower())
+    
+    def _detect_faction(self, entity_name: str, entity_lower: str) -> str:
+        """detect_faction() for callers that already hold the lowercased name"""
         # Check faction prefixes (longest first to avoid conflicts)
-        sorted_prefixes = sorted(self.faction_prefixes.items(), key=lambda x: len(x[0]), reverse=True)
-        
-        for prefix, faction in sorted_prefixes:
+        for prefix, faction in _FACTION_PREFIXES_LONGEST_FIRST:
             if entity_lower.startswith(prefix):
                 logger.debug(f"Entity '{entity_name}' classified as {faction} faction (prefix: {prefix})")
                 return faction
@@ -304,42 +498,16 @@ class EntityClassifier:
         """
         entity_lower = entity_name.lower()
         
-        # Map prefixes to subcategories
-        prefix_to_subcategory = {
-            'tcf_': 'fighters',
-            'tcb_': 'bombers', 
-            'tcs_': 'ships',
-            'tcm_': 'missiles',
-            'tci_': 'installations',
-            'kif_': 'fighters',
-            'kib_': 'bombers',
-            'kis_': 'ships', 
-            'kim_': 'missiles',
-            'kii_': 'installations',
-            'prf_': 'fighters',
-            'prs_': 'ships',
-            'bwf_': 'fighters',
-            'bws_': 'ships'
-        }
-        
         # Check for specific prefix match
-        for prefix, subcategory in prefix_to_subcategory.items():
+        for prefix, subcategory in _PREFIX_SUBCATEGORIES.items():
             if entity_lower.startswith(prefix):
                 return subcategory
         
         # Fallback to pattern-based classification
-        if any(pattern in entity_lower for pattern in ['fighter', 'f-', 'interceptor']):
-            return 'fighters'
-        elif any(pattern in entity_lower for pattern in ['bomber', 'b-', 'torpedo']):
-            return 'bombers'
-        elif any(pattern in entity_lower for pattern in ['missile', 'rocket', 'torpedo']):
-            return 'missiles'
-        elif any(pattern in entity_lower for pattern in ['destroyer', 'cruiser', 'carrier', 'corvette', 'frigate']):
-            return 'capital_ships'
-        elif any(pattern in entity_lower for pattern in ['installation', 'station', 'base', 'platform']):
-            return 'installations'
-        else:
-            return 'misc'
+        for subcategory, matcher in _SUBCATEGORY_NAME_RULES:
+            if matcher.search(entity_lower):
+                return subcategory
+        return 'misc'
     
     def get_classification_confidence(self, entity_name: str, table_type: TableType) -> float:
         """
@@ -360,128 +528,40 @@ class EntityClassifier:
             confidence += 0.7
         
         # Medium confidence for faction prefix match
-        faction = self.detect_faction(entity_name)
+        faction = self._detect_faction(entity_name, entity_lower)
         if faction != 'unknown':
             confidence += 0.2
         
         # Low confidence for name pattern match
-        if any(pattern in entity_lower for pattern in self.ship_name_patterns):
+        if _SHIP_NAME_RE.search(entity_lower):
             confidence += 0.1
         
         return min(confidence, 1.0)
     
     def classify_by_file_extension(self, file_path: Path) -> EntityType:
         """Classify entity based on file extension and location"""
-        suffix = file_path.suffix.lower()
-        parent_dir = file_path.parent.name.lower()
-        
-        extension_mapping = {
-            '.pof': self._classify_pof_file(file_path),
-            '.dds': EntityType.UI_ELEMENT if 'interface' in parent_dir else EntityType.EFFECT,
-            '.pcx': EntityType.UI_ELEMENT if 'interface' in parent_dir else EntityType.EFFECT,
-            '.eff': EntityType.EFFECT,
-            '.wav': EntityType.SOUND,
-            '.ogg': EntityType.SOUND,
-            '.fs2': EntityType.MISSION,
-            '.fc2': EntityType.CAMPAIGN,
-            '.tbl': EntityType.UNKNOWN,  # Requires content analysis
-            '.tbm': EntityType.TABLE_MOD,
-            '.vf': EntityType.UI_ELEMENT,
-            '.frc': EntityType.EFFECT,
-            '.hcf': EntityType.UI_ELEMENT
-        }
-        
-        return extension_mapping.get(suffix, EntityType.UNKNOWN)
+        return self.classify_by_file_parts(file_path.suffix.lower(), file_path.stem, file_path.parent.name)
+    
+    def classify_by_file_parts(self, file_ext: str, file_stem: str, parent_dir: str) -> EntityType:
+        """Classify entity from pre-split path parts (file_ext lower-cased, with dot)"""
+        if file_ext == '.pof':
+            return _pof_entity_type(file_stem.lower(), parent_dir)
+        if file_ext in _IMAGE_EXTENSIONS:
+            return EntityType.UI_ELEMENT if 'interface' in parent_dir.lower() else EntityType.EFFECT
+        
+        return _EXTENSION_ENTITY_TYPES.get(file_ext, EntityType.UNKNOWN)
     
     def _classify_pof_file(self, pof_path: Path) -> EntityType:
         """Classify POF model files based on naming patterns"""
-        stem = pof_path.stem.lower()
-        
-        # New heuristics from user feedback
-        if stem.startswith('ast'):
-            return EntityType.ASTEROID
-        if stem.startswith('sky_'):
-            return EntityType.ENVIRONMENT
-            
-        # Check for weapon model patterns
-        if any(weapon in stem for weapon in self.known_weapons):
-            return EntityType.WEAPON
-        
-        # Check for ship model patterns
-        if any(ship in stem for ship in self.ship_name_patterns):
-            return EntityType.SHIP
-        
-        # Check prefixes
-        for prefix, faction in self.faction_prefixes.items():
-            if stem.startswith(prefix):
-                # Analyze the rest of the name
-                name_part = stem[len(prefix):]
-                if any(weapon in name_part for weapon in self.known_weapons):
-                    return EntityType.WEAPON
-                else:
-                    return EntityType.SHIP
-        
-        # Special cases
-        if any(indicator in stem for indicator in ['debris', 'rock']):
-            return EntityType.DEBRIS
-        elif any(indicator in stem for indicator in ['base', 'station', 'platform']):
-            return EntityType.INSTALLATION
-        elif any(indicator in stem for indicator in ['shockwave', 'warp', 'subspace', 'jump']):
-            return EntityType.EFFECT
-
-        # Fallback for other pof files in hermes_models
-        if pof_path.parent.name == 'hermes_models':
-            return EntityType.MISC
-
-        return EntityType.UNKNOWN
+        return _pof_entity_type(pof_path.stem.lower(), pof_path.parent.name)
     
     def determine_table_type(self, table_file: Path) -> TableType:
         """Determine table type from filename"""
         filename = table_file.name.lower()
         
-        # Direct mappings
-        direct_mappings = {
-            'ships.tbl': TableType.SHIPS,
-            'weapons.tbl': TableType.WEAPONS,
-            'weapon_expl.tbl': TableType.WEAPON_EXPL,
-            'armor.tbl': TableType.ARMOR,
-            'species.tbl': TableType.SPECIES,
-            'species_defs.tbl': TableType.SPECIES_DEFS,
-            'iff_defs.tbl': TableType.IFF_DEFS,
-            'fireball.tbl': TableType.FIREBALL,
-            'asteroid.tbl': TableType.ASTEROID,
-            'music.tbl': TableType.MUSIC,
-            'sounds.tbl': TableType.SOUNDS,
-            'lightning.tbl': TableType.LIGHTNING,
-            'nebula.tbl': TableType.NEBULA,
-            'stars.tbl': TableType.STARS,
-            'ai.tbl': TableType.AI,
-            'ai_profiles.tbl': TableType.AI_PROFILES,
-            'autopilot.tbl': TableType.AUTOPILOT,
-            'credits.tbl': TableType.CREDITS,
-            'cutscenes.tbl': TableType.CUTSCENES,
-            'fonts.tbl': TableType.FONTS,
-            'help.tbl': TableType.HELP,
-            'hud_gauges.tbl': TableType.HUD_GAUGES,
-            'icons.tbl': TableType.ICONS,
-            'launchhelp.tbl': TableType.LAUNCH_HELP,
-            'mainhall.tbl': TableType.MAIN_HALL,
-            'medals.tbl': TableType.MEDALS,
-            'menu.tbl': TableType.MENU,
-            'messages.tbl': TableType.MESSAGES,
-            'mflash.tbl': TableType.MFLASH,
-            'pixels.tbl': TableType.PIXELS,
-            'rank.tbl': TableType.RANK,
-            'scripting.tbl': TableType.SCRIPTING,
-            'ssm.tbl': TableType.SSM,
-            'strings.tbl': TableType.STRINGS,
-            'tips.tbl': TableType.TIPS,
-            'traitor.tbl': TableType.TRAITOR,
-            'tstrings.tbl': TableType.TSTRINGS,
-        }
-        
-        if filename in direct_mappings:
-            return direct_mappings[filename]
+        table_type = _TABLE_FILENAMES.get(filename)
+        if table_type is not None:
+            return table_type
         
         # Pattern-based detection
         if 'ship' in filename:
@@ -499,43 +579,8 @@ class EntityClassifier:
     
     def get_entity_faction(self, entity_name: str) -> str:
         """Determine entity faction from name patterns"""
-        entity_lower = entity_name.lower()
-        
-        # Check prefixes
-        for prefix, faction in self.faction_prefixes.items():
-            if entity_lower.startswith(prefix):
-                return faction
-        
-        # Check naming patterns
-        terran_patterns = ['tc', 'terran', 'confed', 'arrow', 'hellcat', 'excalibur']
-        kilrathi_patterns = ['kib', 'kim', 'kilrathi', 'dralthi', 'salthi', 'gratha']
-        
-        if any(pattern in entity_lower for pattern in terran_patterns):
-            return 'terran'
-        elif any(pattern in entity_lower for pattern in kilrathi_patterns):
-            return 'kilrathi'
-        
-        return 'unknown'
+        return _entity_faction(entity_name)
     
     def get_ship_class(self, ship_name: str) -> str:
         """Determine ship class from name patterns"""
-        name_lower = ship_name.lower()
-        
-        # Capital ship indicators
-        capital_patterns = ['carrier', 'cruiser', 'destroyer', 'dreadnought', 'corvette', 
-                          'bengal', 'tiger', 'fralthi', 'ralari']
-        if any(pattern in name_lower for pattern in capital_patterns):
-            return 'capital_ships'
-        
-        # Transport indicators
-        transport_patterns = ['transport', 'freighter', 'tanker', 'supply']
-        if any(pattern in name_lower for pattern in transport_patterns):
-            return 'transports'
-        
-        # Installation indicators
-        installation_patterns = ['base', 'station', 'platform', 'starbase', 'drydock']
-        if any(pattern in name_lower for pattern in installation_patterns):
-            return 'installations'
-        
-        # Default to fighters
-        return 'fighters'
+        return _ship_class(ship_name)
@@ -12,12 +12,41 @@ Story: DM-003 - Asset Organization and Cataloging
 
 import logging
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 
+from .path_utils import iter_directory_files
+
+# orjson is optional; it parses large glTF/JSON files much faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+
+def _load_json_file(file_path: Path, encoding: Optional[str] = None) -> Any:
+    """
+    Parse a JSON file, using orjson when it is available.
+    
+    orjson accepts a strict subset of what json does, so files it rejects
+    are re-parsed with json to keep the same results and error messages.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(file_path.read_bytes())
+        except orjson.JSONDecodeError:
+            pass
+    
+    with open(file_path, 'r', encoding=encoding) as f:
+        return json.load(f)
+
 @dataclass
 class ValidationResult:
     """Result of asset validation"""
@@ -50,6 +79,10 @@ class FormatValidator:
             '.tscn': self._validate_tscn,
             '.json': self._validate_json
         }
+        
+        # Results from validate_directory, keyed by path and reused while the
+        # file's (mtime_ns, size) is unchanged
+        self._result_cache: Dict[str, Tuple[int, int, ValidationResult]] = {}
     
     def validate_file(self, file_path: Path) -> ValidationResult:
         """
@@ -209,27 +242,26 @@ class FormatValidator:
         result = {'valid': False, 'issues': [], 'warnings': [], 'metadata': {}}
         
         try:
-            with open(file_path, 'r') as f:
-                gltf_data = json.load(f)
-                
-                # Check required fields
-                if 'asset' not in gltf_data:
-                    result['issues'].append("Missing required 'asset' field")
-                else:
-                    asset = gltf_data['asset']
-                    result['metadata']['version'] = asset.get('version', 'unknown')
-                    result['metadata']['generator'] = asset.get('generator', 'unknown')
-                
-                # Check for scenes
-                if 'scenes' in gltf_data:
-                    result['metadata']['scene_count'] = len(gltf_data['scenes'])
-                
-                # Check for nodes
-                if 'nodes' in gltf_data:
-                    result['metadata']['node_count'] = len(gltf_data['nodes'])
-                
-                result['valid'] = True
-                
+            gltf_data = _load_json_file(file_path)
+            
+            # Check required fields
+            if 'asset' not in gltf_data:
+                result['issues'].append("Missing required 'asset' field")
+            else:
+                asset = gltf_data['asset']
+                result['metadata']['version'] = asset.get('version', 'unknown')
+                result['metadata']['generator'] = asset.get('generator', 'unknown')
+            
+            # Check for scenes
+            if 'scenes' in gltf_data:
+                result['metadata']['scene_count'] = len(gltf_data['scenes'])
+            
+            # Check for nodes
+            if 'nodes' in gltf_data:
+                result['metadata']['node_count'] = len(gltf_data['nodes'])
+            
+            result['valid'] = True
+            
         except json.JSONDecodeError as e:
             result['issues'].append(f"Invalid JSON: {str(e)}")
         except Exception as e:
@@ -348,19 +380,18 @@ class FormatValidator:
         result = {'valid': False, 'issues': [], 'warnings': [], 'metadata': {}}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-                result['valid'] = True
-                result['metadata']['format'] = 'JSON'
-                result['metadata']['data_type'] = type(data).__name__
+            data = _load_json_file(file_path, encoding='utf-8')
+            
+            result['valid'] = True
+            result['metadata']['format'] = 'JSON'
+            result['metadata']['data_type'] = type(data).__name__
+            
+            # Count top-level keys if it's an object
+            if isinstance(data, dict):
+                result['metadata']['key_count'] = len(data)
+            elif isinstance(data, list):
+                result['metadata']['item_count'] = len(data)
                 
-                # Count top-level keys if it's an object
-                if isinstance(data, dict):
-                    result['metadata']['key_count'] = len(data)
-                elif isinstance(data, list):
-                    result['metadata']['item_count'] = len(data)
-                    
         except json.JSONDecodeError as e:
             result['issues'].append(f"Invalid JSON: {str(e)}")
         except UnicodeDecodeError:
@@ -370,33 +401,54 @@ class FormatValidator:
         
         return result
     
-    def validate_directory(self, directory: Path, recursive: bool = True) -> List[ValidationResult]:
+    def validate_directory(self, directory: Path, recursive: bool = True,
+                           max_workers: Optional[int] = None) -> List[ValidationResult]:
         """
         Validate all supported files in a directory.
         
+        Files are listed with os.scandir and validated on a thread pool so
+        disk reads overlap. Files whose modification time and size are
+        unchanged since a previous call on this validator reuse the earlier
+        result.
+        
         Args:
             directory: Directory to validate
             recursive: Whether to validate subdirectories
+            max_workers: Validation threads (ThreadPoolExecutor default if None)
             
         Returns:
             List of validation results
         """
-        results = []
-        
         if not directory.exists():
             logger.error(f"Directory does not exist: {directory}")
-            return results
-        
-        # Get all files
-        pattern = "**/*" if recursive else "*"
-        for file_path in directory.glob(pattern):
-            if file_path.is_file():
-                extension = file_path.suffix.lower()
-                if extension in self.supported_formats:
-                    result = self.validate_file(file_path)
-                    results.append(result)
-        
-        return results
+            return []
+        
+        entries = [
+            entry for entry in iter_directory_files(directory, recursive)
+            if os.path.splitext(entry.name)[1].lower() in self.supported_formats
+        ]
+        if len(entries) <= 1:
+            return [self._validate_entry(entry) for entry in entries]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._validate_entry, entries))
+    
+    def _validate_entry(self, entry: os.DirEntry) -> ValidationResult:
+        """Validate a scanned file, reusing the cached result if it has not changed"""
+        file_path = Path(entry.path)
+        try:
+            stat = entry.stat()
+        except OSError:
+            return self.validate_file(file_path)
+        
+        key = entry.path
+        cached = self._result_cache.get(key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        
+        result = self.validate_file(file_path)
+        self._result_cache[key] = (stat.st_mtime_ns, stat.st_size, result)
+        return result
     
     def generate_validation_report(self, results: List[ValidationResult]) -> Dict[str, Any]:
         """
@@ -13,12 +13,149 @@ Epic: EPIC-003 - Data Migration & Conversion Tools
 
 import re
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 from .entity_classifier import EntityType, EntityClassifier
 
 logger = logging.getLogger(__name__)
 
+# ASCII characters outside [\w-] mapped to '_' (same result as re.sub(r'[^\w\-_]', '_', ...))
+_ASCII_CLEAN_TABLE = str.maketrans({
+    chr(code): '_' for code in range(128) if not (chr(code).isalnum() or chr(code) in '_-')
+})
+_NON_WORD_RE = re.compile(r'[^\w\-_]')
+_MULTI_UNDERSCORE_RE = re.compile(r'_+')
+
+# Source extension -> target extension
+_FORMAT_CONVERSIONS = {
+    '.dds': '.png',      # DirectDraw Surface → PNG
+    '.pcx': '.png',      # PCX → PNG  
+    '.tga': '.png',      # Targa → PNG
+    '.tbl': '.tres',     # Table → Godot Resource
+    '.fs2': '.tres',     # Mission → Godot Resource
+    '.fc2': '.tres',     # Campaign → Godot Resource
+    '.pof': '.glb',      # POF Model → GLB
+    '.eff': '.tscn',     # Effects → SpriteSheet png + AnimatedSprite2D scene
+    '.vf': '.tres',      # Font → Godot Font Resource
+    '.frc': '.tres',     # Force Config → Godot Resource
+    '.hcf': '.tres',     # HUD Config → Godot Resource  
+    '.txt': '.tres',     # Text/Fiction → Godot Resource
+    '.tbm': '.tres',     # Table Mod → Godot Resource
+    # Audio files stay the same format
+    '.wav': '.ogg',
+    '.ogg': '.ogg',
+}
+
+# Special handling for animation files
+_ANIMATION_CONVERSIONS = {
+    '.ani': '_spritesheet.png',  # Animation → sprite sheet
+    '.eff': '.tscn'              # Effect definition → Godot resource
+}
+
+# Scene directory per entity type (ships are resolved by faction/class instead)
+_SCENE_DIRECTORIES = {
+    EntityType.WEAPON: "campaigns/wing_commander_saga/weapons",
+    EntityType.EFFECT: "campaigns/wing_commander_saga/effects",
+    EntityType.INSTALLATION: "campaigns/wing_commander_saga/installations",
+    EntityType.ASTEROID: "campaigns/wing_commander_saga/environment/asteroids",
+    EntityType.DEBRIS: "campaigns/wing_commander_saga/environment/debris",
+}
+
+# WCS faction naming conventions, checked in order
+_FACTION_PREFIXES = (
+    ('terran', ('tcf_', 'confed', 'terran', 'tc_')),
+    ('kilrathi', ('kib_', 'kilrathi', 'kat', 'kim_')),
+    ('border_worlds', ('bw_', 'border_world')),
+)
+_KILRATHI_SHIP_NAMES = ('dralthi', 'salthi', 'gratha', 'jalthi', 'fralthi',
+                        'paktahn', 'paw', 'fang', 'stalker', 'claw')
+_TERRAN_SHIP_NAMES = ('arrow', 'hellcat', 'excalibur', 'rapier', 'ferret',
+                      'hornet', 'sabre', 'broadsword', 'thunderbolt')
+
+# Ship class naming patterns, checked in order (fighters otherwise)
+_SHIP_CLASS_PATTERNS = (
+    ('capital_ships', ('carrier', 'cruiser', 'destroyer', 'dreadnought',
+                       'corvette', 'dreadnaught', 'bengal', 'tiger',
+                       'fralthi', 'ralari')),
+    ('transports', ('transport', 'freighter', 'tanker', 'supply')),
+    ('installations', ('base', 'station', 'platform', 'starbase',
+                       'drydock', 'depot')),
+)
+
+# Material type by '_' suffix, checked in order (diffuse otherwise)
+_MATERIAL_TYPE_RULES = (
+    ('normal', re.compile(r'_(?:normal|n|nrm|bump)')),
+    ('specular', re.compile(r'_(?:specular|spec|s|shine)')),
+    ('glow', re.compile(r'_(?:glow|g|emissive|emit)')),
+)
+
+# Pilot voice file names, e.g. 01_greywolf_01.wav (group 1 = mission number)
+_MISSION_NUMBER_RE = re.compile(r'^(\d{2})_\w+_\d{2}\.')
+
+# Known control tower locations from analysis
+_CONTROL_LOCATIONS = ('hermes', 'bradshaw', 'wellington', 'lexington')
+
+def _keyword_pattern(keywords) -> 're.Pattern[str]':
+    """Compile substring keywords into one alternation (a single scan per name)"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+# (label, matcher) rules in priority order: faction prefixes, then ship names
+_FACTION_RULES = tuple(
+    (faction, _keyword_pattern(prefixes)) for faction, prefixes in _FACTION_PREFIXES
+) + (
+    ('kilrathi', _keyword_pattern(_KILRATHI_SHIP_NAMES)),
+    ('terran', _keyword_pattern(_TERRAN_SHIP_NAMES)),
+)
+_SHIP_CLASS_RULES = tuple(
+    (ship_class, _keyword_pattern(patterns)) for ship_class, patterns in _SHIP_CLASS_PATTERNS
+)
+
+# Audio type by filename keyword, checked in order (misc otherwise)
+_AUDIO_TYPE_RULES = (
+    ('engine_sounds', _keyword_pattern(('engine', 'aburn', 'throttle', 'afterburner'))),
+    ('weapon_sounds', _keyword_pattern(('missile', 'laser', 'ion', 'cannon', 'fire'))),
+    ('shield_sounds', _keyword_pattern(('shield', 'hull', 'damage'))),
+    ('ui_sounds', _keyword_pattern(('button', 'menu', 'alert', 'beep'))),
+)
+
+@lru_cache(maxsize=4096)
+def _clean_entity(entity_name: str) -> str:
+    """Lowercase an entity name and replace non-word characters with single underscores"""
+    clean_name = entity_name.lower()
+    if clean_name.isascii():
+        clean_name = clean_name.translate(_ASCII_CLEAN_TABLE)
+    else:
+        clean_name = _NON_WORD_RE.sub('_', clean_name)
+    if '__' in clean_name:
+        clean_name = _MULTI_UNDERSCORE_RE.sub('_', clean_name)
+    return clean_name.strip('_')
+
+@lru_cache(maxsize=2048)
+def _faction_for_name(entity_name: str) -> str:
+    """Determine faction from entity name using WCS naming conventions"""
+    name_lower = entity_name.lower()
+    
+    # WCS faction prefixes, then ship name patterns
+    for faction, matcher in _FACTION_RULES:
+        if matcher.search(name_lower):
+            return faction
+    
+    # Default to terran for unknown
+    return 'terran'
+
+@lru_cache(maxsize=2048)
+def _ship_class_for_name(entity_name: str) -> str:
+    """Determine ship class from entity name using WCS patterns"""
+    name_lower = entity_name.lower()
+    
+    for ship_class, matcher in _SHIP_CLASS_RULES:
+        if matcher.search(name_lower):
+            return ship_class
+    
+    # Fighter by default
+    return 'fighters'
+
 class TargetPathResolver:
     """
     Generates clean target paths following the target/assets/CLAUDE.md structure
@@ -41,31 +178,9 @@ class TargetPathResolver:
         else:
             self.entity_classifier = None
         
-        # Format conversion mappings
-        self.format_conversions = {
-            '.dds': '.png',      # DirectDraw Surface → PNG
-            '.pcx': '.png',      # PCX → PNG  
-            '.tga': '.png',      # Targa → PNG
-            '.tbl': '.tres',     # Table → Godot Resource
-            '.fs2': '.tres',     # Mission → Godot Resource
-            '.fc2': '.tres',     # Campaign → Godot Resource
-            '.pof': '.glb',      # POF Model → GLB
-            '.eff': '.tscn',     # Effects → SpriteSheet png + AnimatedSprite2D scene
-            '.vf': '.tres',      # Font → Godot Font Resource
-            '.frc': '.tres',     # Force Config → Godot Resource
-            '.hcf': '.tres',     # HUD Config → Godot Resource  
-            '.txt': '.tres',     # Text/Fiction → Godot Resource
-            '.tbm': '.tres',     # Table Mod → Godot Resource
-            # Audio files stay the same format
-            '.wav': '.ogg',
-            '.ogg': '.ogg',
-        }
-        
-        # Special handling for animation files
-        self.animation_conversions = {
-            '.ani': '_spritesheet.png',  # Animation → sprite sheet
-            '.eff': '.tscn'              # Effect definition → Godot resource
-        }
+        # Format conversion mappings (shared module-level tables)
+        self.format_conversions = _FORMAT_CONVERSIONS
+        self.animation_conversions = _ANIMATION_CONVERSIONS
     
     def resolve_scene_path(self, entity_name: str, entity_type: EntityType) -> str:
         """
@@ -80,28 +195,14 @@ class TargetPathResolver:
         """
         clean_name = self._clean_entity_name(entity_name)
         
+        # Ships are further organized by faction and ship class
         if entity_type == EntityType.SHIP:
             faction = self._determine_faction(entity_name)
             ship_class = self._determine_ship_class(entity_name)
             return f"campaigns/wing_commander_saga/ships/{faction}/{ship_class}/{clean_name}.tscn"
         
-        elif entity_type == EntityType.WEAPON:
-            return f"campaigns/wing_commander_saga/weapons/{clean_name}.tscn"
-        
-        elif entity_type == EntityType.EFFECT:
-            return f"campaigns/wing_commander_saga/effects/{clean_name}.tscn"
-        
-        elif entity_type == EntityType.INSTALLATION:
-            return f"campaigns/wing_commander_saga/installations/{clean_name}.tscn"
-        
-        elif entity_type == EntityType.ASTEROID:
-            return f"campaigns/wing_commander_saga/environment/asteroids/{clean_name}.tscn"
-            
-        elif entity_type == EntityType.DEBRIS:
-            return f"campaigns/wing_commander_saga/environment/debris/{clean_name}.tscn"
-            
-        else:
-            return f"scenes/misc/{clean_name}.tscn"
+        scene_dir = _SCENE_DIRECTORIES.get(entity_type, "scenes/misc")
+        return f"{scene_dir}/{clean_name}.tscn"
     
     def _convert_file_format(self, file_stem: str, file_ext: str) -> str:
         """Convert source file format to target format"""
@@ -111,69 +212,20 @@ class TargetPathResolver:
             return f"{file_stem}_spritesheet.png"
         
         # Get target extension with conversion
-        target_ext = self.format_conversions.get(file_ext, file_ext)
+        target_ext = _FORMAT_CONVERSIONS.get(file_ext, file_ext)
         return f"{file_stem}{target_ext}"
     
     def _clean_entity_name(self, entity_name: str) -> str:
         """Clean entity name for filesystem compatibility"""
-        # Remove special characters and replace with underscores
-        clean_name = re.sub(r'[^\w\-_]', '_', entity_name.lower())
-        # Remove multiple consecutive underscores
-        clean_name = re.sub(r'_+', '_', clean_name)
-        # Remove leading/trailing underscores
-        return clean_name.strip('_')
+        return _clean_entity(entity_name)
     
     def _determine_faction(self, entity_name: str) -> str:
         """Determine faction from entity name using WCS naming conventions"""
-        name_lower = entity_name.lower()
-        
-        # WCS faction prefixes
-        if any(prefix in name_lower for prefix in ['tcf_', 'confed', 'terran', 'tc_']):
-            return 'terran'
-        elif any(prefix in name_lower for prefix in ['kib_', 'kilrathi', 'kat', 'kim_']):
-            return 'kilrathi'
-        elif any(prefix in name_lower for prefix in ['bw_', 'border_world']):
-            return 'border_worlds'
-        
-        # Ship name patterns
-        kilrathi_patterns = ['dralthi', 'salthi', 'gratha', 'jalthi', 'fralthi', 
-                           'paktahn', 'paw', 'fang', 'stalker', 'claw']
-        if any(pattern in name_lower for pattern in kilrathi_patterns):
-            return 'kilrathi'
-        
-        # Terran ship name patterns
-        terran_patterns = ['arrow', 'hellcat', 'excalibur', 'rapier', 'ferret', 
-                         'hornet', 'sabre', 'broadsword', 'thunderbolt']
-        if any(pattern in name_lower for pattern in terran_patterns):
-            return 'terran'
-        
-        # Default to terran for unknown
-        return 'terran'
+        return _faction_for_name(entity_name)
     
     def _determine_ship_class(self, entity_name: str) -> str:
         """Determine ship class from entity name using WCS patterns"""
-        name_lower = entity_name.lower()
-        
-        # Capital ship patterns
-        capital_patterns = ['carrier', 'cruiser', 'destroyer', 'dreadnought', 
-                          'corvette', 'dreadnaught', 'bengal', 'tiger', 
-                          'fralthi', 'ralari']
-        if any(pattern in name_lower for pattern in capital_patterns):
-            return 'capital_ships'
-        
-        # Transport patterns
-        transport_patterns = ['transport', 'freighter', 'tanker', 'supply']
-        if any(pattern in name_lower for pattern in transport_patterns):
-            return 'transports'
-        
-        # Installation patterns
-        installation_patterns = ['base', 'station', 'platform', 'starbase', 
-                               'drydock', 'depot']
-        if any(pattern in name_lower for pattern in installation_patterns):
-            return 'installations'
-        
-        # Fighter by default
-        return 'fighters'
+        return _ship_class_for_name(entity_name)
     
     # DM-017: Enhanced Semantic Path Resolution Methods
     
@@ -300,45 +352,25 @@ class TargetPathResolver:
         """Detect material type from filename"""
         name_lower = filename.lower()
         
-        if any(suffix in name_lower for suffix in ['_normal', '_n', '_nrm', '_bump']):
-            return 'normal'
-        elif any(suffix in name_lower for suffix in ['_specular', '_spec', '_s', '_shine']):
-            return 'specular'
-        elif any(suffix in name_lower for suffix in ['_glow', '_g', '_emissive', '_emit']):
-            return 'glow'
-        else:
-            return 'diffuse'
+        for material_type, suffix_re in _MATERIAL_TYPE_RULES:
+            if suffix_re.search(name_lower):
+                return material_type
+        return 'diffuse'
     
     def _classify_audio_type_from_filename(self, filename: str) -> str:
         """Classify audio type from filename"""
         name_lower = filename.lower()
         
-        # Engine sounds
-        if any(pattern in name_lower for pattern in ['engine', 'aburn', 'throttle', 'afterburner']):
-            return 'engine_sounds'
-        
-        # Weapon sounds
-        elif any(pattern in name_lower for pattern in ['missile', 'laser', 'ion', 'cannon', 'fire']):
-            return 'weapon_sounds'
-        
-        # Shield sounds
-        elif any(pattern in name_lower for pattern in ['shield', 'hull', 'damage']):
-            return 'shield_sounds'
-        
-        # UI sounds
-        elif any(pattern in name_lower for pattern in ['button', 'menu', 'alert', 'beep']):
-            return 'ui_sounds'
-        
-        else:
-            return 'misc'
+        # Engine, weapon, shield and UI sounds
+        for audio_type, matcher in _AUDIO_TYPE_RULES:
+            if matcher.search(name_lower):
+                return audio_type
+        return 'misc'
     
     def _extract_mission_number_from_filename(self, filename: str) -> Optional[int]:
         """Extract mission number from pilot voice filename"""
-        import re
-        
         # Pattern: 01_greywolf_01.wav, 02_sandman_03.wav, etc.
-        mission_pattern = re.compile(r'^(\d{2})_\w+_\d{2}\.')
-        match = mission_pattern.match(filename)
+        match = _MISSION_NUMBER_RE.match(filename)
         
         if match:
             return int(match.group(1))
@@ -349,10 +381,7 @@ class TargetPathResolver:
         """Extract location/ship name from control tower audio filename"""
         name_lower = filename.lower()
         
-        # Known locations from analysis
-        locations = ['hermes', 'bradshaw', 'wellington', 'lexington']
-        
-        for location in locations:
+        for location in _CONTROL_LOCATIONS:
             if location in name_lower:
                 return location
         
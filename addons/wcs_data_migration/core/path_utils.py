@@ -12,7 +12,7 @@ Story: DM-003 - Asset Organization and Cataloging
 
 import os
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import FrozenSet, Iterator, List, Optional, Union
 
 def sanitize_filename(filename: str) -> str:
     """
@@ -88,20 +88,74 @@ def find_files_by_extension(directory: Path, extensions: List[str],
         return []
     
     # Normalize extensions
-    norm_extensions = []
-    for ext in extensions:
-        if not ext.startswith('.'):
-            ext = '.' + ext
-        norm_extensions.append(ext.lower())
+    norm_extensions = frozenset(
+        (ext if ext.startswith('.') else '.' + ext).lower() for ext in extensions
+    )
     
-    files = []
-    pattern = "**/*" if recursive else "*"
+    # os.scandir entries already know their name and file type, so only
+    # matching files become Path objects
+    file_paths = [
+        entry.path for entry in iter_directory_files(directory, recursive)
+        if os.path.splitext(entry.name)[1].lower() in norm_extensions
+    ]
     
-    for file_path in directory.glob(pattern):
-        if file_path.is_file() and file_path.suffix.lower() in norm_extensions:
-            files.append(file_path)
+    # Sort on precomputed component lists, which orders like Path comparison
+    # without a Python-level __lt__ call per comparison
+    file_paths.sort(key=lambda path: os.path.normcase(path).split(os.sep))
+    return [Path(path) for path in file_paths]
+
+def list_directory_files(directory: Union[str, Path]) -> FrozenSet[str]:
+    """
+    List the names of the files directly inside a directory.
     
-    return sorted(files)
+    Used to replace repeated per-candidate exists() probes with set
+    membership tests.
+    
+    Args:
+        directory: Directory to list
+        
+    Returns:
+        Frozen set of file names (empty if the directory is missing)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return frozenset()
+
+def iter_directory_files(directory: Union[str, Path], recursive: bool = True,
+                         skip_dirs: FrozenSet[str] = frozenset()) -> Iterator[os.DirEntry]:
+    """
+    Yield the files under a directory with os.scandir.
+    
+    The yielded DirEntry objects carry their name, path and file type
+    from the directory listing, so callers avoid a Path object and extra
+    stat() calls per file. Files are produced as each directory is read,
+    so filtering callers never hold the full listing. Symlinked
+    directories are not descended into.
+    
+    Args:
+        directory: Directory to scan
+        recursive: Whether to scan subdirectories
+        skip_dirs: Lower-case subdirectory names whose trees are not scanned
+        
+    Yields:
+        DirEntry objects for regular files (nothing if the directory is missing)
+    """
+    pending = [os.fspath(directory)]
+    
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and entry.name.lower() not in skip_dirs:
+                            pending.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
 
 def create_godot_directory_structure(project_root: Path) -> None:
     """
@@ -206,6 +260,7 @@ def clean_empty_directories(root_path: Path) -> int:
         Number of directories removed
     """
     removed_count = 0
+    removed_dirs = set()
     
     try:
         # Walk directories bottom-up to handle nested empty dirs
@@ -216,11 +271,16 @@ def clean_empty_directories(root_path: Path) -> int:
             if dir_path == root_path:
                 continue
             
-            # Check if directory is empty
+            # The walk already listed this directory; it is empty when it has no
+            # files and every subdirectory was removed, so no re-listing is needed
+            if filenames or any(os.path.join(dirpath, name) not in removed_dirs
+                                for name in dirnames):
+                continue
+            
             try:
-                if not any(dir_path.iterdir()):
-                    dir_path.rmdir()
-                    removed_count += 1
+                dir_path.rmdir()
+                removed_dirs.add(dirpath)
+                removed_count += 1
             except OSError:
                 # Directory not empty or permission error
                 pass
@@ -12,19 +12,150 @@ Epic: EPIC-003 - Data Migration & Conversion Tools
 """
 
 import logging
+import mmap
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
 from data_structures import AssetRelationship, AssetMapping
 from .entity_classifier import EntityType, EntityClassifier, TableType
 from .asset_discovery import AssetDiscoveryEngine
 from .path_resolver import TargetPathResolver
+from .path_utils import list_directory_files
 from table_converters.sounds_table_converter import SoundsTableConverter
-from table_converters.base_table_converter import ParseState
 
 logger = logging.getLogger(__name__)
 
+# Precompiled table directive patterns (weapons.tbl / sounds.tbl).
+# Each table uses a single alternation so a line is matched once; the named
+# group that participated (``match.lastgroup``) identifies the directive.
+_WEAPON_DIRECTIVE_RE = re.compile(
+    r'\$(?:Name:\s*@?(?P<name>[^\r\n]+)'
+    r'|Model\s+File:\s*(?P<model>[^\r\n]+)'
+    r'|LaunchSnd:\s*(?P<sound>[^\r\n]+))'
+)
+_SOUND_ENTRY_RE = re.compile(rb'\$Name:\s*(\S+)\s+([^\s,]+\.wav)')
+
+# Section headers ('#') and directives ('$'); comment and blank lines never match
+_TABLE_LINE_RE = re.compile(rb'^[ \t]*([#$][^\r\n]*)', re.MULTILINE)
+
+# asteroid.tbl model directive (spelled "$Model file:", unlike weapons.tbl)
+_ASTEROID_MODEL_RE = re.compile(r'\$Model\s+file:\s*([^\r\n]+)')
+
+# ships.tbl scanner run directly over the file bytes: only section headers
+# and the three directives the builder uses match, so every other line is
+# skipped inside the regex engine without a Python-level iteration
+_SHIP_SCAN_RE = re.compile(
+    rb'^[ \t]*(?:(?P<section>#[^\r\n]*)'
+    rb'|\$(?:Name:[ \t]+(?P<name>[^\r\n]+)'
+    rb'|POF[ \t]+file:[ \t]+(?P<pof>[^\r\n]+)'
+    rb'|Texture[ \t]+Replace:[ \t]*(?P<texture>[^\r\n]+)))',
+    re.MULTILINE
+)
+
+# Entity-name scanner for tables without a dedicated parser; only $Name:
+# directives with a value match, so all other lines stay inside the regex engine
+_NAME_SCAN_RE = re.compile(rb'^[ \t]*\$Name:[ \t]*(?P<name>[^\s][^\r\n]*)', re.MULTILINE)
+
+# Directories searched (in order) for files referenced from sounds.tbl
+_SOUND_DIRS = ('hermes_sounds', 'sounds', 'hermes_core')
+
+# Directories searched (in order) for mission/campaign asset references
+_MISSION_ASSET_DIRS = {
+    'video': ('hermes_movies', 'movies'),
+    'audio': ('hermes_sounds', 'sounds', 'hermes_core'),
+    'texture': ('hermes_maps', 'maps', 'hermes_interface'),
+    'model': ('hermes_models', 'models')
+}
+_MISSION_ASSET_EXTENSIONS = ('.avi', '.wav', '.ogg', '.dds', '.pcx', '.pof', '.tga')
+
+def _advise_file(fd: int, advice_name: str) -> None:
+    """Pass a posix_fadvise hint for the whole file where the platform supports it"""
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+# Read size used to warm the page cache where posix_fadvise is unavailable
+_PREFETCH_CHUNK_SIZE = 1024 * 1024
+
+def _prefetch_table_file(table_path: Path) -> None:
+    """Pull a table file into the page cache ahead of parsing it"""
+    try:
+        with open(table_path, 'rb') as f:
+            if hasattr(os, 'posix_fadvise') and hasattr(os, 'POSIX_FADV_WILLNEED'):
+                _advise_file(f.fileno(), 'POSIX_FADV_WILLNEED')
+            else:
+                while f.read(_PREFETCH_CHUNK_SIZE):
+                    pass
+    except OSError:
+        pass
+
+@contextmanager
+def _map_table_file(table_path: Path) -> Iterator[Union[mmap.mmap, bytes]]:
+    """
+    Memory-map a table file read-only (empty files yield b'').
+    
+    Tables are scanned strictly front to back, so the kernel is told to read
+    ahead aggressively and the pages are released once parsing is done.
+    """
+    with open(table_path, 'rb') as f:
+        fd = f.fileno()
+        _advise_file(fd, 'POSIX_FADV_SEQUENTIAL')
+        try:
+            try:
+                mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Cannot map an empty file
+                yield b''
+                return
+            with mapped:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                yield mapped
+        finally:
+            _advise_file(fd, 'POSIX_FADV_DONTNEED')
+
+def _iter_table_lines(table_path: Path) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (line_number, line) for each section header and directive line.
+    
+    The file is scanned as bytes straight from the memory map, so only the
+    matched lines are decoded.
+    """
+    with _map_table_file(table_path) as data:
+        line_num = 1
+        last_pos = 0
+        for match in _TABLE_LINE_RE.finditer(data):
+            start = match.start()
+            line_num += data[last_pos:start].count(b'\n')
+            last_pos = start
+            yield line_num, match.group(1).decode('utf-8', 'ignore').strip()
+
+def _iter_table_directives(table_path: Path, scan_re: 're.Pattern[bytes]') -> Iterator[Tuple[int, str, str]]:
+    """
+    Yield (line_number, kind, value) for each match of a table scanner.
+    
+    ``kind`` is the name of the group that matched and ``value`` its
+    stripped text; only matched values are decoded.
+    """
+    with _map_table_file(table_path) as data:
+        line_num = 1
+        last_pos = 0
+        for match in scan_re.finditer(data):
+            start = match.start()
+            line_num += data[last_pos:start].count(b'\n')
+            last_pos = start
+            kind = match.lastgroup
+            yield line_num, kind, match.group(kind).decode('utf-8', 'ignore').strip()
+
 @dataclass
 class TableParsingContext:
     """Context information for table parsing"""
@@ -50,10 +181,9 @@ class RelationshipBuilder:
         self.source_dir = Path(source_dir)
         self.target_structure = target_structure
         
-        # Initialize specialized components
+        # Initialize specialized components (discovery and path resolution
+        # are only needed after parsing, so they are created on first use)
         self.classifier = EntityClassifier(source_dir)
-        self.discovery_engine = AssetDiscoveryEngine(source_dir)
-        self.path_resolver = TargetPathResolver(target_structure)
         
         # Relationship storage
         self.relationships: Dict[str, List[AssetRelationship]] = {}
@@ -62,6 +192,40 @@ class RelationshipBuilder:
         
         # Parsing context
         self.table_contexts: Dict[str, TableParsingContext] = {}
+        
+        # sounds.tbl id -> filename map, loaded on first sound lookup
+        self._sound_id_map: Optional[Dict[str, str]] = None
+        
+        # Source subdirectory -> file names, listed on first lookup
+        self._dir_indexes: Dict[str, FrozenSet[str]] = {}
+    
+    @cached_property
+    def discovery_engine(self) -> AssetDiscoveryEngine:
+        """Asset discovery engine, created on first use"""
+        return AssetDiscoveryEngine(self.source_dir)
+    
+    @cached_property
+    def path_resolver(self) -> TargetPathResolver:
+        """Target path resolver, created on first use"""
+        return TargetPathResolver(self.target_structure)
+    
+    @cached_property
+    def _models_index(self) -> FrozenSet[str]:
+        """File names in hermes_models, listed once per builder"""
+        return self._directory_index("hermes_models")
+    
+    @cached_property
+    def _sound_dir_indexes(self) -> Dict[str, FrozenSet[str]]:
+        """File names in each sound directory, listed once per builder"""
+        return {sound_dir: self._directory_index(sound_dir) for sound_dir in _SOUND_DIRS}
+    
+    def _directory_index(self, directory: str) -> FrozenSet[str]:
+        """File names in a source subdirectory, listed once per builder"""
+        index = self._dir_indexes.get(directory)
+        if index is None:
+            index = list_directory_files(self.source_dir / directory)
+            self._dir_indexes[directory] = index
+        return index
     
     def build_relationships_from_tables(self, table_files: List[Path]) -> Dict[str, List[AssetRelationship]]:
         """
@@ -75,65 +239,94 @@ class RelationshipBuilder:
         """
         logger.info(f"Building relationships from {len(table_files)} table files")
         
-        all_relationships = {}
+        partials = []
         
-        for table_file in table_files:
-            try:
-                logger.info(f"Processing table file: {table_file}")
-                table_type = self.classifier.determine_table_type(table_file)
-                if table_type == TableType.UNKNOWN:
-                    logger.warning(f"Unknown table type for file: {table_file.name}")
-                    continue
-                
-                logger.info(f"Processing {table_type.value} table: {table_file.name}")
-                
-                # Initialize parsing context
-                context = TableParsingContext(table_type=table_type)
-                self.table_contexts[str(table_file)] = context
-                
-                # Parse based on table type
-                if table_type == TableType.SHIPS:
-                    relationships = self._parse_ships_table(table_file, context)
-                elif table_type in [TableType.WEAPONS, TableType.WEAPON_EXPL]:
-                    relationships = self._parse_weapons_table(table_file, context)
-                elif table_type == TableType.FIREBALL:
-                    relationships = self._parse_fireball_table(table_file, context)
-                elif table_type == TableType.ASTEROID:
-                    relationships = self._parse_asteroid_table(table_file, context)
-                elif table_type == TableType.SOUNDS:
-                    converter = SoundsTableConverter()
-                    with open(table_file, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    parse_state = ParseState(content.splitlines())
-                    sound_entries = converter.parse_table(parse_state)
-                    
-                    relationships = {}
-                    for entry in sound_entries:
-                        sound_rel = AssetRelationship(
-                            source_path=entry['filename'],
-                            target_path="",
-                            asset_type='audio',
-                            parent_entity='sound',
-                            relationship_type='sound_file',
-                            required=True
-                        )
-                        relationships[entry['name']] = [sound_rel]
-                else:
-                    # Generic table parsing for other types
-                    relationships = self._parse_generic_table(table_file, context)
-                
-                all_relationships.update(relationships)
-                context.entity_count = len(relationships)
-                logger.info(f"Found {len(relationships)} relationships in {table_file.name}")
-                
-            except Exception as e:
-                logger.error(f"Failed to process table file {table_file}: {e}")
+        for table_file, (context, relationships) in zip(table_files, self._parse_table_files(table_files)):
+            if context is None:
                 continue
+            
+            self.table_contexts[str(table_file)] = context
+            partials.append(relationships)
+        
+        # Build the combined map in one pass (later tables win on name clashes)
+        all_relationships = dict(chain.from_iterable(partial.items() for partial in partials))
         
         logger.info(f"Built relationships for {len(all_relationships)} entities")
         self.relationships = all_relationships
         return self.relationships
     
+    def _parse_table_files(self, table_files: List[Path]
+                           ) -> List[Tuple[Optional[TableParsingContext], Dict[str, List[AssetRelationship]]]]:
+        """Parse table files in order, prefetching the next file while parsing the current one"""
+        results = []
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            for index, table_file in enumerate(table_files):
+                if index + 1 < len(table_files):
+                    prefetcher.submit(_prefetch_table_file, table_files[index + 1])
+                results.append(self._parse_table_file(table_file))
+        return results
+    
+    def _parse_table_file(self, table_file: Path
+                          ) -> Tuple[Optional[TableParsingContext], Dict[str, List[AssetRelationship]]]:
+        """
+        Parse a single table file.
+        
+        Returns:
+            The parsing context (None if the table was skipped) and the
+            entity relationships found in the table
+        """
+        context = None
+        try:
+            logger.info("Processing table file: %s", table_file)
+            table_type = self.classifier.determine_table_type(table_file)
+            if table_type == TableType.UNKNOWN:
+                logger.warning("Unknown table type for file: %s", table_file.name)
+                return None, {}
+            
+            logger.info("Processing %s table: %s", table_type.value, table_file.name)
+            
+            # Initialize parsing context
+            context = TableParsingContext(table_type=table_type)
+            
+            # Parse based on table type
+            if table_type == TableType.SHIPS:
+                relationships = self._parse_ships_table(table_file, context)
+            elif table_type in [TableType.WEAPONS, TableType.WEAPON_EXPL]:
+                relationships = self._parse_weapons_table(table_file, context)
+            elif table_type == TableType.FIREBALL:
+                relationships = self._parse_fireball_table(table_file, context)
+            elif table_type == TableType.ASTEROID:
+                relationships = self._parse_asteroid_table(table_file, context)
+            elif table_type == TableType.SOUNDS:
+                converter = SoundsTableConverter()
+                with open(table_file, 'r', encoding='utf-8', errors='ignore') as f:
+                    content = f.read()
+                parse_state = converter._prepare_parse_state(content, str(table_file))
+                sound_entries = converter.parse_table(parse_state)
+                
+                relationships = {}
+                for entry in sound_entries:
+                    sound_rel = AssetRelationship(
+                        source_path=entry['filename'],
+                        target_path="",
+                        asset_type='audio',
+                        parent_entity='sound',
+                        relationship_type='sound_file',
+                        required=True
+                    )
+                    relationships[entry['name']] = [sound_rel]
+            else:
+                # Generic table parsing for other types
+                relationships = self._parse_generic_table(table_file, context)
+            
+            context.entity_count = len(relationships)
+            logger.info("Found %s relationships in %s", len(relationships), table_file.name)
+            return context, relationships
+            
+        except Exception as e:
+            logger.error("Failed to process table file %s: %s", table_file, e)
+            return context, {}
+    
     def build_relationships_from_missions(self, mission_files: List[Path]) -> Dict[str, List[AssetRelationship]]:
         """
         Build asset relationships from FS2 mission files.
@@ -250,41 +443,22 @@ class RelationshipBuilder:
         relationships = {}
         
         try:
-            with open(ships_table, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # WCS ships.tbl structure patterns
-            ship_pattern = r'\\$Name:\\s+([^\\r\\n]+)'
-            pof_pattern = r'\\$POF\\s+file:\\s+([^\\r\\n]+)'
-            texture_pattern = r'\\$Texture\\s+Replace:\\s*([^\\r\\n]+)'
-            
             current_ship = None
             in_ship_section = False
             
-            for line_num, line in enumerate(content.split('\\n'), 1):
-                line = line.strip()
-                
-                # Skip comments and empty lines
-                if not line or line.startswith(';') or line.startswith('#'):
-                    continue
-                
+            for line_num, kind, value in _iter_table_directives(ships_table, _SHIP_SCAN_RE):
                 # Track sections
-                if '#Ship Classes' in line:
-                    in_ship_section = True
-                    context.current_section = 'Ship Classes'
-                    continue
-                elif line.startswith('#') and 'Ship Classes' not in line:
-                    in_ship_section = False
-                    context.current_section = line
+                if kind == 'section':
+                    in_ship_section = 'Ship Classes' in value
+                    context.current_section = 'Ship Classes' if in_ship_section else value
                     continue
                 
                 if not in_ship_section:
                     continue
                 
                 # Parse ship name
-                ship_match = re.match(ship_pattern, line)
-                if ship_match:
-                    ship_name = ship_match.group(1).strip()
+                if kind == 'name':
+                    ship_name = value
                     
                     if not ship_name or ship_name.isdigit() or len(ship_name) < 2:
                         logger.warning(f"Skipping invalid ship name '{ship_name}' in {ships_table.name} at line {line_num}")
@@ -308,13 +482,11 @@ class RelationshipBuilder:
                     continue
                 
                 # Parse POF model file
-                pof_match = re.match(pof_pattern, line)
-                if pof_match:
-                    pof_file = pof_match.group(1).strip()
+                if kind == 'pof':
+                    pof_file = value
                     
                     # Verify the POF file exists
-                    actual_pof_path = self.source_dir / "hermes_models" / pof_file
-                    if actual_pof_path.exists():
+                    if pof_file in self._models_index:
                         model_rel = AssetRelationship(
                             source_path=f"hermes_models/{pof_file}",
                             target_path="",  # Will be resolved later
@@ -325,13 +497,12 @@ class RelationshipBuilder:
                         )
                         relationships[current_ship].append(model_rel)
                     else:
-                        logger.warning(f"POF file not found: {actual_pof_path}")
+                        logger.warning(f"POF file not found: {self.source_dir / 'hermes_models' / pof_file}")
                         context.parsing_errors.append(f"Missing POF: {pof_file}")
                 
                 # Parse texture replacements
-                texture_match = re.match(texture_pattern, line)
-                if texture_match:
-                    texture_spec = texture_match.group(1).strip()
+                elif kind == 'texture':
+                    texture_spec = value
                     texture_rel = self._parse_texture_replacement(current_ship, texture_spec)
                     if texture_rel:
                         relationships[current_ship].append(texture_rel)
@@ -347,21 +518,11 @@ class RelationshipBuilder:
         relationships = {}
         
         try:
-            with open(weapons_table, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # WCS weapon patterns
-            weapon_pattern = r'\\$Name:\\s*@?([^\\r\\n]+)'
-            model_pattern = r'\\$Model\\s+File:\\s*([^\\r\\n]+)'
-            sound_pattern = r'\\$LaunchSnd:\\s*([^\\r\\n]+)'
-            
             current_weapon = None
             in_primary_section = False
             in_secondary_section = False
             
-            for line in content.split('\\n'):
-                line = line.strip()
-                
+            for _, line in _iter_table_lines(weapons_table):
                 # Track sections
                 if '#Primary Weapons' in line:
                     in_primary_section = True
@@ -382,10 +543,13 @@ class RelationshipBuilder:
                 if not (in_primary_section or in_secondary_section):
                     continue
                 
+                directive = _WEAPON_DIRECTIVE_RE.match(line)
+                if not directive:
+                    continue
+                
                 # Parse weapon name
-                weapon_match = re.match(weapon_pattern, line)
-                if weapon_match:
-                    weapon_name = weapon_match.group(1).strip()
+                if directive.lastgroup == 'name':
+                    weapon_name = directive.group('name').strip()
 
                     if not weapon_name or weapon_name.isdigit() or len(weapon_name) < 2:
                         logger.warning(f"Skipping invalid weapon name '{weapon_name}' in {weapons_table.name}")
@@ -401,9 +565,8 @@ class RelationshipBuilder:
                     continue
                 
                 # Parse weapon model
-                model_match = re.match(model_pattern, line)
-                if model_match:
-                    model_file = model_match.group(1).strip()
+                if directive.lastgroup == 'model':
+                    model_file = directive.group('model').strip()
                     if model_file.lower() != 'none':
                         model_rel = AssetRelationship(
                             source_path=f"hermes_models/{model_file}",
@@ -416,9 +579,8 @@ class RelationshipBuilder:
                         relationships[current_weapon].append(model_rel)
                 
                 # Parse weapon sounds
-                sound_match = re.match(sound_pattern, line)
-                if sound_match:
-                    sound_id = sound_match.group(1).strip()
+                elif directive.lastgroup == 'sound':
+                    sound_id = directive.group('sound').strip()
                     actual_sound_file = self._find_actual_sound_file(sound_id)
                     if actual_sound_file:
                         sound_rel = AssetRelationship(
@@ -491,7 +653,7 @@ class RelationshipBuilder:
                     ))
         
         except Exception as e:
-            logger.debug(f"Could not parse mission file {mission_file}: {e}")
+            logger.debug("Could not parse mission file %s: %s", mission_file, e)
         
         return relationships
     
@@ -531,71 +693,73 @@ class RelationshipBuilder:
                             ))
         
         except Exception as e:
-            logger.debug(f"Could not parse campaign file {campaign_file}: {e}")
+            logger.debug("Could not parse campaign file %s: %s", campaign_file, e)
         
         return relationships
     
     # Additional helper methods...
     
-    def _find_actual_sound_file(self, sound_id: str) -> Optional[str]:
-        """Find actual sound file by looking up sound ID in sounds.tbl"""
+    def _load_sound_map(self) -> Dict[str, str]:
+        """Parse sounds.tbl once into a sound ID -> filename map"""
+        sound_map: Dict[str, str] = {}
         sounds_table = self.source_dir / "hermes_core" / "sounds.tbl"
-        if not sounds_table.exists():
-            return None
         
-        try:
-            with open(sounds_table, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            pattern = rf'\\$Name:\\s*{re.escape(sound_id)}\\s+([^\\s,]+\\.wav)'
-            match = re.search(pattern, content)
+        if sounds_table.exists():
+            try:
+                with _map_table_file(sounds_table) as data:
+                    for match in _SOUND_ENTRY_RE.finditer(data):
+                        sound_map.setdefault(match.group(1).decode('utf-8', 'ignore'),
+                                             match.group(2).decode('utf-8', 'ignore'))
             
-            if match:
-                sound_filename = match.group(1)
-                # Look for the actual sound file
-                for sound_dir in ['hermes_sounds', 'sounds', 'hermes_core']:
-                    potential_path = self.source_dir / sound_dir / sound_filename
-                    if potential_path.exists():
-                        return str(potential_path.relative_to(self.source_dir))
+            except Exception as e:
+                logger.debug(f"Failed to load sound table {sounds_table}: {e}")
         
-        except Exception as e:
-            logger.debug(f"Failed to lookup sound ID {sound_id}: {e}")
+        self._sound_id_map = sound_map
+        return sound_map
+    
+    def _find_actual_sound_file(self, sound_id: str) -> Optional[str]:
+        """Find actual sound file by looking up sound ID in sounds.tbl"""
+        sound_map = self._sound_id_map
+        if sound_map is None:
+            sound_map = self._load_sound_map()
+        
+        sound_filename = sound_map.get(sound_id)
+        if not sound_filename:
+            return None
+        
+        # Look for the actual sound file
+        sound_dir_indexes = self._sound_dir_indexes
+        for sound_dir in _SOUND_DIRS:
+            if sound_filename in sound_dir_indexes[sound_dir]:
+                return os.path.join(sound_dir, sound_filename)
         
         return None
     
     def _find_mission_asset_file(self, asset_name: str, asset_type: str) -> Optional[str]:
         """Find mission asset file in appropriate directories"""
-        search_dirs = {
-            'video': ['hermes_movies', 'movies'],
-            'audio': ['hermes_sounds', 'sounds', 'hermes_core'],
-            'texture': ['hermes_maps', 'maps', 'hermes_interface'],
-            'model': ['hermes_models', 'models']
-        }
-        
-        dirs_to_search = search_dirs.get(asset_type, ['hermes_core'])
+        dirs_to_search = _MISSION_ASSET_DIRS.get(asset_type, ('hermes_core',))
         
         for search_dir in dirs_to_search:
-            dir_path = self.source_dir / search_dir
-            if dir_path.exists():
+            dir_index = self._directory_index(search_dir)
+            if dir_index:
                 # Try different file extensions
-                extensions = ['.avi', '.wav', '.ogg', '.dds', '.pcx', '.pof', '.tga']
-                for ext in extensions:
-                    file_path = dir_path / f"{asset_name}{ext}"
-                    if file_path.exists():
-                        return str(file_path.relative_to(self.source_dir))
+                for ext in _MISSION_ASSET_EXTENSIONS:
+                    file_name = f"{asset_name}{ext}"
+                    if file_name in dir_index:
+                        return os.path.join(search_dir, file_name)
         
         return None
     
     def _find_campaign_asset_file(self, asset_name: str, asset_type: str) -> Optional[str]:
         """Find campaign asset file"""
         if asset_type == 'mission':
-            mission_path = self.source_dir / "hermes_core" / f"{asset_name}.fs2"
-            if mission_path.exists():
-                return str(mission_path.relative_to(self.source_dir))
+            mission_file = f"{asset_name}.fs2"
+            if mission_file in self._directory_index("hermes_core"):
+                return os.path.join("hermes_core", mission_file)
         elif asset_type == 'text':
-            text_path = self.source_dir / "hermes_core" / f"{asset_name}.txt"
-            if text_path.exists():
-                return str(text_path.relative_to(self.source_dir))
+            text_file = f"{asset_name}.txt"
+            if text_file in self._directory_index("hermes_core"):
+                return os.path.join("hermes_core", text_file)
         
         return self._find_mission_asset_file(asset_name, asset_type)
     
@@ -661,7 +825,6 @@ class RelationshipBuilder:
             
             # Parse asteroid entries
             name_pattern = r'\$Name:\s*([^\r\n]+)'
-            model_pattern = r'\$Model\s+file:\s*([^\r\n]+)'
             
             current_asteroid = None
             
@@ -684,7 +847,7 @@ class RelationshipBuilder:
                 if not current_asteroid:
                     continue
                 
-                model_match = re.match(model_pattern, line)
+                model_match = _ASTEROID_MODEL_RE.match(line)
                 if model_match:
                     model_file = model_match.group(1).strip()
                     if model_file.lower() != 'none':
@@ -709,21 +872,9 @@ class RelationshipBuilder:
         relationships = {}
         
         try:
-            with open(table_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
             # Basic name extraction for any table
-            name_pattern = r'\$Name:\s*([^\r\n]+)'
-            
-            for line in content.split('\n'):
-                line = line.strip()
-                if not line or line.startswith(';'):
-                    continue
-                
-                name_match = re.match(name_pattern, line)
-                if name_match:
-                    entity_name = name_match.group(1).strip()
-                    relationships[entity_name] = []
+            for _, _, entity_name in _iter_table_directives(table_file, _NAME_SCAN_RE):
+                relationships[entity_name] = []
         
         except Exception as e:
             logger.debug(f"Generic parsing failed for {table_file}: {e}")
@@ -745,18 +896,20 @@ class RelationshipBuilder:
                     required=False
                 )
         except Exception as e:
-            logger.debug(f"Could not parse texture spec '{texture_spec}': {e}")
+            logger.debug("Could not parse texture spec '%s': %s", texture_spec, e)
         
         return None
     
     def _determine_entity_type_from_relationships(self, relationships: List[AssetRelationship], entity_name: str) -> EntityType:
         """Determine entity type from its relationships"""
         
+        is_missile_name = 'missile' in entity_name.lower()
+        
         # Check relationship types for clues
         for rel in relationships:
             if rel.relationship_type in ['fire_sound', 'weapon_effect']:
                 return EntityType.WEAPON
-            elif rel.relationship_type in ['primary_model'] and 'missile' in entity_name.lower():
+            elif rel.relationship_type in ['primary_model'] and is_missile_name:
                 return EntityType.WEAPON
             elif rel.relationship_type == 'fireball_texture':
                 return EntityType.EFFECT
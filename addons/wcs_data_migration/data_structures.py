@@ -10,10 +10,11 @@ Date: June 10, 2025
 Epic: EPIC-003 - Data Migration & Conversion Tools
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 
-@dataclass
+@dataclass(slots=True)
 class AssetRelationship:
     """Represents a relationship between source asset and target conversion"""
     source_path: str
@@ -23,7 +24,15 @@ class AssetRelationship:
     relationship_type: str = "reference"  # reference, texture, model, sound, etc.
     required: bool = True
     
-@dataclass 
+    def __post_init__(self):
+        # Type/kind labels and entity names repeat across thousands of
+        # relationships; intern them so equal values share one object
+        self.asset_type = sys.intern(self.asset_type)
+        self.relationship_type = sys.intern(self.relationship_type)
+        if self.parent_entity is not None:
+            self.parent_entity = sys.intern(self.parent_entity)
+    
+@dataclass(slots=True)
 class AssetMapping:
     """Complete asset mapping with all relationships"""
     entity_name: str
@@ -38,15 +38,16 @@ class AIProfilesTableConverter(BaseTableConverter):
 
         while state.has_more_lines():
             line = state.peek_line()
-            if not line or self._should_skip_line(line, state):
+            if not line:
                 state.skip_line()
                 continue
             
-            if self._parse_patterns['profile_name'].match(line.strip()):
+            stripped = line.strip()
+            if self._parse_patterns['profile_name'].match(stripped):
                 entry = self.parse_entry(state)
                 if entry:
                     entries.append(entry)
-            elif self._parse_patterns['section_end'].match(line.strip()):
+            elif self._parse_patterns['section_end'].match(stripped):
                 break
             else:
                 state.skip_line()
@@ -66,11 +67,11 @@ class AIProfilesTableConverter(BaseTableConverter):
                 continue
 
             if self._parse_patterns['profile_name'].match(line) and 'name' in entry_data:
-                state.current_line -= 1
+                state.pushback(line)
                 break
             
             if self._parse_patterns['section_end'].match(line):
-                state.current_line -=1
+                state.pushback(line)
                 break
 
             match = self._parse_patterns['profile_name'].match(line)
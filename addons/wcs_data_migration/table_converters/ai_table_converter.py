@@ -8,7 +8,7 @@ Handles ai.tbl files for AI ship behavior configuration.
 
 import re
 from typing import Dict, List, Optional, Any
-from .base_table_converter import BaseTableConverter, ParseState, TableType
+from .base_table_converter import NAME_PATTERN, BaseTableConverter, ParseState, TableType
 
 class AITableConverter(BaseTableConverter):
     """Converts WCS ai.tbl files to Godot AI behavior resources"""
@@ -16,7 +16,7 @@ class AITableConverter(BaseTableConverter):
     def _init_parse_patterns(self) -> Dict[str, re.Pattern]:
         """Initialize regex patterns for AI table parsing"""
         return {
-            'ai_class_start': re.compile(r'^\$Name:\s*(.+)$', re.IGNORECASE),
+            'ai_class_start': NAME_PATTERN,
             'ai_class_end': re.compile(r'^\$end$', re.IGNORECASE),
             'accuracy': re.compile(r'^\+Accuracy:\s*([\d\.]+)$', re.IGNORECASE),
             'evasion': re.compile(r'^\+Evasion:\s*([\d\.]+)$', re.IGNORECASE),
@@ -44,7 +44,7 @@ class AITableConverter(BaseTableConverter):
                 continue
                 
             line = line.strip()
-            if not line or self._should_skip_line(line, state):
+            if not line:
                 continue
             
             # Check for AI class start
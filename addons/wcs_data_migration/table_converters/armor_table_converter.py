@@ -8,14 +8,14 @@ Single Responsibility: Armor table parsing and conversion only.
 
 import re
 from typing import Dict, List, Optional, Any
-from .base_table_converter import BaseTableConverter, ParseState, TableType
+from .base_table_converter import NAME_PATTERN, BaseTableConverter, ParseState, TableType
 
 class ArmorTableConverter(BaseTableConverter):
     """Converts WCS armor.tbl files to Godot armor resources"""
     
     def _init_parse_patterns(self) -> Dict[str, re.Pattern]:
         return {
-            'armor_start': re.compile(r'^\$Name:\s*(.+)$', re.IGNORECASE),
+            'armor_start': NAME_PATTERN,
             'damage_type': re.compile(r'^\$Damage Type:\s*(.+)$', re.IGNORECASE),
             'reduction': re.compile(r'^\$Reduction:\s*([\d\.]+)$', re.IGNORECASE)
         }
@@ -24,8 +24,42 @@ class ArmorTableConverter(BaseTableConverter):
         return TableType.ARMOR
     
     def parse_entry(self, state: ParseState) -> Optional[Dict[str, Any]]:
-        # Simplified armor parsing
-        return None
+        """Parse a single armor entry, consuming lines up to the next $Name: or # section line"""
+        armor_data: Dict[str, Any] = {}
+        damage_type = None
+        
+        while state.has_more_lines():
+            line = state.next_line().strip()
+            
+            # Section lines (#End, the next table section) close the current entry
+            if line.startswith('#'):
+                if 'name' in armor_data:
+                    state.pushback(line)
+                    break
+                continue
+            
+            match = self._parse_patterns['armor_start'].match(line)
+            if match:
+                if 'name' in armor_data:
+                    state.pushback(line)
+                    break
+                armor_data['name'] = match.group(1).strip()
+                armor_data['damage_types'] = {}
+                continue
+            
+            if 'name' not in armor_data:
+                continue
+            
+            match = self._parse_patterns['damage_type'].match(line)
+            if match:
+                damage_type = match.group(1).strip()
+                continue
+            
+            match = self._parse_patterns['reduction'].match(line)
+            if match and damage_type:
+                armor_data['damage_types'][damage_type] = self.parse_value(match.group(1), float)
+        
+        return armor_data or None
     
     def validate_entry(self, entry: Dict[str, Any]) -> bool:
         return 'name' in entry
@@ -8,29 +8,54 @@ Single Responsibility: Asteroid and debris definitions parsing and conversion on
 import re
 from typing import Dict, List, Optional, Any
 
-from .base_table_converter import BaseTableConverter, ParseState, TableType
+from .base_table_converter import NAME_PATTERN, BaseTableConverter, ParseState, TableType
+
+# Value conversion per asteroid property; anything not listed falls back to str.strip
+_FIELD_CONVERTERS = {
+    'detail_distance': lambda value: [int(d.strip()) for d in value.split(',')],
+    'max_speed': float,
+    'expl_inner_rad': float,
+    'expl_outer_rad': float,
+    'expl_damage': float,
+    'expl_blast': float,
+    'impact_explosion_radius': float,
+    'hitpoints': int,
+}
+
+# Compiled once at import and shared by every converter instance
+_ASTEROID_PATTERNS = {
+    'name': NAME_PATTERN,
+    'pof_file1': re.compile(r'^\$POF file1:\s*(.+)$', re.IGNORECASE),
+    'pof_file2': re.compile(r'^\$POF file2:\s*(.+)$', re.IGNORECASE),
+    'pof_file3': re.compile(r'^\$POF file3:\s*(.+)$', re.IGNORECASE),
+    'detail_distance': re.compile(r'^\$Detail distance:\s*\(([\d\s,]+)\)$', re.IGNORECASE),
+    'max_speed': re.compile(r'^\$Max Speed:\s*([\d\.]+)$', re.IGNORECASE),
+    'expl_inner_rad': re.compile(r'^\$Expl inner rad:\s*([\d\.]+)$', re.IGNORECASE),
+    'expl_outer_rad': re.compile(r'^\$Expl outer rad:\s*([\d\.]+)$', re.IGNORECASE),
+    'expl_damage': re.compile(r'^\$Expl damage:\s*([\d\.]+)$', re.IGNORECASE),
+    'expl_blast': re.compile(r'^\$Expl blast:\s*([\d\.]+)$', re.IGNORECASE),
+    'hitpoints': re.compile(r'^\$Hitpoints:\s*(\d+)', re.IGNORECASE),
+    'impact_explosion': re.compile(r'^\$Impact Explosion:\s*(.+)$', re.IGNORECASE),
+    'impact_explosion_radius': re.compile(r'^\$Impact Explosion Radius:\s*([\d\.]+)$', re.IGNORECASE),
+    'section_end': re.compile(r'^#End$', re.IGNORECASE),
+}
+
+# All property patterns fused into one alternation so each line is matched once
+_FUSED_PROPERTY_PATTERN = re.compile(
+    '^(?:' + '|'.join(
+        f'(?P<{key}>{pattern.pattern[1:]})'
+        for key, pattern in _ASTEROID_PATTERNS.items()
+        if key != 'section_end'
+    ) + ')',
+    re.IGNORECASE
+)
 
 class AsteroidTableConverter(BaseTableConverter):
     """Converts WCS asteroid.tbl files to Godot asteroid resources"""
 
     def _init_parse_patterns(self) -> Dict[str, re.Pattern]:
-        """Initialize regex patterns for asteroid.tbl parsing"""
-        return {
-            'name': re.compile(r'^\$Name:\s*(.+)$', re.IGNORECASE),
-            'pof_file1': re.compile(r'^\$POF file1:\s*(.+)$', re.IGNORECASE),
-            'pof_file2': re.compile(r'^\$POF file2:\s*(.+)$', re.IGNORECASE),
-            'pof_file3': re.compile(r'^\$POF file3:\s*(.+)$', re.IGNORECASE),
-            'detail_distance': re.compile(r'^\$Detail distance:\s*\(([\d\s,]+)\)$', re.IGNORECASE),
-            'max_speed': re.compile(r'^\$Max Speed:\s*([\d\.]+)$', re.IGNORECASE),
-            'expl_inner_rad': re.compile(r'^\$Expl inner rad:\s*([\d\.]+)$', re.IGNORECASE),
-            'expl_outer_rad': re.compile(r'^\$Expl outer rad:\s*([\d\.]+)$', re.IGNORECASE),
-            'expl_damage': re.compile(r'^\$Expl damage:\s*([\d\.]+)$', re.IGNORECASE),
-            'expl_blast': re.compile(r'^\$Expl blast:\s*([\d\.]+)$', re.IGNORECASE),
-            'hitpoints': re.compile(r'^\$Hitpoints:\s*(\d+)', re.IGNORECASE),
-            'impact_explosion': re.compile(r'^\$Impact Explosion:\s*(.+)$', re.IGNORECASE),
-            'impact_explosion_radius': re.compile(r'^\$Impact Explosion Radius:\s*([\d\.]+)$', re.IGNORECASE),
-            'section_end': re.compile(r'^#End$', re.IGNORECASE),
-        }
+        """Return the shared regex patterns for asteroid.tbl parsing"""
+        return _ASTEROID_PATTERNS
 
     def get_table_type(self) -> TableType:
         return TableType.ASTEROID
@@ -48,15 +73,16 @@ class AsteroidTableConverter(BaseTableConverter):
 
         while state.has_more_lines():
             line = state.peek_line()
-            if not line or self._should_skip_line(line, state):
+            if not line:
                 state.skip_line()
                 continue
             
-            if self._parse_patterns['name'].match(line.strip()):
+            stripped = line.strip()
+            if self._parse_patterns['name'].match(stripped):
                 entry = self.parse_entry(state)
                 if entry:
                     entries.append(entry)
-            elif self._parse_patterns['section_end'].match(line.strip()):
+            elif self._parse_patterns['section_end'].match(stripped):
                 break
             else:
                 state.skip_line()
@@ -73,36 +99,25 @@ class AsteroidTableConverter(BaseTableConverter):
         entry_data = {}
 
         while state.has_more_lines():
-            line = state.next_line()
-            if line is None:
-                break
-            
-            line = line.strip()
-            if not line:
-                continue
+            # Peek so the next entry's $Name: or #End stays unread for parse_table
+            line = state.peek_line().strip()
 
             if self._parse_patterns['name'].match(line) and 'name' in entry_data:
-                state.current_line -= 1
                 break
             
             if self._parse_patterns['section_end'].match(line):
-                state.current_line -=1
                 break
 
-            for key, pattern in self._init_parse_patterns().items():
-                match = pattern.match(line)
-                if match:
-                    if key == 'detail_distance':
-                        entry_data[key] = [int(d.strip()) for d in match.group(1).split(',')]
-                    elif key in ['max_speed', 'expl_inner_rad', 'expl_outer_rad', 'expl_damage', 'expl_blast', 'impact_explosion_radius']:
-                        entry_data[key] = float(match.group(1))
-                    elif key == 'hitpoints':
-                        entry_data[key] = int(match.group(1))
-                    elif key != 'name':
-                         entry_data[key] = match.group(1).strip()
-                    else:
-                        entry_data['name'] = match.group(1).strip()
-                    break
+            state.skip_line()
+            if not line:
+                continue
+
+            match = _FUSED_PROPERTY_PATTERN.match(line)
+            if match:
+                key = match.lastgroup
+                # The property value is the single group nested inside the named alternative
+                value = match.group(match.lastindex + 1)
+                entry_data[key] = _FIELD_CONVERTERS.get(key, str.strip)(value)
         
         entry_data['type'] = 'asteroid'
         return self.validate_entry(entry_data) and entry_data or None
@@ -115,7 +130,7 @@ class AsteroidTableConverter(BaseTableConverter):
             if line is None:
                 break
             line = line.strip()
-            if not line or self._should_skip_line(line, state):
+            if not line:
                 continue
 
             match = self._parse_patterns['impact_explosion'].match(line)
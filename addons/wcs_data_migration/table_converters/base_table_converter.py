@@ -23,6 +23,9 @@ from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
 
+# Entry-opening "$Name:" pattern shared by the converters that use it verbatim
+NAME_PATTERN = re.compile(r'^\$Name:\s*(.+)$', re.IGNORECASE)
+
 class ParseError(Exception):
     """Custom exception for table parsing errors"""
     def __init__(self, message: str, line_number: int = -1, filename: str = ""):
@@ -63,25 +66,39 @@ class ParseState:
     filename: str = ""
     in_multiline_comment: bool = False
     current_section: str = ""
+    # Single line handed back by a parser that read one line too far
+    _pushback: Optional[str] = field(default=None, init=False, repr=False)
     
     def has_more_lines(self) -> bool:
-        return self.current_line < len(self.lines)
+        return self._pushback is not None or self.current_line < len(self.lines)
     
     def peek_line(self) -> Optional[str]:
-        if self.has_more_lines():
+        if self._pushback is not None:
+            return self._pushback
+        if self.current_line < len(self.lines):
             return self.lines[self.current_line]
         return None
     
     def next_line(self) -> Optional[str]:
-        if self.has_more_lines():
+        if self._pushback is not None:
+            line = self._pushback
+            self._pushback = None
+            return line
+        if self.current_line < len(self.lines):
             line = self.lines[self.current_line]
             self.current_line += 1
             return line
         return None
     
     def skip_line(self) -> None:
-        if self.has_more_lines():
+        if self._pushback is not None:
+            self._pushback = None
+        elif self.current_line < len(self.lines):
             self.current_line += 1
+    
+    def pushback(self, line: str) -> None:
+        """Return an over-read line so the next read yields it again"""
+        self._pushback = line
 
 class TableParser(Protocol):
     """Protocol defining the interface for table parsers"""
@@ -104,7 +121,14 @@ class BaseTableConverter(ABC):
     
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._parse_patterns = self._init_parse_patterns()
+        
+        # Patterns are compiled once per converter class and shared by its instances
+        converter_class = type(self)
+        patterns = converter_class.__dict__.get('_shared_parse_patterns')
+        if patterns is None:
+            patterns = self._init_parse_patterns()
+            converter_class._shared_parse_patterns = patterns
+        self._parse_patterns = patterns
     
     @abstractmethod
     def _init_parse_patterns(self) -> Dict[str, re.Pattern]:
@@ -168,8 +192,17 @@ class BaseTableConverter(ABC):
                 return f.read()
     
     def _prepare_parse_state(self, content: str, filename: str) -> ParseState:
-        """Prepare parsing state from file content"""
+        """Prepare parsing state from file content, dropping comments and empty lines up front"""
         lines = content.split('\n')
+        
+        if '/*' in content or '*/' in content:
+            # Block comments carry state across lines, so keep the line-by-line check
+            comment_state = ParseState()
+            lines = [line for line in lines if not self._should_skip_line(line, comment_state)]
+        else:
+            lines = [line for line in lines
+                     if (stripped := line.strip()) and not stripped.startswith(('//', ';'))]
+        
         return ParseState(lines=lines, filename=filename)
     
     def _parse_all_entries(self, state: ParseState) -> List[Dict[str, Any]]:
@@ -180,16 +213,14 @@ class BaseTableConverter(ABC):
             line = state.peek_line()
             if line is None:
                 break
-                
-            # Skip comments and empty lines
-            if self._should_skip_line(line, state):
-                state.skip_line()
-                continue
             
-            # Try to parse entry
+            # Try to parse entry; a parser that consumed nothing must not be retried on the same line
+            position = state.current_line
             entry = self.parse_entry(state)
             if entry:
                 entries.append(entry)
+            elif state.current_line == position:
+                state.skip_line()
         
         return entries
     
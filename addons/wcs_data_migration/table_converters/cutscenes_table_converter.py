@@ -8,7 +8,7 @@ Single Responsibility: Cutscene definitions parsing and conversion only.
 import re
 from typing import Dict, List, Optional, Any
 
-from .base_table_converter import BaseTableConverter, ParseState, TableType
+from .base_table_converter import NAME_PATTERN, BaseTableConverter, ParseState, TableType
 
 class CutscenesTableConverter(BaseTableConverter):
     """Converts WCS cutscenes.tbl files to Godot cutscene resources"""
@@ -17,7 +17,7 @@ class CutscenesTableConverter(BaseTableConverter):
         """Initialize regex patterns for cutscenes.tbl parsing"""
         return {
             'filename': re.compile(r'^\$Filename:\s*(.+)$', re.IGNORECASE),
-            'name': re.compile(r'^\$Name:\s*(.+)$', re.IGNORECASE),
+            'name': NAME_PATTERN,
             'description_start': re.compile(r'^\$Description:$', re.IGNORECASE),
             'description_line': re.compile(r'^XSTR\("(.+)",\s*-1\)$', re.IGNORECASE),
             'description_end': re.compile(r'^\$end_multi_text$', re.IGNORECASE),
@@ -41,15 +41,16 @@ class CutscenesTableConverter(BaseTableConverter):
 
         while state.has_more_lines():
             line = state.peek_line()
-            if not line or self._should_skip_line(line, state):
+            if not line:
                 state.skip_line()
                 continue
             
-            if self._parse_patterns['filename'].match(line.strip()):
+            stripped = line.strip()
+            if self._parse_patterns['filename'].match(stripped):
                 entry = self.parse_entry(state)
                 if entry:
                     entries.append(entry)
-            elif self._parse_patterns['section_end'].match(line.strip()):
+            elif self._parse_patterns['section_end'].match(stripped):
                 break
             else:
                 state.skip_line()
@@ -71,11 +72,11 @@ class CutscenesTableConverter(BaseTableConverter):
                 continue
 
             if self._parse_patterns['filename'].match(line) and 'filename' in entry_data:
-                state.current_line -= 1
+                state.pushback(line)
                 break
             
             if self._parse_patterns['section_end'].match(line):
-                state.current_line -=1
+                state.pushback(line)
                 break
 
             if in_description:
@@ -8,7 +8,46 @@ Handles fireball.tbl files for visual effects configuration.
 
 import re
 from typing import Dict, List, Optional, Any
-from .base_table_converter import BaseTableConverter, ParseState, TableType
+from .base_table_converter import NAME_PATTERN, BaseTableConverter, ParseState, TableType
+
+# Fireball property lines keyed on their lower-case literal "+Key" prefix
+_FIREBALL_PROPERTY_KEYS = {
+    '+bitmap': 'bitmap',
+    '+bitmap low': 'bitmap_low',
+    '+frames': 'frames',
+    '+fps': 'fps',
+    '+lifetime': 'lifetime',
+    '+radius': 'radius',
+    '+light': 'light',
+    '+shockwave': 'shockwave',
+    '+shockwave speed': 'shockwave_speed',
+    '+sound': 'sound',
+    '+sound low': 'sound_low',
+}
+
+_FIREBALL_FLOAT_PROPERTIES = frozenset({'fps', 'lifetime', 'radius', 'light', 'shockwave_speed'})
+
+# Property values, matched against the text after the key's ':' once the
+# key itself has been case-folded for dispatch; values need no IGNORECASE
+_TEXT_VALUE_PATTERN = re.compile(r'\s*(.+)$')
+_INTEGER_VALUE_PATTERN = re.compile(r'\s*(\d+)$')
+_NUMBER_VALUE_PATTERN = re.compile(r'\s*([\d\.]+)$')
+
+# Defaults for every parsed fireball key, merged under each entry before conversion
+_FIREBALL_DEFAULTS = {
+    'name': '',
+    'bitmap': '',
+    'bitmap_low': '',
+    'frames': 1,
+    'fps': 30.0,
+    'lifetime': 1.0,
+    'radius': 50.0,
+    'light': 1.0,
+    'shockwave': False,
+    'shockwave_speed': 300.0,
+    'sound': '',
+    'sound_low': '',
+}
 
 class FireballTableConverter(BaseTableConverter):
     """Converts WCS fireball.tbl files to Godot explosion effect resources"""
@@ -16,19 +55,18 @@ class FireballTableConverter(BaseTableConverter):
     def _init_parse_patterns(self) -> Dict[str, re.Pattern]:
         """Initialize regex patterns for fireball table parsing"""
         return {
-            'fireball_start': re.compile(r'^\$Name:\s*(.+)$', re.IGNORECASE),
-            'bitmap': re.compile(r'^\+Bitmap:\s*(.+)$', re.IGNORECASE),
-            'bitmap_low': re.compile(r'^\+Bitmap Low:\s*(.+)$', re.IGNORECASE),
-            'frames': re.compile(r'^\+Frames:\s*(\d+)$', re.IGNORECASE),
-            'fps': re.compile(r'^\+FPS:\s*([\d\.]+)$', re.IGNORECASE),
-            'lifetime': re.compile(r'^\+Lifetime:\s*([\d\.]+)$', re.IGNORECASE),
-            'radius': re.compile(r'^\+Radius:\s*([\d\.]+)$', re.IGNORECASE),
-            'light': re.compile(r'^\+Light:\s*([\d\.]+)$', re.IGNORECASE),
-            'shockwave': re.compile(r'^\+Shockwave:\s*(YES|NO)$', re.IGNORECASE),
-            'shockwave_speed': re.compile(r'^\+Shockwave Speed:\s*([\d\.]+)$', re.IGNORECASE),
-            'sound': re.compile(r'^\+Sound:\s*(.+)$', re.IGNORECASE),
-            'sound_low': re.compile(r'^\+Sound Low:\s*(.+)$', re.IGNORECASE),
-            'section_end': re.compile(r'^\\$end$', re.IGNORECASE),
+            'fireball_start': NAME_PATTERN,
+            'bitmap': _TEXT_VALUE_PATTERN,
+            'bitmap_low': _TEXT_VALUE_PATTERN,
+            'frames': _INTEGER_VALUE_PATTERN,
+            'fps': _NUMBER_VALUE_PATTERN,
+            'lifetime': _NUMBER_VALUE_PATTERN,
+            'radius': _NUMBER_VALUE_PATTERN,
+            'light': _NUMBER_VALUE_PATTERN,
+            'shockwave_speed': _NUMBER_VALUE_PATTERN,
+            'sound': _TEXT_VALUE_PATTERN,
+            'sound_low': _TEXT_VALUE_PATTERN,
+            'section_end': re.compile(r'^\$end\b', re.IGNORECASE),
         }
     
     def get_table_type(self) -> TableType:
@@ -44,52 +82,62 @@ class FireballTableConverter(BaseTableConverter):
                 continue
                 
             line = line.strip()
-            if not line or self._should_skip_line(line, state):
+            if not line:
                 continue
             
-            # Check for fireball start
+            # Check for fireball start; a second $Name: begins the next entry
             match = self._parse_patterns['fireball_start'].match(line)
             if match:
+                if 'name' in fireball_data:
+                    # Put line back for next iteration
+                    state.pushback(line)
+                    return fireball_data
                 fireball_data['name'] = match.group(1).strip()
                 continue
             
             # Parse fireball properties
             if 'name' in fireball_data:
+                # Check for end before running the property patterns
+                if self._parse_patterns['section_end'].match(line):
+                    # Put line back for next iteration
+                    state.pushback(line)
+                    return fireball_data
+                
                 if self._parse_fireball_property(line, fireball_data):
                     continue
-                
-                # Check for next fireball entry or end
-                if (self._parse_patterns['fireball_start'].match(line) or 
-                    self._parse_patterns['section_end'].match(line)):
-                    # Put line back for next iteration
-                    state.current_line -= 1
-                    return fireball_data if fireball_data else None
         
         return fireball_data if fireball_data else None
     
     def _parse_fireball_property(self, line: str, fireball_data: Dict[str, Any]) -> bool:
         """Parse a single fireball property line"""
-        for property_name, pattern in self._parse_patterns.items():
-            if property_name in ['fireball_start', 'section_end']:
-                continue
-                
-            match = pattern.match(line)
-            if match:
-                value = match.group(1).strip()
-                
-                # Handle different property types
-                if property_name == 'shockwave':
-                    fireball_data[property_name] = value.upper() == 'YES'
-                elif property_name == 'frames':
-                    fireball_data[property_name] = self.parse_value(value, int)
-                elif property_name in ['fps', 'lifetime', 'radius', 'light', 'shockwave_speed']:
-                    fireball_data[property_name] = self.parse_value(value, float)
-                else:
-                    fireball_data[property_name] = value
-                
-                return True
+        prefix, _, value = line.partition(':')
+        property_name = _FIREBALL_PROPERTY_KEYS.get(prefix.lower())
+        if property_name is None:
+            return False
+        
+        # Shockwave is a plain YES/NO flag, so compare strings instead of running a regex
+        if property_name == 'shockwave':
+            flag = value.strip().upper()
+            if flag not in ('YES', 'NO'):
+                return False
+            fireball_data[property_name] = flag == 'YES'
+            return True
+        
+        match = self._parse_patterns[property_name].match(value)
+        if not match:
+            return False
+        
+        value = match.group(1).strip()
         
-        return False
+        # Handle different property types
+        if property_name == 'frames':
+            fireball_data[property_name] = self.parse_value(value, int)
+        elif property_name in _FIREBALL_FLOAT_PROPERTIES:
+            fireball_data[property_name] = self.parse_value(value, float)
+        else:
+            fireball_data[property_name] = value
+        
+        return True
     
     def validate_entry(self, entry: Dict[str, Any]) -> bool:
         """Validate a parsed fireball entry"""
@@ -129,17 +177,18 @@ class FireballTableConverter(BaseTableConverter):
     
     def _convert_fireball_entry(self, fireball: Dict[str, Any]) -> Dict[str, Any]:
         """Convert a single fireball entry to Godot format"""
+        merged = _FIREBALL_DEFAULTS | fireball
         return {
-            'display_name': fireball.get('name', ''),
-            'bitmap': fireball.get('bitmap', ''),
-            'bitmap_low': fireball.get('bitmap_low', ''),
-            'frames': fireball.get('frames', 1),
-            'fps': fireball.get('fps', 30.0),
-            'lifetime': fireball.get('lifetime', 1.0),
-            'radius': fireball.get('radius', 50.0),
-            'light_intensity': fireball.get('light', 1.0),
-            'has_shockwave': fireball.get('shockwave', False),
-            'shockwave_speed': fireball.get('shockwave_speed', 300.0),
-            'sound': fireball.get('sound', ''),
-            'sound_low': fireball.get('sound_low', '')
+            'display_name': merged['name'],
+            'bitmap': merged['bitmap'],
+            'bitmap_low': merged['bitmap_low'],
+            'frames': merged['frames'],
+            'fps': merged['fps'],
+            'lifetime': merged['lifetime'],
+            'radius': merged['radius'],
+            'light_intensity': merged['light'],
+            'has_shockwave': merged['shockwave'],
+            'shockwave_speed': merged['shockwave_speed'],
+            'sound': merged['sound'],
+            'sound_low': merged['sound_low']
         }
\ No newline at end of file
@@ -7,21 +7,41 @@ Single Responsibility: IFF (Identification Friend or Foe) definitions parsing on
 
 import re
 from typing import Dict, List, Optional, Any
-from .base_table_converter import BaseTableConverter, ParseState, TableType
+from .base_table_converter import NAME_PATTERN, BaseTableConverter, ParseState, TableType
 
 class IFFTableConverter(BaseTableConverter):
     """Converts WCS iff_defs.tbl files to Godot IFF resources"""
     
     def _init_parse_patterns(self) -> Dict[str, re.Pattern]:
         return {
-            'iff_start': re.compile(r'^\$Name:\s*(.+)$', re.IGNORECASE)
+            'iff_start': NAME_PATTERN
         }
     
     def get_table_type(self) -> TableType:
         return TableType.IFF
     
     def parse_entry(self, state: ParseState) -> Optional[Dict[str, Any]]:
-        return None
+        """Parse a single IFF entry, consuming lines up to the next $Name: or # section line"""
+        iff_data: Dict[str, Any] = {}
+        
+        while state.has_more_lines():
+            line = state.next_line().strip()
+            
+            # Section lines (#End, the next table section) close the current entry
+            if line.startswith('#'):
+                if 'name' in iff_data:
+                    state.pushback(line)
+                    break
+                continue
+            
+            match = self._parse_patterns['iff_start'].match(line)
+            if match:
+                if 'name' in iff_data:
+                    state.pushback(line)
+                    break
+                iff_data['name'] = match.group(1).strip()
+        
+        return iff_data or None
     
     def validate_entry(self, entry: Dict[str, Any]) -> bool:
         return True
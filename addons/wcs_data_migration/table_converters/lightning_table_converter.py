@@ -10,35 +10,61 @@ from typing import Dict, List, Optional, Any
 
 from .base_table_converter import BaseTableConverter, ParseState, TableType
 
+# Compiled once at import and shared by every converter instance
+_LIGHTNING_PATTERNS = {
+    'bolts_start': re.compile(r'^#Bolts begin', re.IGNORECASE),
+    'bolt_start': re.compile(r'^\$Bolt:\s*(.+)$', re.IGNORECASE),
+    'bolt_scale': re.compile(r'^\+b_scale:\s*([\d\.]+)$', re.IGNORECASE),
+    'bolt_shrink': re.compile(r'^\+b_shrink:\s*([\d\.]+)$', re.IGNORECASE),
+    'bolt_poly_pct': re.compile(r'^\+b_poly_pct:\s*([\d\.]+)$', re.IGNORECASE),
+    'bolt_rand': re.compile(r'^\+b_rand:\s*([\d\.]+)$', re.IGNORECASE),
+    'bolt_add': re.compile(r'^\+b_add:\s*([\d\.]+)$', re.IGNORECASE),
+    'bolt_strikes': re.compile(r'^\+b_strikes:\s*(\d+)$', re.IGNORECASE),
+    'bolt_lifetime': re.compile(r'^\+b_lifetime:\s*(\d+)$', re.IGNORECASE),
+    'bolt_noise': re.compile(r'^\+b_noise:\s*([\d\.]+)$', re.IGNORECASE),
+    'bolt_emp': re.compile(r'^\+b_emp:\s*([\d\.]+)\s+([\d\.]+)$', re.IGNORECASE),
+    'bolt_texture': re.compile(r'^\+b_texture:\s*(.+)$', re.IGNORECASE),
+    'bolt_glow': re.compile(r'^\+b_glow:\s*(.+)$', re.IGNORECASE),
+    'bolt_bright': re.compile(r'^\+b_bright:\s*([\d\.]+)$', re.IGNORECASE),
+    'bolts_end': re.compile(r'^#Bolts end', re.IGNORECASE),
+    'storms_start': re.compile(r'^#Storms begin', re.IGNORECASE),
+    'storm_start': re.compile(r'^\$Storm:\s*(.+)$', re.IGNORECASE),
+    'storm_bolt': re.compile(r'^\+bolt:\s*(.+)$', re.IGNORECASE),
+    'storm_flavor': re.compile(r'^\+flavor:\s*([\d\.]+)\s+([\d\.]+)\s+([\d\.]+)$', re.IGNORECASE),
+    'storm_random_freq': re.compile(r'^\+random_freq:\s*(\d+)\s+(\d+)$', re.IGNORECASE),
+    'storm_random_count': re.compile(r'^\+random_count:\s*(\d+)\s+(\d+)$', re.IGNORECASE),
+    'storms_end': re.compile(r'^#Storms end', re.IGNORECASE),
+}
+
+# All bolt property patterns fused into one alternation (group name is the
+# property name without the 'bolt_' prefix) so each line is matched once
+_BOLT_PROPERTY_PATTERN = re.compile(
+    '^(?:' + '|'.join(
+        f'(?P<{key[len("bolt_"):]}>{pattern.pattern[1:]})'
+        for key, pattern in _LIGHTNING_PATTERNS.items()
+        if key.startswith('bolt_') and key != 'bolt_start'
+    ) + ')',
+    re.IGNORECASE
+)
+
+# Bolt property value types; anything not listed is kept as a stripped string
+_BOLT_FLOAT_KEYS = frozenset({'scale', 'shrink', 'poly_pct', 'rand', 'add', 'noise', 'bright'})
+_BOLT_INT_KEYS = frozenset({'strikes', 'lifetime'})
+
+# Storm list properties keyed on their literal "+key" prefix:
+# (field, value pattern, element type); +bolt appends and is handled separately
+_STORM_LIST_PROPERTIES = {
+    '+flavor': ('flavor', _LIGHTNING_PATTERNS['storm_flavor'], float),
+    '+random_freq': ('random_freq', _LIGHTNING_PATTERNS['storm_random_freq'], int),
+    '+random_count': ('random_count', _LIGHTNING_PATTERNS['storm_random_count'], int),
+}
+
 class LightningTableConverter(BaseTableConverter):
     """Converts WCS lightning.tbl files to Godot lightning effect resources"""
 
     def _init_parse_patterns(self) -> Dict[str, re.Pattern]:
-        """Initialize regex patterns for lightning.tbl parsing"""
-        return {
-            'bolts_start': re.compile(r'^#Bolts begin', re.IGNORECASE),
-            'bolt_start': re.compile(r'^\$Bolt:\s*(.+)$', re.IGNORECASE),
-            'bolt_scale': re.compile(r'^\+b_scale:\s*([\d\.]+)$', re.IGNORECASE),
-            'bolt_shrink': re.compile(r'^\+b_shrink:\s*([\d\.]+)$', re.IGNORECASE),
-            'bolt_poly_pct': re.compile(r'^\+b_poly_pct:\s*([\d\.]+)$', re.IGNORECASE),
-            'bolt_rand': re.compile(r'^\+b_rand:\s*([\d\.]+)$', re.IGNORECASE),
-            'bolt_add': re.compile(r'^\+b_add:\s*([\d\.]+)$', re.IGNORECASE),
-            'bolt_strikes': re.compile(r'^\+b_strikes:\s*(\d+)$', re.IGNORECASE),
-            'bolt_lifetime': re.compile(r'^\+b_lifetime:\s*(\d+)$', re.IGNORECASE),
-            'bolt_noise': re.compile(r'^\+b_noise:\s*([\d\.]+)$', re.IGNORECASE),
-            'bolt_emp': re.compile(r'^\+b_emp:\s*([\d\.]+)\s+([\d\.]+)$', re.IGNORECASE),
-            'bolt_texture': re.compile(r'^\+b_texture:\s*(.+)$', re.IGNORECASE),
-            'bolt_glow': re.compile(r'^\+b_glow:\s*(.+)$', re.IGNORECASE),
-            'bolt_bright': re.compile(r'^\+b_bright:\s*([\d\.]+)$', re.IGNORECASE),
-            'bolts_end': re.compile(r'^#Bolts end', re.IGNORECASE),
-            'storms_start': re.compile(r'^#Storms begin', re.IGNORECASE),
-            'storm_start': re.compile(r'^\$Storm:\s*(.+)$', re.IGNORECASE),
-            'storm_bolt': re.compile(r'^\+bolt:\s*(.+)$', re.IGNORECASE),
-            'storm_flavor': re.compile(r'^\+flavor:\s*([\d\.]+)\s+([\d\.]+)\s+([\d\.]+)$', re.IGNORECASE),
-            'storm_random_freq': re.compile(r'^\+random_freq:\s*(\d+)\s+(\d+)$', re.IGNORECASE),
-            'storm_random_count': re.compile(r'^\+random_count:\s*(\d+)\s+(\d+)$', re.IGNORECASE),
-            'storms_end': re.compile(r'^#Storms end', re.IGNORECASE),
-        }
+        """Return the shared regex patterns for lightning.tbl parsing"""
+        return _LIGHTNING_PATTERNS
 
     def get_table_type(self) -> TableType:
         return TableType.LIGHTNING
@@ -53,30 +79,33 @@ class LightningTableConverter(BaseTableConverter):
 
         while state.has_more_lines():
             line = state.next_line()
-            if not line or self._should_skip_line(line, state):
+            if not line:
                 continue
             
             line = line.strip()
 
-            if self._parse_patterns['bolts_start'].match(line):
-                in_bolts = True
-                continue
-            if self._parse_patterns['bolts_end'].match(line):
-                if current_bolt:
-                    entries['bolts'].append(current_bolt)
-                in_bolts = False
-                current_bolt = None
-                continue
-            
-            if self._parse_patterns['storms_start'].match(line):
-                in_storms = True
-                continue
-            if self._parse_patterns['storms_end'].match(line):
-                if current_storm:
-                    entries['storms'].append(current_storm)
-                in_storms = False
-                current_storm = None
-                continue
+            # Section markers are the only lines starting with '#', so property
+            # lines skip the four marker patterns entirely
+            if line.startswith('#'):
+                if self._parse_patterns['bolts_start'].match(line):
+                    in_bolts = True
+                    continue
+                if self._parse_patterns['bolts_end'].match(line):
+                    if current_bolt:
+                        entries['bolts'].append(current_bolt)
+                    in_bolts = False
+                    current_bolt = None
+                    continue
+                
+                if self._parse_patterns['storms_start'].match(line):
+                    in_storms = True
+                    continue
+                if self._parse_patterns['storms_end'].match(line):
+                    if current_storm:
+                        entries['storms'].append(current_storm)
+                    in_storms = False
+                    current_storm = None
+                    continue
 
             if in_bolts:
                 match = self._parse_patterns['bolt_start'].match(line)
@@ -103,43 +132,40 @@ class LightningTableConverter(BaseTableConverter):
 
     def parse_bolt_property(self, line: str, bolt: Dict[str, Any]):
         """Parse a single bolt property line."""
-        for prop, pattern in self._init_parse_patterns().items():
-            if not prop.startswith('bolt_'):
-                continue
-            match = pattern.match(line)
-            if match:
-                key = prop.replace('bolt_', '')
-                if key in ['scale', 'shrink', 'poly_pct', 'rand', 'add', 'noise', 'bright']:
-                    bolt[key] = float(match.group(1))
-                elif key in ['strikes', 'lifetime']:
-                    bolt[key] = int(match.group(1))
-                elif key == 'emp':
-                    bolt[key] = [float(g) for g in match.groups()]
-                else:
-                    bolt[key] = match.group(1).strip()
-                return
+        match = _BOLT_PROPERTY_PATTERN.match(line)
+        if not match:
+            return
+        
+        key = match.lastgroup
+        # Value groups follow the named alternative that matched
+        value_index = match.lastindex + 1
+        if key in _BOLT_FLOAT_KEYS:
+            bolt[key] = float(match.group(value_index))
+        elif key in _BOLT_INT_KEYS:
+            bolt[key] = int(match.group(value_index))
+        elif key == 'emp':
+            bolt[key] = [float(g) for g in match.group(value_index, value_index + 1)]
+        else:
+            bolt[key] = match.group(value_index).strip()
 
     def parse_storm_property(self, line: str, storm: Dict[str, Any]):
         """Parse a single storm property line."""
-        match = self._parse_patterns['storm_bolt'].match(line)
-        if match:
-            storm['bolts'].append(match.group(1).strip())
+        # Dispatch on the literal key so only the one matching pattern runs
+        prefix = line.partition(':')[0].lower()
+        if prefix == '+bolt':
+            match = self._parse_patterns['storm_bolt'].match(line)
+            if match:
+                storm['bolts'].append(match.group(1).strip())
             return
         
-        match = self._parse_patterns['storm_flavor'].match(line)
-        if match:
-            storm['flavor'] = [float(g) for g in match.groups()]
+        spec = _STORM_LIST_PROPERTIES.get(prefix)
+        if spec is None:
             return
-            
-        match = self._parse_patterns['storm_random_freq'].match(line)
-        if match:
-            storm['random_freq'] = [int(g) for g in match.groups()]
-            return
-
-        match = self._parse_patterns['storm_random_count'].match(line)
+        
+        field, pattern, value_type = spec
+        match = pattern.match(line)
         if match:
-            storm['random_count'] = [int(g) for g in match.groups()]
-            return
+            storm[field] = [value_type(g) for g in match.groups()]
 
     def parse_entry(self, state: ParseState) -> Optional[Dict[str, Any]]:
         """Not used when parse_table is overridden."""
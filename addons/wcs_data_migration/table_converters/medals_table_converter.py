@@ -8,7 +8,7 @@ Single Responsibility: Medal definitions parsing and conversion only.
 import re
 from typing import Dict, List, Optional, Any
 
-from .base_table_converter import BaseTableConverter, ParseState, TableType
+from .base_table_converter import NAME_PATTERN, BaseTableConverter, ParseState, TableType
 
 class MedalsTableConverter(BaseTableConverter):
     """Converts WCS medals.tbl files to Godot medal resources"""
@@ -16,7 +16,7 @@ class MedalsTableConverter(BaseTableConverter):
     def _init_parse_patterns(self) -> Dict[str, re.Pattern]:
         """Initialize regex patterns for medals.tbl parsing"""
         return {
-            'name': re.compile(r'^\$Name:\s*(.+)$', re.IGNORECASE),
+            'name': NAME_PATTERN,
             'bitmap': re.compile(r'^\$Bitmap:\s*(.+)$', re.IGNORECASE),
             'num_levels': re.compile(r'^\$Num Levels:\s*(\d+)$', re.IGNORECASE),
             'section_end': re.compile(r'^#End$', re.IGNORECASE),
@@ -30,7 +30,7 @@ class MedalsTableConverter(BaseTableConverter):
         entries = []
         while state.has_more_lines():
             line = state.peek_line()
-            if not line or self._should_skip_line(line, state):
+            if not line:
                 state.skip_line()
                 continue
             
@@ -58,11 +58,11 @@ class MedalsTableConverter(BaseTableConverter):
                 continue
 
             if self._parse_patterns['name'].match(line) and 'name' in entry_data:
-                state.current_line -= 1
+                state.pushback(line)
                 break
             
             if self._parse_patterns['section_end'].match(line):
-                state.current_line -=1
+                state.pushback(line)
                 break
 
             match = self._parse_patterns['name'].match(line)
@@ -8,7 +8,7 @@ Single Responsibility: Player rank definitions parsing and conversion only.
 import re
 from typing import Dict, List, Optional, Any
 
-from .base_table_converter import BaseTableConverter, ParseState, TableType
+from .base_table_converter import NAME_PATTERN, BaseTableConverter, ParseState, TableType
 
 class RankTableConverter(BaseTableConverter):
     """Converts WCS rank.tbl files to Godot rank resources"""
@@ -16,7 +16,7 @@ class RankTableConverter(BaseTableConverter):
     def _init_parse_patterns(self) -> Dict[str, re.Pattern]:
         """Initialize regex patterns for rank.tbl parsing"""
         return {
-            'name': re.compile(r'^\$Name:\s*(.+)$', re.IGNORECASE),
+            'name': NAME_PATTERN,
             'points': re.compile(r'^\$Points:\s*(\d+)$', re.IGNORECASE),
             'bitmap': re.compile(r'^\$Bitmap:\s*(.+)$', re.IGNORECASE),
             'promo_voice': re.compile(r'^\$Promotion Voice Base:\s*(.+)$', re.IGNORECASE),
@@ -42,15 +42,16 @@ class RankTableConverter(BaseTableConverter):
 
         while state.has_more_lines():
             line = state.peek_line()
-            if not line or self._should_skip_line(line, state):
+            if not line:
                 state.skip_line()
                 continue
             
-            if self._parse_patterns['name'].match(line.strip()):
+            stripped = line.strip()
+            if self._parse_patterns['name'].match(stripped):
                 entry = self.parse_entry(state)
                 if entry:
                     entries.append(entry)
-            elif self._parse_patterns['section_end'].match(line.strip()):
+            elif self._parse_patterns['section_end'].match(stripped):
                 break
             else:
                 state.skip_line()
@@ -72,11 +73,11 @@ class RankTableConverter(BaseTableConverter):
                 continue
 
             if self._parse_patterns['name'].match(line) and 'name' in entry_data:
-                state.current_line -= 1
+                state.pushback(line)
                 break
             
             if self._parse_patterns['section_end'].match(line):
-                state.current_line -=1
+                state.pushback(line)
                 break
 
             if in_promo_text:
@@ -30,7 +30,7 @@ class ScriptingTableConverter(BaseTableConverter):
         entries = []
         while state.has_more_lines():
             line = state.peek_line()
-            if not line or self._should_skip_line(line, state):
+            if not line:
                 state.skip_line()
                 continue
             
@@ -10,7 +10,7 @@ Single Responsibility: Ship table parsing and conversion only.
 
 import re
 from typing import Dict, List, Optional, Any
-from .base_table_converter import BaseTableConverter, ParseState, TableType
+from .base_table_converter import NAME_PATTERN, BaseTableConverter, ParseState, TableType
 
 class ShipTableConverter(BaseTableConverter):
     """Converts WCS ships.tbl files to Godot ship resources"""
@@ -19,7 +19,7 @@ class ShipTableConverter(BaseTableConverter):
         """Initialize regex patterns for ship table parsing"""
         return {
             # Basic ship identification
-            'ship_start': re.compile(r'^\$Name:\s*(.+)$', re.IGNORECASE),
+            'ship_start': NAME_PATTERN,
             'short_name': re.compile(r'^\$Short name:\s*(.+)$', re.IGNORECASE),
             'species': re.compile(r'^\$Species:\s*(.+)$', re.IGNORECASE),
             'type': re.compile(r'^\$Type:\s*(.+)$', re.IGNORECASE),
@@ -99,7 +99,7 @@ class ShipTableConverter(BaseTableConverter):
                 continue
                 
             line = line.strip()
-            if not line or self._should_skip_line(line, state):
+            if not line:
                 continue
             
             # Check for ship start
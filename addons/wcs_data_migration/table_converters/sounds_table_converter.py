@@ -9,11 +9,21 @@ logic of other converters.
 """
 
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 
 from .base_table_converter import BaseTableConverter, ParseState, TableType
 from core.path_resolver import TargetPathResolver
 
+# Optional sound parameters seeded on every parsed entry so conversion can
+# index them directly
+_SOUND_PARAMETER_DEFAULTS = {
+    'preload': False,
+    'default_volume': 0.8,
+    'is_3d': False,
+    'min_distance': 100.0,
+    'max_distance': 1000.0,
+}
+
 class SoundsTableConverter(BaseTableConverter):
     """Converts WCS sounds.tbl files to Godot audio resources"""
 
@@ -35,34 +45,46 @@ class SoundsTableConverter(BaseTableConverter):
         """
         entries = []
         current_section = "unknown"
-
-        while state.has_more_lines():
-            line = state.next_line()
-            if not line or self._should_skip_line(line, state):
+        
+        # Bind the per-line calls to locals once instead of resolving them on every line
+        has_more_lines = state.has_more_lines
+        next_line = state.next_line
+        match_section_start = self._parse_patterns['section_start'].match
+        match_section_end = self._parse_patterns['section_end'].match
+        parse_standard_sound = self._parse_standard_sound
+        parse_flyby_sound = self._parse_flyby_sound
+        validate_entry = self.validate_entry
+        add_entry = entries.append
+
+        while has_more_lines():
+            line = next_line()
+            if not line:
                 continue
 
-            # Update current section
-            start_match = self._parse_patterns['section_start'].match(line)
-            if start_match:
-                current_section = start_match.group(1).lower()
-                self.logger.info(f"Parsing sound section: '{current_section}'")
-                continue
-
-            end_match = self._parse_patterns['section_end'].match(line)
-            if end_match:
-                self.logger.info(f"Finished parsing sound section: '{current_section}'")
-                current_section = "unknown"
-                continue
+            # Update current section; markers always start with '#', so sound
+            # entry lines skip both section patterns
+            if line.startswith('#'):
+                start_match = match_section_start(line)
+                if start_match:
+                    current_section = start_match.group(1).lower()
+                    self.logger.info(f"Parsing sound section: '{current_section}'")
+                    continue
+
+                end_match = match_section_end(line)
+                if end_match:
+                    self.logger.info(f"Finished parsing sound section: '{current_section}'")
+                    current_section = "unknown"
+                    continue
 
             # Parse entry based on current section
             entry = None
             if current_section == 'flyby':
-                entry = self._parse_flyby_sound(line, current_section)
+                entry = parse_flyby_sound(line, current_section)
             elif current_section in ['game', 'interface']:
-                entry = self._parse_standard_sound(line, current_section)
+                entry = parse_standard_sound(line, current_section)
             
-            if entry and self.validate_entry(entry):
-                entries.append(entry)
+            if entry and validate_entry(entry):
+                add_entry(entry)
         
         return entries
 
@@ -95,6 +117,7 @@ class SoundsTableConverter(BaseTableConverter):
             return None
 
         sound_data = {'name': name, 'filename': parts[0], 'comment': comment.strip() if comment else ''}
+        sound_data.update(_SOUND_PARAMETER_DEFAULTS)
         
         try:
             if len(parts) > 1: sound_data['preload'] = self.parse_value(parts[1], int) > 0
@@ -118,25 +141,35 @@ class SoundsTableConverter(BaseTableConverter):
             
         return True
 
-    def convert_to_godot_resource(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Convert parsed sound entries to a Godot resource dictionary."""
+    def convert_to_godot_resource(self, entries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Convert parsed sound entries to a Godot resource dictionary.
+        
+        Entries are consumed in a single pass, so a generator of parsed entries
+        works as well as a list.
+        """
+        sounds = {}
+        sound_count = 0
+        for entry in entries:
+            sounds[entry['name']] = self._convert_sound_entry(entry)
+            sound_count += 1
+        
         return {
             'resource_type': 'WCSSoundDatabase',
-            'sounds': {entry['name']: self._convert_sound_entry(entry) for entry in entries},
-            'sound_count': len(entries)
+            'sounds': sounds,
+            'sound_count': sound_count
         }
 
     def _convert_sound_entry(self, sound: Dict[str, Any]) -> Dict[str, Any]:
         """Convert a single sound entry to the target Godot format."""
         return {
-            'display_name': sound.get('name', 'Unknown Sound'),
-            'filename': sound.get('filename'),
-            'description': sound.get('comment', ''),
-            'default_volume': sound.get('default_volume', 0.8),
-            'preload': sound.get('preload', False),
-            'is_3d': sound.get('is_3d', False),
-            'min_distance': sound.get('min_distance', 100.0),
-            'max_distance': sound.get('max_distance', 1000.0),
+            'display_name': sound['name'],
+            'filename': sound['filename'],
+            'description': sound['comment'],
+            'default_volume': sound['default_volume'],
+            'preload': sound['preload'],
+            'is_3d': sound['is_3d'],
+            'min_distance': sound['min_distance'],
+            'max_distance': sound['max_distance'],
         }
 
     def parse_entry(self, state: ParseState) -> Optional[Dict[str, Any]]:
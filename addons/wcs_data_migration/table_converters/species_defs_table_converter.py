@@ -44,7 +44,7 @@ class SpeciesDefsTableConverter(BaseTableConverter):
 
         while state.has_more_lines():
             line = state.peek_line()
-            if not line or self._should_skip_line(line, state):
+            if not line:
                 state.skip_line()
                 continue
             
@@ -66,14 +66,14 @@ class SpeciesDefsTableConverter(BaseTableConverter):
                 continue
             
             line = line.strip()
-            if not line or self._should_skip_line(line, state):
+            if not line:
                 continue
 
             if self._parse_patterns['section_end'].match(line):
                 break
             
             if self._parse_patterns['species_start'].match(line) and 'name' in entry_data:
-                 state.current_line -= 1
+                 state.pushback(line)
                  break
 
             match = self._parse_patterns['species_start'].match(line)
@@ -34,7 +34,7 @@ class SpeciesTableConverter(BaseTableConverter):
         entries = []
         while state.has_more_lines():
             line = state.peek_line()
-            if not line or self._should_skip_line(line, state):
+            if not line:
                 state.skip_line()
                 continue
             
@@ -61,13 +61,13 @@ class SpeciesTableConverter(BaseTableConverter):
                 continue
             
             line = line.strip()
-            if not line or self._should_skip_line(line, state):
+            if not line:
                 continue
 
             if self._parse_patterns['entry_start'].match(line):
                 # We've hit the next entry, so we're done with the current one.
                 # We need to put the line back for the next call to parse_entry.
-                state.current_line -= 1
+                state.pushback(line)
                 break
 
             if in_description:
@@ -52,7 +52,7 @@ class StarsTableConverter(BaseTableConverter):
 
         while state.has_more_lines():
             line = state.next_line()
-            if not line or self._should_skip_line(line, state):
+            if not line:
                 continue
 
             line = line.strip()
@@ -8,7 +8,7 @@ Single Responsibility: Weapon table parsing and conversion only.
 
 import re
 from typing import Dict, List, Optional, Any
-from .base_table_converter import BaseTableConverter, ParseState, TableType
+from .base_table_converter import NAME_PATTERN, BaseTableConverter, ParseState, TableType
 
 class WeaponTableConverter(BaseTableConverter):
     """Converts WCS weapons.tbl files to Godot weapon resources"""
@@ -17,7 +17,7 @@ class WeaponTableConverter(BaseTableConverter):
         """Initialize regex patterns for weapon table parsing with comprehensive asset fields"""
         return {
             # Basic weapon identification
-            'weapon_start': re.compile(r'^\$Name:\s*(.+)$', re.IGNORECASE),
+            'weapon_start': NAME_PATTERN,
             'title': re.compile(r'^\$Title:\s*(.+)$', re.IGNORECASE),
             'alt_name': re.compile(r'^\$Alt name:\s*(.+)$', re.IGNORECASE),
             'description': re.compile(r'^\$Description:\s*(.+)$', re.IGNORECASE),
@@ -99,7 +99,7 @@ class WeaponTableConverter(BaseTableConverter):
                 continue
                 
             line = line.strip()
-            if not line or self._should_skip_line(line, state):
+            if not line:
                 continue
             
             # Check for weapon start
@@ -23,7 +23,7 @@ import logging
 import re
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Dict, List, Optional, Set, Tuple, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum
 
@@ -372,6 +372,15 @@ class TableDataConverter:
         
         # Ensure output directory exists
         self.assets_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Resource directories already created, so per-entry writes skip mkdir
+        self._created_dirs: Set[Path] = {self.assets_dir}
+    
+    def _ensure_directory(self, directory: Path) -> None:
+        """Create a resource directory the first time it is written to"""
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
     
     def convert_table_file(self, table_file: Path) -> bool:
         """
@@ -729,7 +738,7 @@ class TableDataConverter:
             # Write resource file
             resource_filename = f"{ship_data.name.lower().replace(' ', '_')}.tres"
             resource_path = self.assets_dir / "ships" / resource_filename
-            resource_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_directory(resource_path.parent)
             
             with open(resource_path, 'w', encoding='utf-8') as f:
                 f.write(resource_content)
@@ -1032,7 +1041,7 @@ piercing_damage_draw_limit = {ship.piercing_damage_draw_limit}
             # Write resource file
             resource_filename = f"{weapon_data.name.lower().replace(' ', '_')}.tres"
             resource_path = self.assets_dir / "weapons" / resource_filename
-            resource_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_directory(resource_path.parent)
             
             with open(resource_path, 'w', encoding='utf-8') as f:
                 f.write(resource_content)
@@ -1204,7 +1213,7 @@ impact_sound_filename = "{weapon.impact_sound}"
             # Write resource file
             resource_filename = f"{armor_data.name.lower().replace(' ', '_')}.tres"
             resource_path = self.assets_dir / "armor" / resource_filename
-            resource_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_directory(resource_path.parent)
             
             with open(resource_path, 'w', encoding='utf-8') as f:
                 f.write(resource_content)
@@ -1342,7 +1351,7 @@ armor_thickness = 1.0
             # Write resource file
             resource_filename = f"{species_data.name.lower().replace(' ', '_')}.tres"
             resource_path = self.assets_dir / "species" / resource_filename
-            resource_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_directory(resource_path.parent)
             
             with open(resource_path, 'w', encoding='utf-8') as f:
                 f.write(resource_content)
@@ -1498,7 +1507,7 @@ debris_fire_lifetime = {species.debris_fire_lifetime}
             # Write resource file
             resource_filename = f"{iff_data.name.lower().replace(' ', '_')}.tres"
             resource_path = self.assets_dir / "factions" / resource_filename
-            resource_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_directory(resource_path.parent)
             
             with open(resource_path, 'w', encoding='utf-8') as f:
                 f.write(resource_content)
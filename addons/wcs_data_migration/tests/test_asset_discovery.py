@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Path tests for AssetDiscoveryEngine
+
+Builds small asset layouts in a temporary source directory and checks the
+source-relative paths of the discovered relationships.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.asset_discovery import AssetDiscoveryEngine
+
+
+def _touch(path: Path) -> Path:
+    """Create an empty file (and its parent directories)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b'')
+    return path
+
+
+def test_effect_frames_at_source_root(tmp_path: Path):
+    """Frames next to a root-level .eff file get bare file names, like the .eff itself"""
+    eff_file = _touch(tmp_path / 'boom.eff')
+    for frame in ('boom_0001.dds', 'boom_0002.dds'):
+        _touch(tmp_path / frame)
+
+    relationships = AssetDiscoveryEngine(tmp_path)._create_effect_relationships(eff_file, 'boom')
+
+    assert [rel.source_path for rel in relationships] == ['boom.eff', 'boom_0001.dds', 'boom_0002.dds']
+
+
+def test_effect_frames_use_native_separators(tmp_path: Path):
+    """Frame paths match the str(relative_to) format of the .eff path"""
+    eff_file = _touch(tmp_path / 'hermes_effects' / 'boom.eff')
+    _touch(tmp_path / 'hermes_effects' / 'boom_0001.dds')
+
+    relationships = AssetDiscoveryEngine(tmp_path)._create_effect_relationships(eff_file, 'boom')
+
+    assert [rel.source_path for rel in relationships] == [
+        str(Path('hermes_effects', 'boom.eff')),
+        os.path.join('hermes_effects', 'boom_0001.dds'),
+    ]
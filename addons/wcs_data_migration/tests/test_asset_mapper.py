@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+File scan tests for AssetMapper
+
+Builds a small source tree in a temporary directory and checks the
+source-relative paths the unmapped-file scan works with.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_structures import AssetMapping, AssetRelationship
+from tools.asset_mapper import AssetMapper
+
+MODEL_PATH = os.path.join('hermes_models', 'tcf_rapier.pof')
+
+
+@pytest.fixture
+def source_tree(tmp_path: Path, monkeypatch) -> Path:
+    """Source tree with one ship model, used as the working directory"""
+    (tmp_path / 'hermes_models').mkdir()
+    (tmp_path / MODEL_PATH).write_bytes(b'PSPO')
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.parametrize('source_dir', ['.', 'absolute'])
+def test_unmapped_files_get_source_relative_paths(source_tree: Path, source_dir: str):
+    """Scanned files are mapped by their path relative to source_dir, also for source_dir='.'"""
+    mapper = AssetMapper(source_tree if source_dir == 'absolute' else Path(source_dir), {})
+
+    mapper._scan_and_map_unmapped_files()
+
+    assert mapper.asset_mappings['tcf_rapier'].primary_asset.source_path == MODEL_PATH
+
+
+def test_mapped_files_are_not_mapped_again(source_tree: Path):
+    """Files already referenced by a mapping are skipped by the scan of a relative source_dir"""
+    mapper = AssetMapper(Path('.'), {})
+    mapper.asset_mappings['Rapier'] = AssetMapping(
+        entity_name='Rapier',
+        entity_type='ship',
+        primary_asset=AssetRelationship(
+            source_path=MODEL_PATH,
+            target_path='',
+            asset_type='model',
+            parent_entity='Rapier',
+            relationship_type='primary'
+        ),
+        related_assets=[]
+    )
+
+    mapper._scan_and_map_unmapped_files()
+
+    assert list(mapper.asset_mappings) == ['Rapier']
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Asset scan tests for ConversionOrchestrator
+
+Builds a small WCS install layout in a temporary directory and checks
+which files the source scan picks up.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.conversion.conversion_orchestrator import ConversionOrchestrator
+
+
+def test_scan_matches_extensions_case_insensitively(tmp_path: Path):
+    """Upper-case extensions (common on Windows installs) are scanned like lower-case ones"""
+    source_dir = tmp_path / 'wcs'
+    for rel_path in ('DATA.VP', 'data/tables/SHIPS.TBL', 'data/models/FOO.POF',
+                     'data/missions/m01.Fs2', 'data/tables/readme.txt'):
+        file_path = source_dir / rel_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(b'')
+
+    assets = ConversionOrchestrator(source_dir, tmp_path / 'godot')._scan_wcs_assets()
+
+    assert {kind: [path.relative_to(source_dir).as_posix() for path in paths]
+            for kind, paths in assets.items()} == {
+        'vp_archives': ['DATA.VP'],
+        'pof_models': ['data/models/FOO.POF'],
+        'mission_files': ['data/missions/m01.Fs2'],
+        'table_files': ['data/tables/SHIPS.TBL'],
+        'config_files': [],
+    }
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Table parsing tests for RelationshipBuilder
+
+Builds small WCS tables in a temporary source directory and checks the
+entity relationships extracted from them.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.relationship_builder import RelationshipBuilder
+
+
+def _write_table(directory: Path, name: str, content: str) -> Path:
+    """Write a table file and return its path"""
+    table_path = directory / name
+    table_path.write_text(content, encoding='utf-8')
+    return table_path
+
+
+@pytest.fixture
+def source_dir(tmp_path: Path) -> Path:
+    """Source directory with the Hermes subdirectories the builder looks in"""
+    for directory in ('hermes_core', 'hermes_models', 'hermes_sounds'):
+        (tmp_path / directory).mkdir()
+    return tmp_path
+
+
+def test_weapon_directives_are_matched(source_dir: Path):
+    """Weapon name, model and launch sound directives produce relationships"""
+    _write_table(source_dir / 'hermes_core', 'sounds.tbl',
+                 "#Game Sounds Start\n$Name: 12 laser_fire.wav, 0, 0.5\n#Game Sounds End\n")
+    (source_dir / 'hermes_sounds' / 'laser_fire.wav').write_bytes(b'')
+    weapons_table = _write_table(source_dir / 'hermes_core', 'weapons.tbl', (
+        "#Primary Weapons\n"
+        "$Name: Laser\n"
+        "$Model File: laser.pof\n"
+        "$LaunchSnd: 12\n"
+        "#End\n"
+    ))
+
+    builder = RelationshipBuilder(source_dir, {})
+    relationships = builder.build_relationships_from_tables([weapons_table])
+
+    assert [rel.source_path for rel in relationships['Laser']] == [
+        'hermes_models/laser.pof',
+        'hermes_sounds/laser_fire.wav',
+    ]
+
+
+def test_asteroid_models_are_linked_for_every_entry(source_dir: Path):
+    """Each asteroid.tbl entry gets its $Model file: relationship"""
+    asteroid_table = _write_table(source_dir / 'hermes_core', 'asteroid.tbl', (
+        "#Asteroid Types\n"
+        "$Name: Small Asteroid\n"
+        "$Model file: asteroid01.pof\n"
+        "; $Model file: commented.pof\n"
+        "$Name: Big Asteroid\n"
+        "$Model file: asteroid02.pof\n"
+        "#End\n"
+    ))
+
+    builder = RelationshipBuilder(source_dir, {})
+    relationships = builder.build_relationships_from_tables([asteroid_table])
+
+    assert {name: [rel.source_path for rel in rels] for name, rels in relationships.items()} == {
+        'Small Asteroid': ['hermes_models/asteroid01.pof'],
+        'Big Asteroid': ['hermes_models/asteroid02.pof'],
+    }
+    assert builder.table_contexts[str(asteroid_table)].parsing_errors == []
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Parsing tests for the table_converters package
+
+Feeds small table snippets through the converters' shared parse driver
+and checks the entries that come out.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from table_converters.armor_table_converter import ArmorTableConverter
+from table_converters.base_table_converter import ParseState
+from table_converters.fireball_table_converter import FireballTableConverter
+from table_converters.iff_table_converter import IFFTableConverter
+from table_converters.medals_table_converter import MedalsTableConverter
+
+
+def _parse(converter, content: str) -> list:
+    """Run table content through the converter's entry loop"""
+    state = converter._prepare_parse_state(content, "test.tbl")
+    return converter._parse_all_entries(state)
+
+
+class TestParseStatePushback:
+    """Single-line pushback on ParseState"""
+
+    def test_pushed_back_line_is_read_again(self):
+        """peek_line and next_line return the pushed-back line before the next list line"""
+        state = ParseState(lines=["$Name: a", "$Name: b"])
+
+        line = state.next_line()
+        state.pushback(line)
+
+        assert state.peek_line() == "$Name: a"
+        assert state.next_line() == "$Name: a"
+        assert state.next_line() == "$Name: b"
+        assert state.next_line() is None
+
+    def test_pushback_keeps_exhausted_state_readable(self):
+        """A line pushed back after the last list line still counts as remaining input"""
+        state = ParseState(lines=["#End"])
+
+        state.pushback(state.next_line())
+
+        assert state.has_more_lines()
+        state.skip_line()
+        assert not state.has_more_lines()
+
+    def test_medal_entries_split_on_pushed_back_name(self):
+        """Converters that over-read a $Name: hand it to the next entry"""
+        entries = MedalsTableConverter().parse_table(ParseState(lines=[
+            "#Medals",
+            "$Name: M1",
+            "$Bitmap: b1",
+            "$Name: M2",
+            "$Bitmap: b2",
+            "$Num Levels: 2",
+            "#End",
+        ]))
+
+        assert entries == [
+            {'name': 'M1', 'bitmap': 'b1'},
+            {'name': 'M2', 'bitmap': 'b2', 'num_levels': 2},
+        ]
+
+
+class TestCommentPrefilter:
+    """Comment and blank lines dropped when the parse state is prepared"""
+
+    def test_line_comments_and_blank_lines_are_dropped(self):
+        """// and ; comments and blank lines never reach the parsers; other lines keep their text"""
+        state = MedalsTableConverter()._prepare_parse_state((
+            "#Medals\n"
+            "\n"
+            "; comment\n"
+            "   // indented comment\n"
+            "  $Name: M1\n"
+            "   \n"
+            "$Bitmap: b1\n"
+        ), "medals.tbl")
+
+        assert state.lines == ["#Medals", "  $Name: M1", "$Bitmap: b1"]
+
+    def test_line_comments_next_to_block_comments_are_dropped(self):
+        """Line comments around a /* */ block are dropped along with the block"""
+        state = MedalsTableConverter()._prepare_parse_state((
+            "#Medals\n"
+            "; before the block\n"
+            "/* block start\n"
+            "$Name: Hidden\n"
+            "block end */\n"
+            "// after the block\n"
+            "$Name: M1\n"
+            "/* one-line block */\n"
+            "; trailing comment\n"
+            "$Bitmap: b1\n"
+            "#End\n"
+        ), "medals.tbl")
+
+        assert state.lines == ["#Medals", "$Name: M1", "$Bitmap: b1", "#End"]
+
+    def test_block_commented_entries_are_not_parsed(self):
+        """A $Name: inside a block comment does not start an entry"""
+        converter = MedalsTableConverter()
+        state = converter._prepare_parse_state((
+            "#Medals\n"
+            "$Name: M1\n"
+            "$Bitmap: b1\n"
+            "/*\n"
+            "$Name: Hidden\n"
+            "*/\n"
+            "; $Name: Commented\n"
+            "$Name: M2\n"
+            "$Bitmap: b2\n"
+            "#End\n"
+        ), "medals.tbl")
+
+        assert [entry['name'] for entry in converter.parse_table(state)] == ['M1', 'M2']
+
+
+class TestFireballParsing:
+    """Entry boundaries in fireball.tbl"""
+
+    def test_end_terminates_entry(self):
+        """Properties after $end are not folded into the preceding entry"""
+        entries = _parse(FireballTableConverter(), (
+            "#Start\n"
+            "$Name: exp01\n"
+            "+Radius: 5.5\n"
+            "$end\n"
+            "+Radius: 99\n"
+            "$Name: exp02\n"
+            "+Bitmap: exp05\n"
+            "$End\n"
+            "#End\n"
+        ))
+
+        assert entries == [
+            {'name': 'exp01', 'radius': 5.5},
+            {'name': 'exp02', 'bitmap': 'exp05'},
+        ]
+
+    def test_end_prefix_does_not_terminate_entry(self):
+        """Only a whole $end keyword ends an entry"""
+        entries = _parse(FireballTableConverter(), "$Name: exp01\n$endless: 1\n+Radius: 2\n")
+
+        assert entries == [{'name': 'exp01', 'radius': 2.0}]
+
+    def test_adjacent_names_start_separate_entries(self):
+        """A second $Name: begins a new entry instead of renaming the current one"""
+        entries = _parse(FireballTableConverter(), (
+            "$Name: exp01\n"
+            "$Name: exp02\n"
+            "+Frames: 30\n"
+            "+Shockwave: YES\n"
+        ))
+
+        assert entries == [
+            {'name': 'exp01'},
+            {'name': 'exp02', 'frames': 30, 'shockwave': True},
+        ]
+
+    def test_entry_converts_with_defaults_and_renamed_fields(self):
+        """Missing properties take their defaults; parsed keys land on their Godot field names"""
+        resource = FireballTableConverter()._convert_fireball_entry(
+            {'sound': 'boom', 'light': 2.5, 'name': 'exp01', 'shockwave': True})
+
+        assert resource == {
+            'display_name': 'exp01',
+            'bitmap': '',
+            'bitmap_low': '',
+            'frames': 1,
+            'fps': 30.0,
+            'lifetime': 1.0,
+            'radius': 50.0,
+            'light_intensity': 2.5,
+            'has_shockwave': True,
+            'shockwave_speed': 300.0,
+            'sound': 'boom',
+            'sound_low': '',
+        }
+
+
+class TestArmorParsing:
+    """Entries in armor.tbl"""
+
+    def test_entries_stop_at_next_name_and_end(self):
+        """Each $Name: starts an entry; content after #End is not read into the last one"""
+        entries = _parse(ArmorTableConverter(), (
+            "; armor definitions\n"
+            "#Armor Type\n"
+            "$Name: Light\n"
+            "$Damage Type: Laser\n"
+            "$Reduction: 0.5\n"
+            "$Damage Type: Flak\n"
+            "$Reduction: 0.25\n"
+            "$Name: Heavy\n"
+            "$Damage Type: Laser\n"
+            "$Reduction: 0.9\n"
+            "#End\n"
+            "$Damage Type: Trailing\n"
+            "$Reduction: 0.1\n"
+        ))
+
+        assert entries == [
+            {'name': 'Light', 'damage_types': {'Laser': 0.5, 'Flak': 0.25}},
+            {'name': 'Heavy', 'damage_types': {'Laser': 0.9}},
+        ]
+
+    def test_table_without_entries(self):
+        """Section and comment lines alone produce no entries"""
+        assert _parse(ArmorTableConverter(), "// no armor yet\n#Armor Type\n#End\n") == []
+
+
+class TestIFFParsing:
+    """Entries in iff_defs.tbl"""
+
+    def test_entries_stop_at_next_name_and_end(self):
+        """Each $Name: starts an entry and #End closes the last one"""
+        entries = _parse(IFFTableConverter(), (
+            "/* IFF definitions */\n"
+            "#IFFs\n"
+            "$Name: Friendly\n"
+            "$Color: 0 255 0\n"
+            "$Name: Hostile\n"
+            "$Color: 255 0 0\n"
+            "#End\n"
+        ))
+
+        assert entries == [{'name': 'Friendly'}, {'name': 'Hostile'}]
@@ -13,21 +13,58 @@ Story: DM-013 - Automated Asset Mapping from Table Data
 Epic: EPIC-003 - Data Migration & Conversion Tools
 """
 
+import argparse
 import json
 import logging
+import os
 import re
 import hashlib
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
+
+# orjson is optional; it serializes large mappings much faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 # Core addon imports
 from data_structures import AssetRelationship, AssetMapping
 from core.asset_discovery import AssetDiscoveryEngine
 from core.entity_classifier import EntityClassifier, EntityType, TableType
 from core.path_resolver import TargetPathResolver
+from core.path_utils import find_files_by_extension
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for the stdlib JSON fallback; json.dump issues many small writes
+_JSON_WRITE_BUFFER_SIZE = 1 << 20
+
+# Read buffer reused across file hashes; most assets are far smaller than this
+_HASH_BUFFER_SIZE = 1 << 16
+
+# Entity definitions in ships.tbl / weapons.tbl
+_NAME_DIRECTIVE_RE = re.compile(r'^\$Name:\s*([^\r\n]+)', re.MULTILINE)
+
+def _read_table_entity_names(table_file: Path) -> List[str]:
+    """Return the cleaned $Name: entries of a table file"""
+    try:
+        with open(table_file, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+    except Exception as e:
+        logger.error(f"Failed to parse {table_file}: {e}")
+        return []
+    
+    names = []
+    for name in _NAME_DIRECTIVE_RE.findall(content):
+        clean_name = name.strip()
+        if clean_name and not clean_name.startswith('#') and not clean_name.lower() in ['default', 'none']:
+            names.append(clean_name)
+    return names
+
 class AssetMapper:
     """
     Creates comprehensive asset mappings by combining table data analysis
@@ -56,15 +93,32 @@ class AssetMapper:
         self.unclassified_files: List[str] = []
         self.file_hash_cache: Dict[str, str] = {} # To track duplicates
         self.duplicates_found = 0
+        self._hash_buffer = bytearray(_HASH_BUFFER_SIZE)
+        # Hash per source path; shared textures/sounds are referenced by many entities
+        self._file_hashes: Dict[str, Optional[str]] = {}
 
     def _get_file_hash(self, file_path: Path) -> Optional[str]:
+        """Returns the SHA256 hash of a file's content, reading each file only once per run."""
+        path_key = os.fspath(file_path)
+        if path_key in self._file_hashes:
+            return self._file_hashes[path_key]
+        
+        file_hash = self._hash_file_contents(file_path)
+        self._file_hashes[path_key] = file_hash
+        return file_hash
+
+    def _hash_file_contents(self, file_path: Path) -> Optional[str]:
         """Computes the SHA256 hash of a file's content."""
         try:
             sha256_hash = hashlib.sha256()
-            with open(file_path, "rb") as f:
-                # Read and update hash in chunks of 4K
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
+            buffer = memoryview(self._hash_buffer)
+            with open(file_path, "rb", buffering=0) as f:
+                # Read into the shared buffer instead of allocating a chunk per read
+                while True:
+                    read_size = f.readinto(buffer)
+                    if not read_size:
+                        break
+                    sha256_hash.update(buffer[:read_size])
             return sha256_hash.hexdigest()
         except FileNotFoundError:
             logger.warning(f"Could not find file for hashing: {file_path}")
@@ -84,14 +138,14 @@ class AssetMapper:
         
         # 1. Extract entities from primary table files
         table_files = self._find_table_files()
-        logger.info(f"Found {len(table_files)} table files to process.")
+        logger.info("Found %d table files to process.", len(table_files))
         
         table_entities = self._extract_entities_from_tables(table_files)
         
         # 2. Create initial mappings from table entities
-        logger.info(f"Processing {len(table_entities)} entities from tables...")
+        logger.info("Processing %d entities from tables...", len(table_entities))
         for i, (entity_name, table_type) in enumerate(table_entities.items()):
-            logger.info(f"  ({i+1}/{len(table_entities)}) Processing entity: {entity_name}")
+            logger.info("  (%d/%d) Processing entity: %s", i+1, len(table_entities), entity_name)
             self._create_mapping_for_entity(entity_name, table_type)
             
         # 3. Scan for any unmapped files and create mappings for them
@@ -100,7 +154,8 @@ class AssetMapper:
         # 4. Generate final mapping structure
         project_mapping = self._build_final_json()
         
-        logger.info(f"Generated mapping for {len(self.asset_mappings)} entities with {project_mapping['metadata']['total_assets']} total assets.")
+        logger.info("Generated mapping for %d entities with %d total assets.",
+                    len(self.asset_mappings), project_mapping['metadata']['total_assets'])
         return project_mapping
 
     def _find_table_files(self) -> List[Path]:
@@ -116,20 +171,8 @@ class AssetMapper:
         for table_file in table_files:
             table_type = self.entity_classifier.determine_table_type(table_file)
             if table_type in [TableType.SHIPS, TableType.WEAPONS]:
-                try:
-                    with open(table_file, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    # Use regex to find all $Name: definitions
-                    name_pattern = r'^\$Name:\s*([^\r\n]+)'
-                    found_names = re.findall(name_pattern, content, re.MULTILINE)
-                    
-                    for name in found_names:
-                        clean_name = name.strip()
-                        if clean_name and not clean_name.startswith('#') and not clean_name.lower() in ['default', 'none']:
-                            entities[clean_name] = table_type
-                except Exception as e:
-                    logger.error(f"Failed to parse {table_file}: {e}")
+                for name in _read_table_entity_names(table_file):
+                    entities[name] = table_type
         
         logger.info(f"Extracted {len(entities)} primary entities from tables.")
         return entities
@@ -139,7 +182,7 @@ class AssetMapper:
         if entity_name in self.asset_mappings:
             return
 
-        logger.debug(f"Creating mapping for entity: '{entity_name}' from table: {table_type.value}")
+        logger.debug("Creating mapping for entity: '%s' from table: %s", entity_name, table_type.value)
         
         entity_type = self.entity_classifier.classify_entity(entity_name, table_type)
         
@@ -156,7 +199,7 @@ class AssetMapper:
                 # This is a duplicate file
                 rel.target_path = self.file_hash_cache[file_hash]
                 self.duplicates_found += 1
-                logger.debug(f"Duplicate found for {rel.source_path}, mapping to {rel.target_path}")
+                logger.debug("Duplicate found for %s, mapping to %s", rel.source_path, rel.target_path)
             else:
                 # New file, resolve path and add to cache
                 rel.target_path = self.path_resolver.resolve_semantic_faction_path(
@@ -165,8 +208,14 @@ class AssetMapper:
                 if file_hash:
                     self.file_hash_cache[file_hash] = rel.target_path
 
-        primary_asset = next((r for r in relationships if r.relationship_type == 'primary_model' or r.asset_type == 'model'), None)
-        related_assets = [r for r in relationships if r != primary_asset]
+        primary_index = next((i for i, r in enumerate(relationships)
+                              if r.relationship_type == 'primary_model' or r.asset_type == 'model'), -1)
+        if primary_index >= 0:
+            primary_asset = relationships[primary_index]
+            related_assets = relationships[:primary_index] + relationships[primary_index + 1:]
+        else:
+            primary_asset = None
+            related_assets = relationships
 
         self.asset_mappings[entity_name] = AssetMapping(
             entity_name=entity_name,
@@ -185,47 +234,56 @@ class AssetMapper:
         """Scan all source files and create mappings for any not already covered."""
         logger.info("Scanning all source directories for unmapped files...")
         
-        mapped_sources = set()
-        for mapping in self.asset_mappings.values():
-            if mapping.primary_asset:
-                mapped_sources.add(mapping.primary_asset.source_path)
-            for rel in mapping.related_assets:
-                mapped_sources.add(rel.source_path)
+        mappings = self.asset_mappings.values()
+        mapped_sources = {rel.source_path for mapping in mappings for rel in mapping.related_assets}
+        mapped_sources.update(mapping.primary_asset.source_path for mapping in mappings if mapping.primary_asset)
 
-        all_source_files = []
-        for ext_list in self.asset_discovery.asset_extensions.values():
-            for ext in ext_list:
-                all_source_files.extend(self.source_dir.rglob(f"**/*{ext}"))
+        # Walk the source tree once, then visit files grouped by extension
+        # in asset_extensions order (models claim entity names first)
+        extensions = [ext for ext_list in self.asset_discovery.asset_extensions.values() for ext in ext_list]
+        # (path string, file name) pairs; the loop below works on strings and
+        # only builds Paths for files it actually maps
+        files_by_extension: Dict[str, List[Tuple[str, str]]] = {ext: [] for ext in extensions}
+        for file_path in find_files_by_extension(self.source_dir, extensions):
+            path_str = str(file_path)
+            file_name = os.path.basename(path_str)
+            files_by_extension[os.path.splitext(file_name)[1].lower()].append((path_str, file_name))
+        all_source_files = [entry for ext_files in files_by_extension.values() for entry in ext_files]
         
-        logger.info(f"Found {len(all_source_files)} total files. Checking for unmapped assets...")
+        logger.info("Found %d total files. Checking for unmapped assets...", len(all_source_files))
         unmapped_count = 0
-        for file_path in all_source_files:
-            rel_path = str(file_path.relative_to(self.source_dir))
+        # Plain string relpath instead of Path.relative_to per file; it also
+        # copes with a relative source_dir such as '.', whose scanned paths
+        # carry no './' prefix
+        source_root = str(self.source_dir)
+        for path_str, file_name in all_source_files:
+            rel_path = os.path.relpath(path_str, source_root)
             if rel_path not in mapped_sources:
                 unmapped_count += 1
-                logger.debug(f"  Mapping unmapped file: {rel_path}")
-                self._create_mapping_for_file(file_path)
-        logger.info(f"Mapped {unmapped_count} new files from file scan.")
+                logger.debug("  Mapping unmapped file: %s", rel_path)
+                file_stem, file_ext = os.path.splitext(file_name)
+                parent_dir = os.path.basename(os.path.dirname(path_str))
+                self._create_mapping_for_file(path_str, rel_path, file_ext.lower(), file_stem, parent_dir)
+        logger.info("Mapped %d new files from file scan.", unmapped_count)
 
-    def _create_mapping_for_file(self, file_path: Path):
-        """Create a generic mapping for a single unmapped file."""
-        entity_name = file_path.stem
-        entity_type = self.entity_classifier.classify_by_file_extension(file_path)
+    def _create_mapping_for_file(self, file_path_str: str, rel_path: str,
+                                 file_ext: str, file_stem: str, parent_dir: str):
+        """Create a generic mapping for a single unmapped file (rel_path is relative to source_dir)."""
+        entity_name = file_stem
 
         if entity_name in self.asset_mappings:
             return
 
+        entity_type = self.entity_classifier.classify_by_file_parts(file_ext, file_stem, parent_dir)
         if entity_type == EntityType.UNKNOWN:
-            logger.warning(f"Could not classify file, skipping: {file_path}")
-            self.unclassified_files.append(str(file_path.relative_to(self.source_dir)))
+            logger.warning("Could not classify file, skipping: %s", file_path_str)
+            self.unclassified_files.append(rel_path)
             return
 
-        logger.debug(f"Creating mapping for unmapped file: {file_path.name}")
-
-        rel_path = str(file_path.relative_to(self.source_dir))
+        logger.debug("Creating mapping for unmapped file: %s", os.path.basename(file_path_str))
         
         # Handle duplicates for unmapped files
-        file_hash = self._get_file_hash(file_path)
+        file_hash = self._get_file_hash(Path(file_path_str))
         if file_hash and file_hash in self.file_hash_cache:
             target_path = self.file_hash_cache[file_hash]
             is_duplicate = True
@@ -256,7 +314,13 @@ class AssetMapper:
 
     def _build_final_json(self) -> Dict[str, Any]:
         """Construct the final JSON output from the generated asset mappings."""
-        total_assets = sum(len(m.related_assets) + (1 if m.primary_asset else 0) for m in self.asset_mappings.values())
+        # Gather all statistics in a single pass over the mappings
+        total_assets = 0
+        entity_type_counts = {'ship': 0, 'weapon': 0, 'effect': 0}
+        for mapping in self.asset_mappings.values():
+            total_assets += len(mapping.related_assets) + (1 if mapping.primary_asset else 0)
+            if mapping.entity_type in entity_type_counts:
+                entity_type_counts[mapping.entity_type] += 1
         
         project_mapping = {
             'metadata': {
@@ -273,31 +337,41 @@ class AssetMapper:
             'missing_assets': list(self.missing_assets),
             'unclassified_files': self.unclassified_files,
             'statistics': {
-                'ships': len([m for m in self.asset_mappings.values() if m.entity_type == 'ship']),
-                'weapons': len([m for m in self.asset_mappings.values() if m.entity_type == 'weapon']),
-                'effects': len([m for m in self.asset_mappings.values() if m.entity_type == 'effect']),
+                'ships': entity_type_counts['ship'],
+                'weapons': entity_type_counts['weapon'],
+                'effects': entity_type_counts['effect'],
                 'total_relationships': total_assets,
                 'duplicates_found': self.duplicates_found
             }
         }
         
+        entity_mappings = project_mapping['entity_mappings']
+        asset_index = project_mapping['asset_index']
         for entity_name, mapping in self.asset_mappings.items():
-            project_mapping['entity_mappings'][entity_name] = {
-                'entity_type': mapping.entity_type,
-                'primary_asset': self._serialize_relationship(mapping.primary_asset),
-                'related_assets': [self._serialize_relationship(rel) for rel in mapping.related_assets],
-                'metadata': mapping.metadata
-            }
+            # Serialize and index each relationship in the same pass
+            primary_asset = mapping.primary_asset
+            if primary_asset:
+                asset_index.setdefault(primary_asset.source_path, []).append({
+                    'entity': entity_name,
+                    'target_path': primary_asset.target_path,
+                    'relationship_type': primary_asset.relationship_type
+                })
             
-            all_assets = ([mapping.primary_asset] if mapping.primary_asset else []) + mapping.related_assets
-            for rel in all_assets:
-                if rel.source_path not in project_mapping['asset_index']:
-                    project_mapping['asset_index'][rel.source_path] = []
-                project_mapping['asset_index'][rel.source_path].append({
+            related_assets = []
+            for rel in mapping.related_assets:
+                related_assets.append(self._serialize_relationship(rel))
+                asset_index.setdefault(rel.source_path, []).append({
                     'entity': entity_name,
                     'target_path': rel.target_path,
                     'relationship_type': rel.relationship_type
                 })
+            
+            entity_mappings[entity_name] = {
+                'entity_type': mapping.entity_type,
+                'primary_asset': self._serialize_relationship(primary_asset),
+                'related_assets': related_assets,
+                'metadata': mapping.metadata
+            }
         
         return project_mapping
 
@@ -318,8 +392,11 @@ class AssetMapper:
         """Save project mapping to JSON file."""
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(project_mapping, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                output_path.write_bytes(orjson.dumps(project_mapping, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, 'w', encoding='utf-8', buffering=_JSON_WRITE_BUFFER_SIZE) as f:
+                    json.dump(project_mapping, f, indent=2, ensure_ascii=False)
             logger.info(f"Project mapping saved to: {output_path}")
             return True
         except Exception as e:
@@ -328,9 +405,6 @@ class AssetMapper:
 
 def main():
     """Command-line interface for the asset mapper."""
-    import argparse
-    from datetime import datetime
-    
     parser = argparse.ArgumentParser(description='Generate asset relationship mapping from WCS source files.')
     parser.add_argument('--source', type=Path, required=True, help='WCS source directory')
     parser.add_argument('--output', type=Path, required=True, help='Output JSON file for the asset mapping')
@@ -372,5 +446,4 @@ if __name__ == '__main__':
     # This allows the script to be run from the command line
     # For it to work, you need to be in the 'wcs_data_migration' directory
     # and run it as a module: python -m tools.asset_mapper --source ...
-    from datetime import datetime
     exit(main())
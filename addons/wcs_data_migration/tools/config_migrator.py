@@ -18,10 +18,12 @@ import re
 import shutil
 import winreg
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from core.path_utils import list_directory_files
+
 
 class ConfigType(Enum):
     """Configuration category types for organization."""
@@ -532,6 +534,23 @@ class ConfigMigrator:
         except FileNotFoundError:
             return default
     
+    def _find_existing_files(self, base_dir: Path, relative_paths: List[str]) -> List[str]:
+        """Filter candidate files down to those present, listing each parent directory once."""
+        listings: Dict[str, Set[str]] = {}
+        existing = []
+        
+        for relative_path in relative_paths:
+            parent, name = os.path.split(relative_path)
+            if parent not in listings:
+                listings[parent] = {
+                    os.path.normcase(file_name)
+                    for file_name in list_directory_files(base_dir / parent)
+                }
+            if os.path.normcase(name) in listings[parent]:
+                existing.append(relative_path)
+        
+        return existing
+    
     def _parse_wcs_config_files(self, wcs_source_dir: Path) -> bool:
         """Parse WCS INI-style configuration files."""
         try:
@@ -545,12 +564,10 @@ class ConfigMigrator:
             
             found_config = False
             
-            for config_file in config_files:
-                config_path = wcs_source_dir / config_file
-                if config_path.exists():
-                    print(f"ConfigMigrator: Parsing WCS config file: {config_file}")
-                    self._parse_ini_file(config_path)
-                    found_config = True
+            for config_file in self._find_existing_files(wcs_source_dir, config_files):
+                print(f"ConfigMigrator: Parsing WCS config file: {config_file}")
+                self._parse_ini_file(wcs_source_dir / config_file)
+                found_config = True
             
             if not found_config:
                 print("ConfigMigrator: No WCS config files found, using defaults")
@@ -749,12 +766,10 @@ class ConfigMigrator:
                 "controlconfig.cfg"
             ]
             
-            for config_file in config_files:
-                config_path = wcs_source_dir / config_file
-                if config_path.exists():
-                    print(f"ConfigMigrator: Parsing control config: {config_file}")
-                    self._parse_control_config_file(config_path)
-                    break
+            for config_file in self._find_existing_files(wcs_source_dir, config_files):
+                print(f"ConfigMigrator: Parsing control config: {config_file}")
+                self._parse_control_config_file(wcs_source_dir / config_file)
+                break
             
             print(f"ConfigMigrator: Parsed {len(self.control_bindings)} control bindings")
             return True
@@ -1130,8 +1145,8 @@ class ConfigMigrator:
                 "control_bindings": {
                     "total_bindings": len(self.control_bindings),
                     "categories": list(set(binding.category for binding in self.control_bindings)),
-                    "keyboard_bindings": len([b for b in self.control_bindings if b.key_binding >= 0]),
-                    "joystick_bindings": len([b for b in self.control_bindings if b.joy_binding >= 0])
+                    "keyboard_bindings": sum(1 for b in self.control_bindings if b.key_binding >= 0),
+                    "joystick_bindings": sum(1 for b in self.control_bindings if b.joy_binding >= 0)
                 },
                 "pilot_profiles": {
                     "total_profiles": len(self.pilot_profiles),
@@ -1192,8 +1207,8 @@ class ConfigMigrator:
         """Validate control bindings migration."""
         validation = {
             "bindings_count": len(self.control_bindings),
-            "valid_key_bindings": len([b for b in self.control_bindings if b.key_binding >= 0]),
-            "valid_joy_bindings": len([b for b in self.control_bindings if b.joy_binding >= 0]),
+            "valid_key_bindings": sum(1 for b in self.control_bindings if b.key_binding >= 0),
+            "valid_joy_bindings": sum(1 for b in self.control_bindings if b.joy_binding >= 0),
             "duplicate_bindings": self._check_duplicate_bindings(),
             "core_controls_present": self._check_core_controls()
         }
@@ -1207,8 +1222,8 @@ class ConfigMigrator:
         """Validate pilot data migration."""
         validation = {
             "pilot_count": len(self.pilot_profiles),
-            "valid_callsigns": len([p for p in self.pilot_profiles if p.callsign and len(p.callsign) > 0]),
-            "valid_progress": len([p for p in self.pilot_profiles if p.campaign_progress >= 0])
+            "valid_callsigns": sum(1 for p in self.pilot_profiles if p.callsign and len(p.callsign) > 0),
+            "valid_progress": sum(1 for p in self.pilot_profiles if p.campaign_progress >= 0)
         }
         
         validation["overall_valid"] = (validation["pilot_count"] > 0 and 